@@ -9,24 +9,68 @@ Usage:
 """
 from __future__ import annotations
 
+import functools
+import gzip
+import hashlib
 import json
 import os
+import re
 import sqlite3
 import sys
+import tempfile
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from email.utils import formatdate
+from html import escape as html_escape
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+
+    def _dumps(obj):
+        # type: (object) -> bytes
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        # type: (object) -> bytes
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _loads = json.loads  # also accepts UTF-8 bytes
+
+try:
+    import pyromark  # native CommonMark (pulldown-cmark)
+
+    def _markdown_html(text):
+        # type: (str) -> Optional[str]
+        return pyromark.html(text, options=pyromark.Options.ENABLE_TABLES)
+except ImportError:
+    def _markdown_html(text):
+        # type: (str) -> Optional[str]
+        return None
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DB_PATH = PROJECT_ROOT / "images" / "mad_photos.db"
 VECTOR_PATH = PROJECT_ROOT / "images" / "vectors.lance"
 OUT_PATH = PROJECT_ROOT / "frontend" / "system" / "system.html"
 MOSAIC_DIR = PROJECT_ROOT / "images" / "rendered" / "mosaics"
+# Beside the DB (untracked data), not in the source tree
+STATS_CACHE_PATH = DB_PATH.with_name(".stats_cache.json.gz")
+# Writing the dashboard_stats row itself bumps the DB mtime just after updated_at
+MATERIALIZED_STATS_SLACK = 2.0  # seconds
 
 
+@functools.lru_cache(maxsize=4096)
 def human_bytes(n):
     # type: (int) -> str
+    # Memoized: tier sizes and table/disk totals repeat across polls
     for unit in ("B", "KB", "MB", "GB", "TB"):
         if abs(n) < 1024:
             return f"{n:.1f} {unit}"
@@ -39,57 +83,270 @@ def pct(part, whole):
     return round(part / whole * 100, 2) if whole else 0.0
 
 
+def _photo_count(path):
+    # type: (Path) -> int
+    """Number of photos in a gallery export without parsing the whole file.
+
+    export_gallery.py writes {"count": N, ..., "photos": [...]}, so the count
+    is normally read from the first bytes; otherwise the photos are counted
+    with a streaming parser (ijson) or, failing that, a full json.load.
+    """
+    with open(path, "rb") as f:
+        m = re.match(rb'\s*\{\s*"count"\s*:\s*(\d+)', f.read(64))
+        if m:
+            return int(m.group(1))
+        f.seek(0)
+        first = f.read(1024).lstrip()[:1]
+        f.seek(0)
+        try:
+            import ijson
+            return sum(1 for _ in ijson.items(f, "item" if first == b"[" else "photos.item"))
+        except ImportError:
+            data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get("photos", [])
+    return len(data)
+
+
+def _dir_size(path):
+    # type: (Path) -> int
+    """Total file bytes under path; scandir entries avoid a Path + stat per file."""
+    total = 0
+    stack = [str(path)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+
+# Independent scalar aggregates for get_stats(), fetched as subqueries of one
+# SELECT so the whole set costs a single round-trip. Each entry is
+# (name, table, subquery); optional signal tables that don't exist yet
+# contribute a literal 0 instead of failing the statement.
+_SCALARS_SQL = (
+    ("total", "images", "SELECT COUNT(*) FROM images"),
+    ("pixel_analyzed", "image_analysis", "SELECT COUNT(*) FROM image_analysis"),
+    ("ai_variants_total", "ai_variants", "SELECT COUNT(*) FROM ai_variants"),
+    ("gcs_uploads", "gcs_uploads", "SELECT COUNT(*) FROM gcs_uploads"),
+    ("monochrome_count", "images", "SELECT COUNT(*) FROM images WHERE is_monochrome=1"),
+    ("exif_gps", "exif_metadata", "SELECT COUNT(*) FROM exif_metadata WHERE gps_lat IS NOT NULL"),
+    ("exif_iso", "exif_metadata", "SELECT COUNT(*) FROM exif_metadata WHERE iso IS NOT NULL"),
+    ("aesthetic_count", "aesthetic_scores", "SELECT COUNT(*) FROM aesthetic_scores"),
+    ("aesthetic_avg", "aesthetic_scores", "SELECT ROUND(AVG(score),2) FROM aesthetic_scores"),
+    ("aesthetic_min", "aesthetic_scores", "SELECT MIN(score) FROM aesthetic_scores"),
+    ("aesthetic_max", "aesthetic_scores", "SELECT MAX(score) FROM aesthetic_scores"),
+    ("depth_count", "depth_estimation", "SELECT COUNT(*) FROM depth_estimation"),
+    ("depth_avg_near", "depth_estimation", "SELECT ROUND(AVG(near_pct),1) FROM depth_estimation"),
+    ("depth_avg_mid", "depth_estimation", "SELECT ROUND(AVG(mid_pct),1) FROM depth_estimation"),
+    ("depth_avg_far", "depth_estimation", "SELECT ROUND(AVG(far_pct),1) FROM depth_estimation"),
+    ("scene_count", "scene_classification", "SELECT COUNT(*) FROM scene_classification"),
+    ("enhancement_count", "enhancement_plans", "SELECT COUNT(*) FROM enhancement_plans"),
+    ("location_count", "image_locations", "SELECT COUNT(*) FROM image_locations"),
+    ("location_accepted", "image_locations", "SELECT COUNT(*) FROM image_locations WHERE accepted=1"),
+    ("style_count", "style_classification", "SELECT COUNT(*) FROM style_classification"),
+    ("ocr_images", "ocr_detections", "SELECT COUNT(DISTINCT image_uuid) FROM ocr_detections"),
+    ("ocr_texts", "ocr_detections", "SELECT COUNT(*) FROM ocr_detections WHERE text != ''"),
+    ("caption_count", "image_captions", "SELECT COUNT(*) FROM image_captions"),
+    ("emotion_count", "facial_emotions", "SELECT COUNT(DISTINCT image_uuid) FROM facial_emotions"),
+)
+
+
+def _analyzed(tables):
+    # type: (dict) -> str
+    """SQL predicate for gemini_analysis rows with a successful analysis.
+
+    Uses the indexed analyzed flag (database._MIGRATIONS) so the raw_json
+    blob isn't read; DBs that predate the column test raw_json directly.
+    """
+    if "analyzed" in tables.get("gemini_analysis", ()):
+        return "analyzed = 1"
+    return "raw_json != ''"
+
+
+# gemini_analysis counts, fused into a single pass over the table with
+# conditional aggregates and joined onto the scalars SELECT as a derived table.
+_GEMINI_COUNTS_SQL = (
+    ("analyzed", "{analyzed}"),
+    ("failed", "error IS NOT NULL AND NOT COALESCE({analyzed}, 0)"),
+    ("has_edit_prompt", "overall_edit_prompt IS NOT NULL AND overall_edit_prompt != ''"),
+    ("has_semantic_pops", "semantic_pops IS NOT NULL AND semantic_pops != '[]'"),
+)
+
+
+def _fetch_scalars(conn, tables):
+    # type: (sqlite3.Connection, dict) -> dict
+    analyzed = _analyzed(tables)
+    cols = ",\n       ".join(
+        f"({sql.format(analyzed=analyzed)})" if table in tables else "0"
+        for _, table, sql in _SCALARS_SQL
+    )
+    if "gemini_analysis" in tables:
+        gemini = "SELECT " + ", ".join(
+            f"COUNT(*) FILTER (WHERE {cond.format(analyzed=analyzed)})"
+            for _, cond in _GEMINI_COUNTS_SQL
+        ) + " FROM gemini_analysis"
+    else:
+        gemini = "SELECT " + ", ".join("0" for _ in _GEMINI_COUNTS_SQL)
+    row = conn.execute(f"SELECT {cols},\n       g.* FROM ({gemini}) AS g").fetchone()
+    names = [name for name, _, _ in _SCALARS_SQL] + [name for name, _ in _GEMINI_COUNTS_SQL]
+    return dict(zip(names, row))
+
+
+# Gemini breakdowns for get_stats(), one tagged branch per dimension. SQLite
+# does not keep a subquery's ORDER BY through a compound select, so the
+# whole result is sorted once: by dimension, then count descending.
+_GEMINI_DIMS_SQL = " UNION ALL ".join(
+    f"SELECT '{dim}', {col}, COUNT(*) as cnt FROM gemini_analysis "
+    f"WHERE {'' if keep_null else col + ' IS NOT NULL AND '}{{analyzed}} "
+    f"GROUP BY {col}"
+    for dim, col, keep_null in [
+        ("grading", "grading_style", True),
+        ("time_of_day", "time_of_day", False),
+        ("setting", "setting", False),
+        ("exposure", "exposure", False),
+        ("composition", "composition_technique", False),
+        ("rotate", "should_rotate", True),
+    ]
+) + " ORDER BY 1, 3 DESC"
+
+
+def _table_counts(conn, names, tables):
+    # type: (sqlite3.Connection, list, dict) -> dict
+    """{table: {"rows", "images"}} for each name, via one UNION ALL over the existing tables."""
+    counts = {name: {"rows": 0, "images": 0} for name in names}
+    present = [name for name in names if name in tables]
+    if present:
+        try:
+            for name, cnt, uuids in conn.execute(" UNION ALL ".join(
+                f"SELECT '{name}', COUNT(*), COUNT(DISTINCT image_uuid) FROM {name}"
+                for name in present
+            )).fetchall():
+                counts[name] = {"rows": cnt, "images": uuids}
+        except Exception:
+            pass
+    return counts
+
+
+def _stats_cache_key():
+    # type: () -> list
+    """mtime of every input get_stats() reads (0 when missing)."""
+    base_dir = Path(__file__).resolve().parent
+    data_dir = PROJECT_ROOT / "frontend" / "show" / "data"
+    key = []
+    for p in (DB_PATH, DB_PATH.with_name(DB_PATH.name + "-wal"), VECTOR_PATH,
+              data_dir / "photos.json", data_dir / "picks.json",
+              base_dir / ".faces_processed.json", base_dir / ".objects_processed.json"):
+        try:
+            st = p.stat()
+            # Readers create an empty -wal on open; only written WALs count
+            key.append(st.st_mtime_ns if st.st_size else 0)
+        except OSError:
+            key.append(0)
+    return key
+
+
 def get_stats():
     # type: () -> dict
-    conn = sqlite3.connect(str(DB_PATH))
-    conn.row_factory = sqlite3.Row
+    """Dashboard stats, reused from STATS_CACHE_PATH until the DB or any other input changes."""
+    key = _stats_cache_key()
+    try:
+        with gzip.open(STATS_CACHE_PATH, "rb") as f:
+            cache = json.loads(f.read())
+        if cache["key"] == key:
+            return cache["data"]
+    except (OSError, EOFError, ValueError, KeyError, TypeError):
+        pass
+    stats = _materialized_stats(key)
+    if stats is None:
+        stats = _compute_stats()
+    # Unique temp name: the server and generate_static may write concurrently
+    tmp = None  # type: Optional[Path]
+    try:
+        with tempfile.NamedTemporaryFile(dir=STATS_CACHE_PATH.parent, prefix=".stats_cache.",
+                                         suffix=".tmp", delete=False) as f:
+            tmp = Path(f.name)
+            with gzip.GzipFile(fileobj=f, mode="wb", compresslevel=3) as gz:
+                gz.write(_dumps({"key": key, "data": stats}))
+        tmp.replace(STATS_CACHE_PATH)
+    except OSError:
+        if tmp is not None:
+            tmp.unlink(missing_ok=True)
+    return stats
+
+
+def persist_stats(conn, db_path):
+    # type: (sqlite3.Connection, Path) -> None
+    """Recompute the stats of the DB at db_path and store them in its dashboard_stats row.
+
+    Called by pipeline.py after each phase. The query threads and their
+    connections only live for this call, so none linger in the pipeline.
+    """
+    with ThreadPoolExecutor(max_workers=_STATS_PARTS, thread_name_prefix="stats") as pool:
+        stats = _compute_stats(db_path, pool)
+    own = getattr(_stats_local, "conn", None)
+    if own is not None:
+        own.close()
+        _stats_local.conn = None
+    conn.execute(
+        "INSERT OR REPLACE INTO dashboard_stats (key, json, updated_at) VALUES ('latest', ?, ?)",
+        (_dumps(stats).decode(), datetime.now(timezone.utc).isoformat()),
+    )
+    conn.commit()
+
+
+def _materialized_stats(key):
+    # type: (list) -> Optional[dict]
+    """The persisted dashboard_stats row, unless an input changed after it was written."""
+    try:
+        row = _stats_connect().execute(
+            "SELECT json, updated_at FROM dashboard_stats WHERE key='latest'"
+        ).fetchone()
+        if not row:
+            return None
+        written = datetime.fromisoformat(row[1]).timestamp()
+        if max(key) / 1e9 > written + MATERIALIZED_STATS_SLACK:
+            return None
+        return json.loads(row[0])
+    except (sqlite3.Error, ValueError):
+        return None
 
-    # ── Core counts ──────────────────────────────────────────
-    total = conn.execute("SELECT COUNT(*) FROM images").fetchone()[0]
-    analyzed = conn.execute(
-        "SELECT COUNT(*) FROM gemini_analysis WHERE raw_json IS NOT NULL AND raw_json != ''"
-    ).fetchone()[0]
-    failed = conn.execute(
-        "SELECT COUNT(*) FROM gemini_analysis WHERE error IS NOT NULL AND (raw_json IS NULL OR raw_json = '')"
-    ).fetchone()[0]
-    pending = total - analyzed - failed
-    pixel_analyzed = conn.execute("SELECT COUNT(*) FROM image_analysis").fetchone()[0]
 
+def _stats_library(conn, tables):
+    # type: (sqlite3.Connection, dict) -> dict
+    """Categories, tiers, variants, cameras, formats and curation."""
     # ── Categories ───────────────────────────────────────────
     categories = [
-        {"name": r["category"], "count": r["cnt"]}
-        for r in conn.execute(
+        {"name": category, "count": cnt}
+        for category, cnt in conn.execute(
             "SELECT category, COUNT(*) as cnt FROM images GROUP BY category ORDER BY cnt DESC"
-        ).fetchall()
+        )
     ]
 
     # Subcategories mapped to camera-body friendly names
-    _sub_name_map = {
-        ("Digital", None): "Leica Digital",
-        ("Digital", "Landscape"): "Leica Digital",
-        ("Digital", "Portrait"): "Leica Digital",
-        ("Analog", None): "Leica Analog",
-        ("Analog", "Landscape"): "Leica Analog",
-        ("Analog", "Portrait"): "Leica Analog",
-        ("Monochrome", None): "Leica Monochrom",
-        ("Monochrome", "Landscape"): "Leica Monochrom",
-        ("Monochrome", "Portrait"): "Leica Monochrom",
-        ("G12", None): "Canon G12",
-        ("Osmo", "OsmoPro"): "DJI Osmo Pro",
-        ("Osmo", "OsmoMemo"): "DJI Osmo Memo",
-        ("Osmo", None): "DJI Osmo",
-    }
-    _sub_counts = {}  # type: Dict[str, int]
-    for r in conn.execute(
-        "SELECT category, subcategory, COUNT(*) as cnt FROM images "
-        "GROUP BY category, subcategory ORDER BY category, cnt DESC"
-    ).fetchall():
-        key = (r["category"], r["subcategory"])
-        friendly = _sub_name_map.get(key, f'{r["category"]}/{r["subcategory"]}' if r["subcategory"] else r["category"])
-        _sub_counts[friendly] = _sub_counts.get(friendly, 0) + r["cnt"]
     subcategories = [
-        {"name": name, "count": count}
-        for name, count in sorted(_sub_counts.items(), key=lambda x: -x[1])
+        {"name": r[0], "count": r[1]}
+        for r in conn.execute("""
+            SELECT CASE
+                WHEN category IN ('Digital', 'Analog', 'Monochrome')
+                     AND (subcategory IS NULL OR subcategory IN ('Landscape', 'Portrait'))
+                    THEN CASE category
+                        WHEN 'Digital' THEN 'Leica Digital'
+                        WHEN 'Analog' THEN 'Leica Analog'
+                        ELSE 'Leica Monochrom'
+                    END
+                WHEN category = 'G12' AND subcategory IS NULL THEN 'Canon G12'
+                WHEN category = 'Osmo' AND subcategory = 'OsmoPro' THEN 'DJI Osmo Pro'
+                WHEN category = 'Osmo' AND subcategory = 'OsmoMemo' THEN 'DJI Osmo Memo'
+                WHEN category = 'Osmo' AND subcategory IS NULL THEN 'DJI Osmo'
+                WHEN subcategory != '' THEN category || '/' || subcategory
+                ELSE category
+            END as friendly, COUNT(*) as cnt
+            FROM images GROUP BY friendly ORDER BY cnt DESC, MIN(category)
+        """).fetchall()
     ]
 
     # ── Tiers ────────────────────────────────────────────────
@@ -97,34 +354,32 @@ def get_stats():
     _tier_order = {'full': 0, 'original': 1, 'display': 2, 'mobile': 3,
                    'thumb': 4, 'micro': 5, 'gemini': 6}
     tiers = [
-        {"name": r["tier_name"] + "/" + (r["format"] or "?"),
-         "tier": r["tier_name"], "format": r["format"],
-         "count": r["cnt"],
-         "size": r["size"] or 0,
-         "size_human": human_bytes(r["size"]) if r["size"] else "0 B"}
-        for r in conn.execute(
+        {"name": tier_name + "/" + (fmt or "?"),
+         "tier": tier_name, "format": fmt,
+         "count": cnt,
+         "size": size or 0,
+         "size_human": human_bytes(size) if size else "0 B"}
+        for tier_name, fmt, cnt, size in conn.execute(
             "SELECT tier_name, format, COUNT(*) as cnt, SUM(file_size_bytes) as size "
             "FROM tiers GROUP BY tier_name, format ORDER BY tier_name, format"
-        ).fetchall()
+        )
     ]
     tiers.sort(key=lambda x: (_tier_order.get(x["tier"], 99), x["format"]))
-    total_rendered_bytes = conn.execute(
-        "SELECT COALESCE(SUM(file_size_bytes), 0) FROM tiers"
-    ).fetchone()[0]
-    total_tier_files = conn.execute("SELECT COUNT(*) FROM tiers").fetchone()[0]
+    total_tier_files = sum(t["count"] for t in tiers)
+    total_rendered_bytes = sum(t["size"] for t in tiers)
 
     # ── Tier coverage ────────────────────────────────────────
-    tier_coverage = []
-    for tier in ['full', 'display', 'mobile', 'thumb', 'micro', 'gemini', 'original']:
-        cnt = conn.execute(
-            f"SELECT COUNT(DISTINCT image_uuid) FROM tiers WHERE tier_name=?", (tier,)
-        ).fetchone()[0]
-        tier_coverage.append({"tier": tier, "images": cnt})
+    _coverage_tiers = ['full', 'display', 'mobile', 'thumb', 'micro', 'gemini', 'original']
+    _coverage = dict(conn.execute(
+        "SELECT tier_name, COUNT(DISTINCT image_uuid) FROM tiers "
+        f"WHERE tier_name IN ({','.join('?' * len(_coverage_tiers))}) GROUP BY tier_name",
+        _coverage_tiers,
+    ).fetchall())
+    tier_coverage = [{"tier": t, "images": _coverage.get(t, 0)} for t in _coverage_tiers]
 
     # ── AI Variants ──────────────────────────────────────────
-    ai_variants_total = conn.execute("SELECT COUNT(*) FROM ai_variants").fetchone()[0]
     variant_summary = []
-    for r in conn.execute(
+    for variant_type, ok, fail, filtered, pending, total in conn.execute(
         "SELECT variant_type, "
         "SUM(CASE WHEN generation_status='success' THEN 1 ELSE 0 END) as ok, "
         "SUM(CASE WHEN generation_status='failed' THEN 1 ELSE 0 END) as fail, "
@@ -132,18 +387,15 @@ def get_stats():
         "SUM(CASE WHEN generation_status='pending' THEN 1 ELSE 0 END) as pending, "
         "COUNT(*) as total "
         "FROM ai_variants GROUP BY variant_type ORDER BY variant_type"
-    ).fetchall():
+    ):
         variant_summary.append({
-            "type": r["variant_type"], "ok": r["ok"], "fail": r["fail"],
-            "filtered": r["filtered"], "pending": r["pending"], "total": r["total"],
-            "pct": pct(r["ok"], total),
+            "type": variant_type, "ok": ok, "fail": fail,
+            "filtered": filtered, "pending": pending, "total": total,
         })
 
-    gcs_uploads = conn.execute("SELECT COUNT(*) FROM gcs_uploads").fetchone()[0]
-
     # ── Camera fleet ─────────────────────────────────────────
     cameras = []
-    for r in conn.execute("""
+    for body, cnt, medium, film, wb_r, wb_b, noise, shadow, luminance in conn.execute("""
         SELECT i.camera_body, COUNT(*) as cnt, i.medium, i.film_stock,
                ROUND(AVG(a.wb_shift_r), 3) as wb_r,
                ROUND(AVG(a.wb_shift_b), 3) as wb_b,
@@ -152,35 +404,71 @@ def get_stats():
                ROUND(AVG(a.mean_brightness), 1) as luminance
         FROM images i LEFT JOIN image_analysis a ON i.uuid = a.image_uuid
         GROUP BY i.camera_body ORDER BY cnt DESC
-    """).fetchall():
+    """):
         cameras.append({
-            "body": r["camera_body"],
-            "count": r["cnt"],
-            "medium": r["medium"] or "—",
-            "film": r["film_stock"] or "—",
-            "wb_r": r["wb_r"] or 0,
-            "wb_b": r["wb_b"] or 0,
-            "noise": r["noise"] or 0,
-            "shadow": r["shadow_clip"] or 0,
-            "luminance": r["luminance"] or 0,
+            "body": body,
+            "count": cnt,
+            "medium": medium or "—",
+            "film": film or "—",
+            "wb_r": wb_r or 0,
+            "wb_b": wb_b or 0,
+            "noise": noise or 0,
+            "shadow": shadow or 0,
+            "luminance": luminance or 0,
         })
 
     # ── Source format ────────────────────────────────────────
-    source_formats = [
-        {"name": r[0], "count": r[1]}
-        for r in conn.execute("""
-            SELECT CASE
-                WHEN original_path LIKE '%.jpg' OR original_path LIKE '%.JPG' THEN 'JPEG'
-                WHEN original_path LIKE '%.dng' OR original_path LIKE '%.DNG' THEN 'DNG'
-                WHEN original_path LIKE '%.raw' OR original_path LIKE '%.RAW' THEN 'RAW'
-                ELSE 'other'
-            END as fmt, COUNT(*)
-            FROM images GROUP BY fmt ORDER BY COUNT(*) DESC
-        """).fetchall()
-    ]
+    # ext is a generated, indexed column (database._MIGRATIONS); DBs that
+    # predate it evaluate the same expression per row instead
+    _formats_sql = """
+        SELECT CASE ext
+            WHEN '.jpg' THEN 'JPEG'
+            WHEN '.dng' THEN 'DNG'
+            WHEN '.raw' THEN 'RAW'
+            ELSE 'other'
+        END as fmt, SUM(n)
+        FROM (SELECT {ext} as ext, COUNT(*) as n FROM images GROUP BY 1)
+        GROUP BY fmt ORDER BY SUM(n) DESC
+    """
+    try:
+        _format_rows = conn.execute(_formats_sql.format(ext="ext")).fetchall()
+    except sqlite3.OperationalError:
+        _format_rows = conn.execute(
+            _formats_sql.format(ext="lower(substr(original_path, -4))")
+        ).fetchall()
+    source_formats = [{"name": r[0], "count": r[1]} for r in _format_rows]
 
-    monochrome_count = conn.execute("SELECT COUNT(*) FROM images WHERE is_monochrome=1").fetchone()[0]
+    # ── Curation ─────────────────────────────────────────────
+    curation = [
+        {"status": r[0] or "pending", "count": r[1]}
+        for r in conn.execute(
+            "SELECT curated_status, COUNT(*) as cnt FROM images GROUP BY curated_status ORDER BY cnt DESC"
+        ).fetchall()
+    ]
+    kept = sum(c["count"] for c in curation if c["status"] == "kept")
+    rejected = sum(c["count"] for c in curation if c["status"] == "rejected")
+    curated_total = kept + rejected
 
+    return dict(
+        categories=categories,
+        subcategories=subcategories,
+        tiers=tiers,
+        total_tier_files=total_tier_files,
+        total_rendered_bytes=total_rendered_bytes,
+        tier_coverage=tier_coverage,
+        variant_summary=variant_summary,
+        cameras=cameras,
+        source_formats=source_formats,
+        curation=curation,
+        kept=kept,
+        rejected=rejected,
+        curated_total=curated_total,
+    )
+
+
+def _stats_gemini(conn, tables):
+    # type: (sqlite3.Connection, dict) -> dict
+    """Pixel analysis, Gemini breakdowns, pipeline runs and recent analyses."""
     # ── Pixel analysis ───────────────────────────────────────
     color_cast = [
         {"name": r[0] or "none", "count": r[1]}
@@ -205,110 +493,94 @@ def get_stats():
     ]
 
     # ── Gemini insights ──────────────────────────────────────
-    grading = [
-        {"name": r["grading_style"], "count": r["cnt"]}
-        for r in conn.execute(
-            "SELECT grading_style, COUNT(*) as cnt FROM gemini_analysis "
-            "WHERE raw_json != '' GROUP BY grading_style ORDER BY cnt DESC"
-        ).fetchall()
-    ]
-
-    time_of_day = [
-        {"name": r[0], "count": r[1]}
-        for r in conn.execute(
-            "SELECT time_of_day, COUNT(*) as cnt FROM gemini_analysis "
-            "WHERE time_of_day IS NOT NULL AND raw_json != '' "
-            "GROUP BY time_of_day ORDER BY cnt DESC"
-        ).fetchall()
-    ]
-
-    settings = [
-        {"name": r[0], "count": r[1]}
-        for r in conn.execute(
-            "SELECT setting, COUNT(*) as cnt FROM gemini_analysis "
-            "WHERE setting IS NOT NULL AND raw_json != '' "
-            "GROUP BY setting ORDER BY cnt DESC"
-        ).fetchall()
-    ]
-
-    exposure = [
-        {"name": r[0], "count": r[1]}
-        for r in conn.execute(
-            "SELECT exposure, COUNT(*) as cnt FROM gemini_analysis "
-            "WHERE exposure IS NOT NULL AND raw_json != '' "
-            "GROUP BY exposure ORDER BY cnt DESC"
-        ).fetchall()
-    ]
-
-    composition = [
-        {"name": r[0], "count": r[1]}
-        for r in conn.execute(
-            "SELECT composition_technique, COUNT(*) as cnt FROM gemini_analysis "
-            "WHERE composition_technique IS NOT NULL AND raw_json != '' "
-            "GROUP BY composition_technique ORDER BY cnt DESC"
-        ).fetchall()
-    ]
-
-    vibes = [
-        {"name": r[0], "count": r[1]}
-        for r in conn.execute("""
+    # All six breakdowns come back from one UNION ALL, tagged by dimension
+    _dims = {"grading": [], "time_of_day": [], "setting": [],
+             "exposure": [], "composition": [], "rotate": []}  # type: Dict[str, list]
+    analyzed = _analyzed(tables)
+    for dim, value, cnt in conn.execute(_GEMINI_DIMS_SQL.format(analyzed=analyzed)).fetchall():
+        _dims[dim].append((value, cnt))
+    grading = [{"name": v, "count": c} for v, c in _dims["grading"]]
+    time_of_day = [{"name": v, "count": c} for v, c in _dims["time_of_day"]]
+    settings = [{"name": v, "count": c} for v, c in _dims["setting"]]
+    exposure = [{"name": v, "count": c} for v, c in _dims["exposure"]]
+    composition = [{"name": v, "count": c} for v, c in _dims["composition"]]
+    rotate_stats = [{"value": v or "unknown", "count": c} for v, c in _dims["rotate"]]
+
+    if "image_vibes" in tables:
+        _vibes_sql = ("SELECT vibe, COUNT(*) as cnt FROM image_vibes "
+                      "GROUP BY vibe ORDER BY cnt DESC LIMIT 20")
+    else:
+        _vibes_sql = """
             SELECT value, COUNT(*) as cnt FROM gemini_analysis, json_each(gemini_analysis.vibe)
             WHERE vibe IS NOT NULL AND raw_json != '' GROUP BY value ORDER BY cnt DESC LIMIT 20
-        """).fetchall()
-    ]
+        """
+    vibes = [{"name": vibe, "count": cnt} for vibe, cnt in conn.execute(_vibes_sql)]
 
-    rotate_stats = [
-        {"value": r["should_rotate"] or "unknown", "count": r["cnt"]}
-        for r in conn.execute(
-            "SELECT should_rotate, COUNT(*) as cnt FROM gemini_analysis "
-            "WHERE raw_json != '' GROUP BY should_rotate ORDER BY cnt DESC"
-        ).fetchall()
+    # ── Pipeline runs ────────────────────────────────────────
+    runs = [
+        {"phase": phase, "status": status,
+         "ok": ok, "failed": failed,
+         "started": started_at[:16].replace("T", " ") if started_at else ""}
+        for phase, status, ok, failed, started_at in conn.execute(
+            "SELECT phase, status, images_processed, images_failed, started_at "
+            "FROM pipeline_runs "
+            "WHERE images_processed > 0 OR images_failed > 0 "
+            "ORDER BY started_at DESC LIMIT 15"
+        )
     ]
 
-    has_edit_prompt = conn.execute(
-        "SELECT COUNT(*) FROM gemini_analysis WHERE overall_edit_prompt IS NOT NULL AND overall_edit_prompt != ''"
-    ).fetchone()[0]
-    has_semantic_pops = conn.execute(
-        "SELECT COUNT(*) FROM gemini_analysis WHERE semantic_pops IS NOT NULL AND semantic_pops != '[]'"
-    ).fetchone()[0]
-
-    # ── Curation ─────────────────────────────────────────────
-    curation = [
-        {"status": r[0] or "pending", "count": r[1]}
-        for r in conn.execute(
-            "SELECT curated_status, COUNT(*) as cnt FROM images GROUP BY curated_status ORDER BY cnt DESC"
-        ).fetchall()
+    # ── Recent analyses ──────────────────────────────────────
+    recent = [
+        {"uuid": uuid[:8], "style": style,
+         "alt": alt, "time": analyzed_at[:19].replace("T", " ") if analyzed_at else ""}
+        for uuid, style, alt, analyzed_at in conn.execute(
+            "SELECT image_uuid, grading_style, alt_text, analyzed_at "
+            f"FROM gemini_analysis WHERE {analyzed} "
+            "ORDER BY analyzed_at DESC LIMIT 8"
+        )
     ]
-    kept = sum(c["count"] for c in curation if c["status"] == "kept")
-    rejected = sum(c["count"] for c in curation if c["status"] == "rejected")
-    curated_total = kept + rejected
 
-    # ── Vector store ─────────────────────────────────────────
-    vector_count = 0
-    vector_size_human = "—"
-    try:
-        import lancedb as _ldb
-        if VECTOR_PATH.exists():
-            _db = _ldb.connect(str(VECTOR_PATH))
-            _tbl = _db.open_table("image_vectors")
-            vector_count = _tbl.count_rows()
-            # Compute directory size
-            vsize = sum(
-                f.stat().st_size for f in VECTOR_PATH.rglob("*") if f.is_file()
-            )
-            vector_size_human = human_bytes(vsize)
-    except Exception:
-        pass
+    # ── Sample analysis ──────────────────────────────────────
+    sample_row = conn.execute(
+        "SELECT image_uuid, raw_json, analyzed_at FROM gemini_analysis "
+        f"WHERE {analyzed} "
+        "ORDER BY analyzed_at DESC LIMIT 1"
+    ).fetchone()
+    sample = None
+    if sample_row:
+        uuid, raw_json, analyzed_at = sample_row
+        try:
+            sample = {
+                "uuid": uuid,
+                "time": analyzed_at[:19].replace("T", " ") if analyzed_at else "",
+                "data": json.loads(raw_json),
+            }
+        except json.JSONDecodeError:
+            pass
 
+    return dict(
+        color_cast=color_cast,
+        color_temp=color_temp,
+        grading=grading,
+        time_of_day=time_of_day,
+        settings=settings,
+        exposure=exposure,
+        composition=composition,
+        rotate_stats=rotate_stats,
+        vibes=vibes,
+        runs=runs,
+        recent=recent,
+        sample=sample,
+    )
+
+
+def _stats_signals(conn, tables):
+    # type: (sqlite3.Connection, dict) -> dict
+    """Signal table counts, detections, colors, aspect ratios and v2 signals."""
     # ── Signal extraction ─────────────────────────────────────
-    signals = {}
-    for tbl in ['exif_metadata', 'dominant_colors', 'face_detections', 'object_detections', 'image_hashes']:
-        try:
-            cnt = conn.execute(f"SELECT COUNT(*) FROM {tbl}").fetchone()[0]
-            uuids = conn.execute(f"SELECT COUNT(DISTINCT image_uuid) FROM {tbl}").fetchone()[0]
-            signals[tbl] = {"rows": cnt, "images": uuids}
-        except Exception:
-            signals[tbl] = {"rows": 0, "images": 0}
+    signals = _table_counts(
+        conn, ['exif_metadata', 'dominant_colors', 'face_detections', 'object_detections', 'image_hashes'],
+        tables)
 
     # For faces/objects, "processed" includes images with zero detections (tracked in JSON files)
     base_dir = Path(__file__).resolve().parent
@@ -322,15 +594,6 @@ def get_stats():
         except Exception:
             pass
 
-    # EXIF details
-    exif_gps = 0
-    exif_iso = 0
-    try:
-        exif_gps = conn.execute("SELECT COUNT(*) FROM exif_metadata WHERE gps_lat IS NOT NULL").fetchone()[0]
-        exif_iso = conn.execute("SELECT COUNT(*) FROM exif_metadata WHERE iso IS NOT NULL").fetchone()[0]
-    except Exception:
-        pass
-
     # Face stats
     face_images_with = 0
     face_total = 0
@@ -368,20 +631,97 @@ def get_stats():
     except Exception:
         pass
 
+    # Aspect ratios
+    aspect_ratios = []  # type: list
+    try:
+        ratio_rows = conn.execute("""
+            SELECT
+                CASE
+                    WHEN CAST(pixel_width AS REAL) / NULLIF(pixel_height, 0) > 1.1 THEN 'Landscape'
+                    WHEN CAST(pixel_width AS REAL) / NULLIF(pixel_height, 0) < 0.9 THEN 'Portrait'
+                    ELSE 'Square'
+                END AS ratio_type,
+                COUNT(*) as cnt
+            FROM exif_metadata
+            WHERE pixel_width > 0 AND pixel_height > 0
+            GROUP BY ratio_type ORDER BY cnt DESC
+        """).fetchall()
+        aspect_ratios = [{"name": r[0], "count": r[1]} for r in ratio_rows]
+    except Exception:
+        pass
+
+    # ── V2 Signals ──────────────────────────────────────────
+    v2_signals = _table_counts(
+        conn, ['aesthetic_scores_v2', 'florence_captions', 'segmentation_masks',
+               'open_detections', 'image_tags', 'foreground_masks',
+               'pose_detections', 'saliency_maps', 'face_identities'],
+        tables)
+
+    # Aesthetic v2 stats
+    aesthetic_v2_count = v2_signals.get('aesthetic_scores_v2', {}).get('images', 0)
+    aesthetic_v2_labels = []
+    try:
+        aesthetic_v2_labels = [
+            {"name": r[0] or "unlabeled", "count": r[1]}
+            for r in conn.execute(
+                "SELECT score_label, COUNT(*) as cnt FROM aesthetic_scores_v2 "
+                "GROUP BY score_label ORDER BY cnt DESC"
+            ).fetchall()
+        ]
+    except Exception:
+        pass
+
+    # Top image tags
+    top_tags = []
+    try:
+        # Parse pipe-separated tags and count
+        tag_rows = conn.execute("SELECT tags FROM image_tags WHERE tags IS NOT NULL").fetchall()
+        tag_counts = {}
+        for row in tag_rows:
+            for tag in row[0].split(" | "):
+                tag = tag.strip()
+                if tag:
+                    tag_counts[tag] = tag_counts.get(tag, 0) + 1
+        top_tags = [{"name": k, "count": v} for k, v in
+                    sorted(tag_counts.items(), key=lambda x: -x[1])[:30]]
+    except Exception:
+        pass
+
+    # Top open detection labels
+    top_open_labels = []
+    try:
+        top_open_labels = [
+            {"name": r[0], "count": r[1]}
+            for r in conn.execute(
+                "SELECT label, COUNT(*) as cnt FROM open_detections "
+                "GROUP BY label ORDER BY cnt DESC LIMIT 20"
+            ).fetchall()
+        ]
+    except Exception:
+        pass
+
+    return dict(
+        signals=signals,
+        face_images_with=face_images_with,
+        face_total=face_total,
+        top_objects=top_objects,
+        top_color_names=top_color_names,
+        aspect_ratios=aspect_ratios,
+        v2_signals=v2_signals,
+        aesthetic_v2_count=aesthetic_v2_count,
+        aesthetic_v2_labels=aesthetic_v2_labels,
+        top_tags=top_tags,
+        top_open_labels=top_open_labels,
+    )
+
+
+def _stats_advanced(conn, tables):
+    # type: (sqlite3.Connection, dict) -> dict
+    """Aesthetic, depth, scene, enhancement, location, style and emotion stats."""
     # ── Advanced signals ────────────────────────────────────
     # Aesthetic scores
-    aesthetic_count = 0
-    aesthetic_avg = 0
-    aesthetic_min = 0
-    aesthetic_max = 0
     aesthetic_labels = []
     try:
-        aesthetic_count = conn.execute("SELECT COUNT(*) FROM aesthetic_scores").fetchone()[0]
-        row = conn.execute("SELECT ROUND(AVG(score),2), MIN(score), MAX(score) FROM aesthetic_scores").fetchone()
-        if row:
-            aesthetic_avg = row[0] or 0
-            aesthetic_min = row[1] or 0
-            aesthetic_max = row[2] or 0
         aesthetic_labels = [
             {"name": r[0] or "unlabeled", "count": r[1]}
             for r in conn.execute(
@@ -406,18 +746,8 @@ def get_stats():
         pass
 
     # Depth estimation
-    depth_count = 0
-    depth_avg_near = 0
-    depth_avg_mid = 0
-    depth_avg_far = 0
     depth_complexity_buckets = []
     try:
-        depth_count = conn.execute("SELECT COUNT(*) FROM depth_estimation").fetchone()[0]
-        row = conn.execute("SELECT ROUND(AVG(near_pct),1), ROUND(AVG(mid_pct),1), ROUND(AVG(far_pct),1) FROM depth_estimation").fetchone()
-        if row:
-            depth_avg_near = row[0] or 0
-            depth_avg_mid = row[1] or 0
-            depth_avg_far = row[2] or 0
         depth_complexity_buckets = [
             {"name": r[0], "count": r[1]}
             for r in conn.execute("""
@@ -434,11 +764,9 @@ def get_stats():
         pass
 
     # Scene classification
-    scene_count = 0
     top_scenes = []
     scene_environments = []
     try:
-        scene_count = conn.execute("SELECT COUNT(*) FROM scene_classification").fetchone()[0]
         top_scenes = [
             {"name": r[0], "count": r[1]}
             for r in conn.execute(
@@ -457,11 +785,9 @@ def get_stats():
         pass
 
     # Enhancement plans
-    enhancement_count = 0
     enhancement_statuses = []
     enhancement_cameras = []
     try:
-        enhancement_count = conn.execute("SELECT COUNT(*) FROM enhancement_plans").fetchone()[0]
         enhancement_statuses = [
             {"name": r[0] or "planned", "count": r[1]}
             for r in conn.execute(
@@ -480,228 +806,52 @@ def get_stats():
         pass
 
     # Location data
-    location_count = 0
     location_sources = []
-    location_accepted = 0
     try:
-        location_count = conn.execute("SELECT COUNT(*) FROM image_locations").fetchone()[0]
         location_sources = [
             {"name": r[0] or "unknown", "count": r[1]}
             for r in conn.execute(
                 "SELECT source, COUNT(*) as cnt FROM image_locations "
                 "GROUP BY source ORDER BY cnt DESC"
             ).fetchall()
-        ]
-        location_accepted = conn.execute("SELECT COUNT(*) FROM image_locations WHERE accepted=1").fetchone()[0]
-    except Exception:
-        pass
-
-    # ── Pipeline runs ────────────────────────────────────────
-    runs = [
-        {"phase": r["phase"], "status": r["status"],
-         "ok": r["images_processed"], "failed": r["images_failed"],
-         "started": r["started_at"][:16].replace("T", " ") if r["started_at"] else ""}
-        for r in conn.execute(
-            "SELECT phase, status, images_processed, images_failed, started_at "
-            "FROM pipeline_runs "
-            "WHERE images_processed > 0 OR images_failed > 0 "
-            "ORDER BY started_at DESC LIMIT 15"
-        ).fetchall()
-    ]
-
-    # ── Recent analyses ──────────────────────────────────────
-    recent = [
-        {"uuid": r["image_uuid"][:8], "style": r["grading_style"],
-         "alt": r["alt_text"], "time": r["analyzed_at"][:19].replace("T", " ") if r["analyzed_at"] else ""}
-        for r in conn.execute(
-            "SELECT image_uuid, grading_style, alt_text, analyzed_at "
-            "FROM gemini_analysis WHERE raw_json != '' "
-            "ORDER BY analyzed_at DESC LIMIT 8"
-        ).fetchall()
-    ]
-
-    # ── Sample analysis ──────────────────────────────────────
-    sample_row = conn.execute(
-        "SELECT image_uuid, raw_json, analyzed_at FROM gemini_analysis "
-        "WHERE raw_json IS NOT NULL AND raw_json != '' "
-        "ORDER BY analyzed_at DESC LIMIT 1"
-    ).fetchone()
-    sample = None
-    if sample_row:
-        try:
-            sample = {
-                "uuid": sample_row["image_uuid"],
-                "time": sample_row["analyzed_at"][:19].replace("T", " ") if sample_row["analyzed_at"] else "",
-                "data": json.loads(sample_row["raw_json"]),
-            }
-        except json.JSONDecodeError:
-            pass
-
-    # ── Advanced signal counts (OCR, captions, emotions, style) ─
-    style_count = 0
-    top_styles = []  # type: list
-    ocr_images = 0
-    ocr_texts = 0
-    caption_count = 0
-    emotion_count = 0
-    top_emotions = []  # type: list
-    aspect_ratios = []  # type: list
-    try:
-        style_count = conn.execute("SELECT COUNT(*) FROM style_classification").fetchone()[0]
-        top_styles = [{"name": r[0], "count": r[1]} for r in conn.execute(
-            "SELECT style, COUNT(*) FROM style_classification GROUP BY style ORDER BY COUNT(*) DESC LIMIT 12").fetchall()]
-    except Exception:
-        pass
-    try:
-        ocr_images = conn.execute("SELECT COUNT(DISTINCT image_uuid) FROM ocr_detections").fetchone()[0]
-        ocr_texts = conn.execute("SELECT COUNT(*) FROM ocr_detections WHERE text != ''").fetchone()[0]
-    except Exception:
-        pass
-    try:
-        caption_count = conn.execute("SELECT COUNT(*) FROM image_captions").fetchone()[0]
-    except Exception:
-        pass
-    try:
-        emotion_count = conn.execute("SELECT COUNT(DISTINCT image_uuid) FROM facial_emotions").fetchone()[0]
-        top_emotions = [{"name": r[0], "count": r[1]} for r in conn.execute(
-            "SELECT dominant_emotion, COUNT(*) FROM facial_emotions GROUP BY dominant_emotion ORDER BY COUNT(*) DESC").fetchall()]
-    except Exception:
-        pass
-    try:
-        ratio_rows = conn.execute("""
-            SELECT
-                CASE
-                    WHEN CAST(pixel_width AS REAL) / NULLIF(pixel_height, 0) > 1.1 THEN 'Landscape'
-                    WHEN CAST(pixel_width AS REAL) / NULLIF(pixel_height, 0) < 0.9 THEN 'Portrait'
-                    ELSE 'Square'
-                END AS ratio_type,
-                COUNT(*) as cnt
-            FROM exif_metadata
-            WHERE pixel_width > 0 AND pixel_height > 0
-            GROUP BY ratio_type ORDER BY cnt DESC
-        """).fetchall()
-        aspect_ratios = [{"name": r[0], "count": r[1]} for r in ratio_rows]
-    except Exception:
-        pass
-
-    # ── V2 Signals ──────────────────────────────────────────
-    v2_signals = {}
-    for tbl_name in ['aesthetic_scores_v2', 'florence_captions', 'segmentation_masks',
-                      'open_detections', 'image_tags', 'foreground_masks',
-                      'pose_detections', 'saliency_maps', 'face_identities']:
-        try:
-            cnt = conn.execute(f"SELECT COUNT(*) FROM {tbl_name}").fetchone()[0]
-            uuids = conn.execute(f"SELECT COUNT(DISTINCT image_uuid) FROM {tbl_name}").fetchone()[0]
-            v2_signals[tbl_name] = {"rows": cnt, "images": uuids}
-        except Exception:
-            v2_signals[tbl_name] = {"rows": 0, "images": 0}
-
-    # Aesthetic v2 stats
-    aesthetic_v2_count = v2_signals.get('aesthetic_scores_v2', {}).get('images', 0)
-    aesthetic_v2_labels = []
-    try:
-        aesthetic_v2_labels = [
-            {"name": r[0] or "unlabeled", "count": r[1]}
-            for r in conn.execute(
-                "SELECT score_label, COUNT(*) as cnt FROM aesthetic_scores_v2 "
-                "GROUP BY score_label ORDER BY cnt DESC"
-            ).fetchall()
-        ]
-    except Exception:
-        pass
-
-    # Top image tags
-    top_tags = []
-    try:
-        # Parse pipe-separated tags and count
-        tag_rows = conn.execute("SELECT tags FROM image_tags WHERE tags IS NOT NULL").fetchall()
-        tag_counts = {}
-        for row in tag_rows:
-            for tag in row[0].split(" | "):
-                tag = tag.strip()
-                if tag:
-                    tag_counts[tag] = tag_counts.get(tag, 0) + 1
-        top_tags = [{"name": k, "count": v} for k, v in
-                    sorted(tag_counts.items(), key=lambda x: -x[1])[:30]]
-    except Exception:
-        pass
-
-    # Top open detection labels
-    top_open_labels = []
-    try:
-        top_open_labels = [
-            {"name": r[0], "count": r[1]}
-            for r in conn.execute(
-                "SELECT label, COUNT(*) as cnt FROM open_detections "
-                "GROUP BY label ORDER BY cnt DESC LIMIT 20"
-            ).fetchall()
-        ]
-    except Exception:
-        pass
-
-    # Total models completed (17 displayed models + v2)
-    # Use 'processed' for detection models (images with + without detections)
-    face_processed = signals.get('face_detections', {}).get('processed', signals.get('face_detections', {}).get('images', 0))
-    obj_processed = signals.get('object_detections', {}).get('processed', signals.get('object_detections', {}).get('images', 0))
-    face_images_with = signals.get('face_detections', {}).get('images', 0)
-    # Each (count, denominator) pair — most use total, Facial Emotions uses face count
-    model_checks = [
-        (analyzed, total),           # 01 Gemini
-        (pixel_analyzed, total),     # 02 Pixel Analysis
-        (vector_count, total),       # 03 DINOv2
-        (vector_count, total),       # 04 SigLIP
-        (vector_count, total),       # 05 CLIP
-        (face_processed, total),     # 06 YuNet
-        (obj_processed, total),      # 07 YOLOv8n
-        (aesthetic_count, total),    # 08 NIMA
-        (depth_count, total),        # 09 Depth Anything
-        (scene_count, total),        # 10 Places365
-        (style_count, total),        # 11 Style Net
-        (caption_count, total),      # 12 BLIP
-        (ocr_images, total),         # 13 EasyOCR
-        (emotion_count, face_images_with or 1),  # 14 Facial Emotions (vs face images)
-        (enhancement_count, total),  # 15 Enhancement Engine
-        (signals.get('dominant_colors', {}).get('images', 0), total),  # 16 K-means LAB
-        (signals.get('exif_metadata', {}).get('images', 0), total),    # 17 EXIF Parser
-        # V2 models
-        (aesthetic_v2_count, total),  # 18 Aesthetic v2
-        (v2_signals.get('florence_captions', {}).get('images', 0), total),     # 19 Florence-2
-        (v2_signals.get('segmentation_masks', {}).get('images', 0), total),    # 20 SAM
-        (v2_signals.get('open_detections', {}).get('images', 0), total),       # 21 Grounding DINO
-        (v2_signals.get('image_tags', {}).get('images', 0), total),            # 22 RAM++ / CLIP tags
-        (v2_signals.get('foreground_masks', {}).get('images', 0), total),      # 23 rembg
-        (v2_signals.get('saliency_maps', {}).get('images', 0), total),         # 24 Saliency
-    ]
-    models_complete = sum(1 for count, denom in model_checks if denom > 0 and count >= denom)
+        ]
+    except Exception:
+        pass
 
-    # Total signals extracted across all models
-    total_signals = sum([
-        signals.get('exif_metadata', {}).get('rows', 0),
-        signals.get('dominant_colors', {}).get('rows', 0),
-        signals.get('face_detections', {}).get('rows', 0),
-        signals.get('object_detections', {}).get('rows', 0),
-        signals.get('image_hashes', {}).get('rows', 0),
-        aesthetic_count, depth_count, scene_count, style_count,
-        caption_count, ocr_texts, emotion_count,
-        pixel_analyzed, enhancement_count, vector_count * 3,
-        analyzed,
-        # V2 signals
-        v2_signals.get('aesthetic_scores_v2', {}).get('rows', 0),
-        v2_signals.get('florence_captions', {}).get('rows', 0),
-        v2_signals.get('segmentation_masks', {}).get('rows', 0),
-        v2_signals.get('open_detections', {}).get('rows', 0),
-        v2_signals.get('image_tags', {}).get('rows', 0),
-        v2_signals.get('foreground_masks', {}).get('rows', 0),
-        v2_signals.get('pose_detections', {}).get('rows', 0),
-        v2_signals.get('saliency_maps', {}).get('rows', 0),
-        v2_signals.get('face_identities', {}).get('rows', 0),
-    ])
+    # ── Advanced signal counts (OCR, captions, emotions, style) ─
+    top_styles = []  # type: list
+    top_emotions = []  # type: list
+    try:
+        top_styles = [{"name": r[0], "count": r[1]} for r in conn.execute(
+            "SELECT style, COUNT(*) FROM style_classification GROUP BY style ORDER BY COUNT(*) DESC LIMIT 12").fetchall()]
+    except Exception:
+        pass
+    try:
+        top_emotions = [{"name": r[0], "count": r[1]} for r in conn.execute(
+            "SELECT dominant_emotion, COUNT(*) FROM facial_emotions GROUP BY dominant_emotion ORDER BY COUNT(*) DESC").fetchall()]
+    except Exception:
+        pass
 
+    return dict(
+        aesthetic_labels=aesthetic_labels,
+        aesthetic_histogram=aesthetic_histogram,
+        depth_complexity_buckets=depth_complexity_buckets,
+        top_scenes=top_scenes,
+        scene_environments=scene_environments,
+        enhancement_statuses=enhancement_statuses,
+        enhancement_cameras=enhancement_cameras,
+        location_sources=location_sources,
+        top_styles=top_styles,
+        top_emotions=top_emotions,
+    )
+
+
+def _stats_feedback(conn, tables):
+    # type: (sqlite3.Connection, dict) -> dict
+    """Firestore feedback and picks curation."""
     # ── Firestore feedback ─────────────────────────────────────
     def _table_exists(name):
-        return conn.execute(
-            "SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name=?", (name,)
-        ).fetchone()[0] > 0
+        return name in tables
 
     tinder_total = 0
     tinder_accepts = 0
@@ -807,143 +957,371 @@ def get_stats():
             """).fetchall()
         ]
 
+    return dict(
+        tinder_total=tinder_total,
+        tinder_accepts=tinder_accepts,
+        tinder_rejects=tinder_rejects,
+        tinder_by_day=tinder_by_day,
+        tinder_top_accepted=tinder_top_accepted,
+        tinder_top_rejected=tinder_top_rejected,
+        couple_likes_total=couple_likes_total,
+        couple_by_strategy=couple_by_strategy,
+        couple_approves_total=couple_approves_total,
+        couple_rejects_total=couple_rejects_total,
+        feedback_last_sync=feedback_last_sync,
+        picks_portrait=picks_portrait,
+        picks_landscape=picks_landscape,
+        picks_votes_total=picks_votes_total,
+        picks_votes_accept=picks_votes_accept,
+        picks_votes_reject=picks_votes_reject,
+        picks_by_device=picks_by_device,
+    )
+
+
+_stats_local = threading.local()
+_stats_pool = None  # type: Optional[ThreadPoolExecutor]
+_stats_pool_lock = threading.Lock()
+_STATS_PARTS = 6
+
+
+def _get_stats_pool():
+    # type: () -> ThreadPoolExecutor
+    """The shared stats executor, created once even when first calls race."""
+    global _stats_pool
+    with _stats_pool_lock:
+        if _stats_pool is None:
+            _stats_pool = ThreadPoolExecutor(max_workers=_STATS_PARTS, thread_name_prefix="stats")
+        return _stats_pool
+
+
+def _stats_connect(path=None):
+    # type: (Optional[Path]) -> sqlite3.Connection
+    """This thread's long-lived read-only stats connection (to DB_PATH by default).
+
+    Connections (and the worker threads holding them) outlive a single
+    get_stats() call, so --serve doesn't reopen and re-map the DB per request.
+    """
+    path = path or DB_PATH
+    conn = getattr(_stats_local, "conn", None)
+    if conn is not None and _stats_local.path == path:
+        return conn
+    # Room for every distinct statement in sqlite3's prepared-statement LRU
+    # Plain tuple rows: every stats query unpacks positionally
+    conn = sqlite3.connect(str(path), cached_statements=256)
+    # Read-only scan workload: map the file and keep a large page cache
+    conn.executescript(
+        "PRAGMA query_only=1; PRAGMA mmap_size=268435456; "
+        "PRAGMA cache_size=-262144; PRAGMA temp_store=MEMORY;"
+    )
+    _stats_local.conn, _stats_local.path = conn, path
+    return conn
+
+
+def _stats_part(fn, tables, path):
+    # type: (Callable, dict, Path) -> dict
+    """Run one get_stats() query group on the worker thread's own connection."""
+    return fn(_stats_connect(path), tables)
+
+
+def _compute_stats(db_path=None, pool=None):
+    # type: (Optional[Path], Optional[ThreadPoolExecutor]) -> dict
+    db_path = db_path or DB_PATH
+    conn = _stats_connect(db_path)
+    # {table: {column, ...}} for every table in the DB
+    tables = {}  # type: Dict[str, set]
+    for name, column in conn.execute(
+        "SELECT m.name, p.name FROM sqlite_master m, pragma_table_info(m.name) p WHERE m.type='table'"
+    ):
+        tables.setdefault(name, set()).add(column)
+
+    # Independent query groups run concurrently, each on its worker's own
+    # read-only connection (WAL allows parallel readers; sqlite3 releases the
+    # GIL while stepping). The filesystem stats are gathered while they run.
+    pool = pool or _get_stats_pool()
+    parts = (_fetch_scalars, _stats_library, _stats_gemini, _stats_signals,
+             _stats_advanced, _stats_feedback)
+    futures = [pool.submit(_stats_part, fn, tables, db_path) for fn in parts]
+
+    # ── Vector store ─────────────────────────────────────────
+    vector_count = 0
+    vector_size_human = "—"
+    # lancedb (and pyarrow under it) is only imported once a store exists
+    if VECTOR_PATH.exists():
+        try:
+            import lancedb as _ldb
+            _db = _ldb.connect(str(VECTOR_PATH))
+            _tbl = _db.open_table("image_vectors")
+            vector_count = _tbl.count_rows()
+            vector_size_human = human_bytes(_dir_size(VECTOR_PATH))
+        except Exception:
+            pass
+
     # ── Disk usage ───────────────────────────────────────────
-    db_size = os.path.getsize(str(DB_PATH)) if DB_PATH.exists() else 0
+    db_size = os.path.getsize(str(db_path)) if db_path.exists() else 0
     web_json_path = PROJECT_ROOT / "frontend" / "show" / "data" / "photos.json"
     web_json_size = os.path.getsize(str(web_json_path)) if web_json_path.exists() else 0
     web_photo_count = 0
     if web_json_path.exists():
         try:
-            web_photo_count = len(json.loads(web_json_path.read_text()))
+            web_photo_count = _photo_count(web_json_path)
         except Exception:
             pass
 
-    conn.close()
+    v = {}  # type: Dict[str, Any]
+    for f in futures:
+        v.update(f.result())
+
+    total = v["total"]
+    analyzed = v["analyzed"]
+    pixel_analyzed = v["pixel_analyzed"]
+    signals = v["signals"]
+    v2_signals = v["v2_signals"]
+
+    for key in ("aesthetic_avg", "aesthetic_min", "aesthetic_max",
+                "depth_avg_near", "depth_avg_mid", "depth_avg_far"):
+        v[key] = v[key] or 0
+    pending = total - analyzed - v["failed"]
+    for vs in v["variant_summary"]:
+        vs["pct"] = pct(vs["ok"], total)
+
+    # Total models completed (17 displayed models + v2)
+    # Use 'processed' for detection models (images with + without detections)
+    face_processed = signals.get('face_detections', {}).get('processed', signals.get('face_detections', {}).get('images', 0))
+    obj_processed = signals.get('object_detections', {}).get('processed', signals.get('object_detections', {}).get('images', 0))
+    v["face_images_with"] = signals.get('face_detections', {}).get('images', 0)
+    # Each (count, denominator) pair — most use total, Facial Emotions uses face count
+    model_checks = [
+        (analyzed, total),           # 01 Gemini
+        (pixel_analyzed, total),     # 02 Pixel Analysis
+        (vector_count, total),       # 03 DINOv2
+        (vector_count, total),       # 04 SigLIP
+        (vector_count, total),       # 05 CLIP
+        (face_processed, total),     # 06 YuNet
+        (obj_processed, total),      # 07 YOLOv8n
+        (v["aesthetic_count"], total),    # 08 NIMA
+        (v["depth_count"], total),        # 09 Depth Anything
+        (v["scene_count"], total),        # 10 Places365
+        (v["style_count"], total),        # 11 Style Net
+        (v["caption_count"], total),      # 12 BLIP
+        (v["ocr_images"], total),         # 13 EasyOCR
+        (v["emotion_count"], v["face_images_with"] or 1),  # 14 Facial Emotions (vs face images)
+        (v["enhancement_count"], total),  # 15 Enhancement Engine
+        (signals.get('dominant_colors', {}).get('images', 0), total),  # 16 K-means LAB
+        (signals.get('exif_metadata', {}).get('images', 0), total),    # 17 EXIF Parser
+        # V2 models
+        (v["aesthetic_v2_count"], total),  # 18 Aesthetic v2
+        (v2_signals.get('florence_captions', {}).get('images', 0), total),     # 19 Florence-2
+        (v2_signals.get('segmentation_masks', {}).get('images', 0), total),    # 20 SAM
+        (v2_signals.get('open_detections', {}).get('images', 0), total),       # 21 Grounding DINO
+        (v2_signals.get('image_tags', {}).get('images', 0), total),            # 22 RAM++ / CLIP tags
+        (v2_signals.get('foreground_masks', {}).get('images', 0), total),      # 23 rembg
+        (v2_signals.get('saliency_maps', {}).get('images', 0), total),         # 24 Saliency
+    ]
+    models_complete = sum(1 for count, denom in model_checks if denom > 0 and count >= denom)
+
+    # Total signals extracted across all models
+    total_signals = sum([
+        signals.get('exif_metadata', {}).get('rows', 0),
+        signals.get('dominant_colors', {}).get('rows', 0),
+        signals.get('face_detections', {}).get('rows', 0),
+        signals.get('object_detections', {}).get('rows', 0),
+        signals.get('image_hashes', {}).get('rows', 0),
+        v["aesthetic_count"], v["depth_count"], v["scene_count"], v["style_count"],
+        v["caption_count"], v["ocr_texts"], v["emotion_count"],
+        pixel_analyzed, v["enhancement_count"], vector_count * 3,
+        analyzed,
+        # V2 signals
+        v2_signals.get('aesthetic_scores_v2', {}).get('rows', 0),
+        v2_signals.get('florence_captions', {}).get('rows', 0),
+        v2_signals.get('segmentation_masks', {}).get('rows', 0),
+        v2_signals.get('open_detections', {}).get('rows', 0),
+        v2_signals.get('image_tags', {}).get('rows', 0),
+        v2_signals.get('foreground_masks', {}).get('rows', 0),
+        v2_signals.get('pose_detections', {}).get('rows', 0),
+        v2_signals.get('saliency_maps', {}).get('rows', 0),
+        v2_signals.get('face_identities', {}).get('rows', 0),
+    ])
 
     return {
         "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC"),
         "total": total,
         "analyzed": analyzed,
-        "failed": failed,
+        "failed": v["failed"],
         "pending": pending,
         "analysis_pct": pct(analyzed, total),
         "pixel_analyzed": pixel_analyzed,
         "pixel_pct": pct(pixel_analyzed, total),
-        "categories": categories,
-        "subcategories": subcategories,
-        "tiers": tiers,
-        "tier_coverage": tier_coverage,
-        "total_rendered_bytes": total_rendered_bytes,
-        "total_rendered_human": human_bytes(total_rendered_bytes),
-        "total_tier_files": total_tier_files,
-        "ai_variants_total": ai_variants_total,
-        "variant_summary": variant_summary,
-        "gcs_uploads": gcs_uploads,
-        "cameras": cameras,
-        "source_formats": source_formats,
-        "monochrome_count": monochrome_count,
-        "color_cast": color_cast,
-        "color_temp": color_temp,
-        "grading": grading,
-        "time_of_day": time_of_day,
-        "settings": settings,
-        "exposure": exposure,
-        "composition": composition,
-        "vibes": vibes,
-        "rotate_stats": rotate_stats,
-        "has_edit_prompt": has_edit_prompt,
-        "has_semantic_pops": has_semantic_pops,
-        "curation": curation,
-        "kept": kept,
-        "rejected": rejected,
-        "curated_total": curated_total,
-        "curation_pct": pct(curated_total, total),
+        "categories": v["categories"],
+        "subcategories": v["subcategories"],
+        "tiers": v["tiers"],
+        "tier_coverage": v["tier_coverage"],
+        "total_rendered_bytes": v["total_rendered_bytes"],
+        "total_rendered_human": human_bytes(v["total_rendered_bytes"]),
+        "total_tier_files": v["total_tier_files"],
+        "ai_variants_total": v["ai_variants_total"],
+        "variant_summary": v["variant_summary"],
+        "gcs_uploads": v["gcs_uploads"],
+        "cameras": v["cameras"],
+        "source_formats": v["source_formats"],
+        "monochrome_count": v["monochrome_count"],
+        "color_cast": v["color_cast"],
+        "color_temp": v["color_temp"],
+        "grading": v["grading"],
+        "time_of_day": v["time_of_day"],
+        "settings": v["settings"],
+        "exposure": v["exposure"],
+        "composition": v["composition"],
+        "vibes": v["vibes"],
+        "rotate_stats": v["rotate_stats"],
+        "has_edit_prompt": v["has_edit_prompt"],
+        "has_semantic_pops": v["has_semantic_pops"],
+        "curation": v["curation"],
+        "kept": v["kept"],
+        "rejected": v["rejected"],
+        "curated_total": v["curated_total"],
+        "curation_pct": pct(v["curated_total"], total),
         "vector_count": vector_count,
         "vector_size": vector_size_human,
-        "runs": runs,
-        "recent": recent,
-        "sample": sample,
+        "runs": v["runs"],
+        "recent": v["recent"],
+        "sample": v["sample"],
         "db_size": human_bytes(db_size),
         "web_json_size": human_bytes(web_json_size),
         "web_photo_count": web_photo_count,
         "signals": signals,
-        "exif_gps": exif_gps,
-        "exif_iso": exif_iso,
-        "face_images_with": face_images_with,
-        "face_total": face_total,
-        "top_objects": top_objects,
-        "top_color_names": top_color_names,
-        "aesthetic_count": aesthetic_count,
-        "aesthetic_avg": aesthetic_avg,
-        "aesthetic_min": aesthetic_min,
-        "aesthetic_max": aesthetic_max,
-        "aesthetic_labels": aesthetic_labels,
-        "aesthetic_histogram": aesthetic_histogram,
-        "depth_count": depth_count,
-        "depth_avg_near": depth_avg_near,
-        "depth_avg_mid": depth_avg_mid,
-        "depth_avg_far": depth_avg_far,
-        "depth_complexity_buckets": depth_complexity_buckets,
-        "scene_count": scene_count,
-        "top_scenes": top_scenes,
-        "scene_environments": scene_environments,
-        "enhancement_count": enhancement_count,
-        "enhancement_statuses": enhancement_statuses,
-        "enhancement_cameras": enhancement_cameras,
-        "location_count": location_count,
-        "location_sources": location_sources,
-        "location_accepted": location_accepted,
-        "style_count": style_count,
-        "top_styles": top_styles,
-        "ocr_images": ocr_images,
-        "ocr_texts": ocr_texts,
-        "caption_count": caption_count,
-        "emotion_count": emotion_count,
-        "top_emotions": top_emotions,
-        "aspect_ratios": aspect_ratios,
+        "exif_gps": v["exif_gps"],
+        "exif_iso": v["exif_iso"],
+        "face_images_with": v["face_images_with"],
+        "face_total": v["face_total"],
+        "top_objects": v["top_objects"],
+        "top_color_names": v["top_color_names"],
+        "aesthetic_count": v["aesthetic_count"],
+        "aesthetic_avg": v["aesthetic_avg"],
+        "aesthetic_min": v["aesthetic_min"],
+        "aesthetic_max": v["aesthetic_max"],
+        "aesthetic_labels": v["aesthetic_labels"],
+        "aesthetic_histogram": v["aesthetic_histogram"],
+        "depth_count": v["depth_count"],
+        "depth_avg_near": v["depth_avg_near"],
+        "depth_avg_mid": v["depth_avg_mid"],
+        "depth_avg_far": v["depth_avg_far"],
+        "depth_complexity_buckets": v["depth_complexity_buckets"],
+        "scene_count": v["scene_count"],
+        "top_scenes": v["top_scenes"],
+        "scene_environments": v["scene_environments"],
+        "enhancement_count": v["enhancement_count"],
+        "enhancement_statuses": v["enhancement_statuses"],
+        "enhancement_cameras": v["enhancement_cameras"],
+        "location_count": v["location_count"],
+        "location_sources": v["location_sources"],
+        "location_accepted": v["location_accepted"],
+        "style_count": v["style_count"],
+        "top_styles": v["top_styles"],
+        "ocr_images": v["ocr_images"],
+        "ocr_texts": v["ocr_texts"],
+        "caption_count": v["caption_count"],
+        "emotion_count": v["emotion_count"],
+        "top_emotions": v["top_emotions"],
+        "aspect_ratios": v["aspect_ratios"],
         "models_complete": models_complete,
         "total_signals": total_signals,
         # V2 signals
         "v2_signals": v2_signals,
-        "aesthetic_v2_count": aesthetic_v2_count,
-        "aesthetic_v2_labels": aesthetic_v2_labels,
-        "top_tags": top_tags,
-        "top_open_labels": top_open_labels,
+        "aesthetic_v2_count": v["aesthetic_v2_count"],
+        "aesthetic_v2_labels": v["aesthetic_v2_labels"],
+        "top_tags": v["top_tags"],
+        "top_open_labels": v["top_open_labels"],
         # Picks curation
         "picks": {
-            "portrait": picks_portrait,
-            "landscape": picks_landscape,
-            "total": picks_portrait + picks_landscape,
-            "votes_total": picks_votes_total,
-            "votes_accept": picks_votes_accept,
-            "votes_reject": picks_votes_reject,
-            "by_device": picks_by_device,
+            "portrait": v["picks_portrait"],
+            "landscape": v["picks_landscape"],
+            "total": v["picks_portrait"] + v["picks_landscape"],
+            "votes_total": v["picks_votes_total"],
+            "votes_accept": v["picks_votes_accept"],
+            "votes_reject": v["picks_votes_reject"],
+            "by_device": v["picks_by_device"],
         },
         # Firestore feedback
         "feedback": {
-            "last_sync": feedback_last_sync,
+            "last_sync": v["feedback_last_sync"],
             "tinder": {
-                "total": tinder_total,
-                "accepts": tinder_accepts,
-                "rejects": tinder_rejects,
-                "by_day": tinder_by_day,
-                "top_accepted": tinder_top_accepted,
-                "top_rejected": tinder_top_rejected,
+                "total": v["tinder_total"],
+                "accepts": v["tinder_accepts"],
+                "rejects": v["tinder_rejects"],
+                "by_day": v["tinder_by_day"],
+                "top_accepted": v["tinder_top_accepted"],
+                "top_rejected": v["tinder_top_rejected"],
             },
             "couple": {
-                "likes": couple_likes_total,
-                "by_strategy": couple_by_strategy,
-                "approves": couple_approves_total,
-                "rejects": couple_rejects_total,
+                "likes": v["couple_likes_total"],
+                "by_strategy": v["couple_by_strategy"],
+                "approves": v["couple_approves_total"],
+                "rejects": v["couple_rejects_total"],
             },
         },
     }
 
-
 # ---------------------------------------------------------------------------
 # HTML template
 # ---------------------------------------------------------------------------
 
+_CSS_STRING_RE = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')""")
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_PUNCT_RE = re.compile(r" ?([{};,>]) ?")
+_CSS_HEX_RE = re.compile(r"(?<=[\s:,(])#([0-9a-fA-F])\1([0-9a-fA-F])\2([0-9a-fA-F])\3\b")
+_STYLE_BLOCK_RE = re.compile(r"(<style>)(.*?)(</style>)", re.S)
+
+
+def _minify_css(css):
+    # type: (str) -> str
+    """Strip comments and whitespace from a stylesheet (rcssmin when installed)."""
+    try:
+        import rcssmin
+        return rcssmin.cssmin(css)
+    except ImportError:
+        pass
+    # Odd indices are quoted strings, which are kept verbatim
+    parts = _CSS_STRING_RE.split(css)
+    for i in range(0, len(parts), 2):
+        seg = _CSS_COMMENT_RE.sub("", parts[i])
+        seg = " ".join(seg.split())
+        seg = _CSS_PUNCT_RE.sub(r"\1", seg).replace(": ", ":").replace(";}", "}")
+        parts[i] = _CSS_HEX_RE.sub(r"#\1\2\3", seg)
+    return "".join(parts).strip()
+
+
+# Rules styling the first screen of the live page (theme, sidebar, hero,
+# headings). They lead the stylesheet, so cutting at the first rule that
+# doesn't match keeps the cascade order of both halves.
+_CRITICAL_CSS_RE = re.compile(
+    r"(?::root|\[data-theme|@keyframes|@media|html|\*|body|h1|\.hero|\.sidebar|\.sb-|"
+    r"\.theme-toggle|\.main-content|\.subtitle|\.manifesto|\.system-hero|\.live-dot|"
+    r"\.section-title|\.subsection-title)"
+)
+
+
+def _split_critical_css(css):
+    # type: (str) -> tuple
+    """(critical, deferred) halves of a minified stylesheet."""
+    depth = start = 0
+    for i, ch in enumerate(css):
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                start = i + 1
+        elif depth == 0 and i == start and not _CRITICAL_CSS_RE.match(css, i):
+            return css[:i], css[i:]
+    return css, ""
+
+
+def _minify_styles(html):
+    # type: (str) -> str
+    """Minify every inline <style> block of a page."""
+    return _STYLE_BLOCK_RE.sub(lambda m: m.group(1) + _minify_css(m.group(2)) + m.group(3), html)
+
+
 PAGE_HTML = r"""<!DOCTYPE html>
 <html lang="en" data-theme="light">
 <head>
@@ -1381,6 +1759,8 @@ PAGE_HTML = r"""<!DOCTYPE html>
     margin: 0 auto;
     width: 100%;
     animation: fade-up 0.5s var(--ease-default) both;
+    /* Content grids query this box, which excludes the sidebar */
+    container: main / inline-size;
   }
 
   /* ── Mobile hamburger ── */
@@ -1466,6 +1846,12 @@ PAGE_HTML = r"""<!DOCTYPE html>
     0%, 100% { opacity: 1; transform: scale(1); }
     50% { opacity: 0.4; transform: scale(0.85); }
   }
+  /* Infinite pulses stop while the tab is hidden or motion is reduced */
+  html.tab-hidden .live-dot, html.tab-hidden .el-badge.active { animation-play-state: paused; }
+  @media (prefers-reduced-motion: reduce) {
+    .live-dot { animation: none; opacity: 0.7; }
+    .el-badge.active { animation: none; }
+  }
 
   /* Section headings */
   .section-title {
@@ -1506,11 +1892,23 @@ PAGE_HTML = r"""<!DOCTYPE html>
     letter-spacing: var(--tracking-tight); margin-bottom: var(--space-1);
   }
   .el-section-sub { display: none; }
+  /* Fixed tracks: the column counts auto-fill(minmax(160px, 1fr)) resolved
+     to within the 1056px content box, without re-fitting on every resize */
   .el-grid {
     display: grid;
-    grid-template-columns: repeat(auto-fill, minmax(160px, 1fr));
+    grid-template-columns: repeat(6, 1fr);
     gap: 6px;
   }
+  @container main (max-width: 989px) {
+    .el-grid { grid-template-columns: repeat(5, 1fr); }
+  }
+  /* Shared card surface */
+  .el-card, .table-wrap, .model-card, .disk-item, .sample-block {
+    background: var(--card-bg);
+    border: 1px solid var(--border);
+    border-radius: var(--radius-md);
+  }
+  .model-card, .disk-item { box-shadow: var(--shadow-sm); }
   .el-card.status-done {
     border-color: var(--border);
   }
@@ -1522,8 +1920,6 @@ PAGE_HTML = r"""<!DOCTYPE html>
     opacity: 0.35;
   }
   .el-card {
-    background: var(--card-bg);
-    border: 1px solid var(--border);
     border-radius: var(--radius-sm);
     padding: 8px 10px;
     position: relative;
@@ -1560,9 +1956,11 @@ PAGE_HTML = r"""<!DOCTYPE html>
     border-radius: 1px; margin-top: 4px; overflow: hidden;
   }
   .el-card .el-fill {
-    height: 100%; border-radius: 1px;
+    width: 100%; height: 100%; border-radius: 1px;
     background: var(--fg);
-    transition: width 1s var(--ease-default);
+    transform-origin: left;
+    transition: transform 1s var(--ease-default);
+    will-change: transform;
   }
   .el-card.status-done .el-fill { background: var(--muted); }
   .el-card.status-active .el-fill { background: var(--apple-blue); }
@@ -1577,9 +1975,6 @@ PAGE_HTML = r"""<!DOCTYPE html>
   .el-badge.active { background: color-mix(in srgb, var(--apple-blue) 15%, transparent); color: var(--apple-blue); font-weight: 700; animation: pulse-badge 2s ease-in-out infinite; }
   .el-badge.pending { background: var(--hover-overlay); color: var(--muted); }
   @keyframes pulse-badge { 0%, 100% { opacity: 1; } 50% { opacity: 0.5; } }
-  @media (max-width: 600px) {
-    .el-grid { grid-template-columns: repeat(auto-fill, minmax(130px, 1fr)); }
-  }
 
 
   /* ═══ PROGRESS BARS ═══ */
@@ -1594,9 +1989,11 @@ PAGE_HTML = r"""<!DOCTYPE html>
   }
   .progress-fill {
     background: var(--fg);
+    width: 100%;
     height: 100%;
-    border-radius: var(--radius-full);
-    transition: width 1s var(--ease-default);
+    transform-origin: left;
+    transition: transform 1s var(--ease-default);
+    will-change: transform;
   }
   .progress-fill.green { background: var(--apple-green); }
   .progress-fill.amber { background: var(--apple-orange); }
@@ -1652,7 +2049,15 @@ PAGE_HTML = r"""<!DOCTYPE html>
   tr:hover td { background: var(--hover-overlay); }
 
   /* ═══ LAYOUT ═══ */
-  .section { margin-bottom: var(--space-12); }
+  /* Off-screen sections skip style/layout/paint until scrolled near;
+     "auto" keeps the last rendered height once a section has been seen */
+  .section {
+    margin-bottom: var(--space-12);
+    content-visibility: auto;
+    contain-intrinsic-size: auto 600px;
+  }
+  #sec-vectors, #sec-storage { contain-intrinsic-size: auto 240px; }
+  #sec-cameras, #sec-runs { contain-intrinsic-size: auto 720px; }
   .two-col { display: grid; grid-template-columns: 1fr; gap: var(--space-6); }
   .three-col { display: grid; grid-template-columns: 1fr; gap: var(--space-6); }
 
@@ -1660,16 +2065,19 @@ PAGE_HTML = r"""<!DOCTYPE html>
   h1 { font-size: var(--text-3xl); }
   @media (max-width: 640px) {
     h1 { font-size: var(--text-2xl); }
+  }
+  /* Container widths = the old viewport breakpoints minus the mobile padding */
+  @container main (max-width: 608px) {
     .el-grid { grid-template-columns: 1fr; }
   }
-  @media (min-width: 641px) and (max-width: 900px) {
+  @container main (min-width: 609px) and (max-width: 868px) {
     .el-grid { grid-template-columns: repeat(2, 1fr); }
   }
   @media (min-width: 640px) {
     h1 { font-size: 42px; }
   }
 
-  @media (min-width: 768px) {
+  @container main (min-width: 736px) {
     .two-col { grid-template-columns: 1fr 1fr; gap: var(--space-8); }
     .three-col { grid-template-columns: 1fr 1fr 1fr; }
   }
@@ -1677,9 +2085,6 @@ PAGE_HTML = r"""<!DOCTYPE html>
     overflow-x: auto;
     -webkit-overflow-scrolling: touch;
     margin-bottom: var(--space-4);
-    border-radius: var(--radius-md);
-    border: 1px solid var(--border);
-    background: var(--card-bg);
   }
   .table-wrap table {
     min-width: 500px;
@@ -1775,23 +2180,30 @@ PAGE_HTML = r"""<!DOCTYPE html>
     flex-shrink: 0;
   }
 
-  .mini-legend {
+  /* Legends: one swatch rule; each entry only sets --dot-color
+     (by class below, or inline: style="--dot-color:var(--apple-green)") */
+  .mini-legend, .depth-legend {
     display: flex;
     gap: var(--space-4);
     font-size: var(--text-xs);
     color: var(--muted);
     margin-top: var(--space-2);
   }
-  .mini-legend span { display: flex; align-items: center; gap: var(--space-1); }
-  .mini-legend span::before {
+  .depth-legend { margin-top: var(--space-1); }
+  .mini-legend span, .depth-legend span { display: flex; align-items: center; gap: var(--space-1); }
+  .mini-legend span::before, .depth-legend span::before {
     content: '';
     display: inline-block;
     width: 8px; height: 8px;
     border-radius: var(--radius-full);
+    background: var(--dot-color, var(--muted));
   }
-  .mini-legend .l-ok::before { background: var(--apple-green); }
-  .mini-legend .l-fail::before { background: var(--apple-red); }
-  .mini-legend .l-filtered::before { background: var(--muted); }
+  .depth-legend span::before { border-radius: 2px; }
+  .l-ok { --dot-color: var(--apple-green); }
+  .l-fail { --dot-color: var(--apple-red); }
+  .dl-near { --dot-color: var(--apple-blue); }
+  .dl-mid { --dot-color: var(--apple-teal); }
+  .dl-far { --dot-color: var(--apple-indigo); }
 
   /* ═══ MODEL CARDS ═══ */
   .model-cards {
@@ -1800,16 +2212,10 @@ PAGE_HTML = r"""<!DOCTYPE html>
     gap: var(--space-3);
     margin: var(--space-3) 0;
   }
-  @media (max-width: 600px) {
+  @container main (max-width: 568px) {
     .model-cards { grid-template-columns: 1fr; }
   }
-  .model-card {
-    background: var(--card-bg);
-    border: 1px solid var(--border);
-    border-radius: var(--radius-md);
-    padding: var(--space-4) var(--space-5);
-    box-shadow: var(--shadow-sm);
-  }
+  .model-card { padding: var(--space-4) var(--space-5); }
   .model-card .mc-name { font-weight: 700; font-size: var(--text-base); }
   .model-card .mc-dim { font-size: var(--text-xs); color: var(--muted); margin-top: 2px; font-family: var(--font-mono); }
   .model-card .mc-desc { font-size: var(--text-xs); color: var(--muted); margin-top: var(--space-2); line-height: var(--leading-relaxed); }
@@ -1835,13 +2241,7 @@ PAGE_HTML = r"""<!DOCTYPE html>
     flex-wrap: wrap;
     margin: var(--space-3) 0;
   }
-  .disk-item {
-    background: var(--card-bg);
-    border: 1px solid var(--border);
-    border-radius: var(--radius-md);
-    padding: var(--space-3) var(--space-4);
-    box-shadow: var(--shadow-sm);
-  }
+  .disk-item { padding: var(--space-3) var(--space-4); }
   .disk-item .di-val {
     font-family: var(--font-display);
     font-weight: 700;
@@ -1851,9 +2251,6 @@ PAGE_HTML = r"""<!DOCTYPE html>
 
   /* ═══ SAMPLE JSON ═══ */
   .sample-block {
-    background: var(--card-bg);
-    border: 1px solid var(--border);
-    border-radius: var(--radius-md);
     padding: var(--space-5);
     overflow-x: auto;
     max-height: 500px;
@@ -1893,25 +2290,7 @@ PAGE_HTML = r"""<!DOCTYPE html>
     font-weight: 600;
     color: white;
     min-width: 32px;
-    transition: width 1s var(--ease-default);
-  }
-  .depth-legend {
-    display: flex;
-    gap: var(--space-4);
-    font-size: var(--text-xs);
-    color: var(--muted);
-    margin-top: var(--space-1);
-  }
-  .depth-legend span { display: flex; align-items: center; gap: var(--space-1); }
-  .depth-legend span::before {
-    content: '';
-    display: inline-block;
-    width: 8px; height: 8px;
-    border-radius: 2px;
   }
-  .depth-legend .dl-near::before { background: var(--apple-blue); }
-  .depth-legend .dl-mid::before { background: var(--apple-teal); }
-  .depth-legend .dl-far::before { background: var(--apple-indigo); }
 
   /* ═══ CAMERA TABLE ═══ */
   .camera-table td:first-child { font-weight: 600; }
@@ -1932,6 +2311,24 @@ PAGE_HTML = r"""<!DOCTYPE html>
 </style>
 </head>
 <body>
+<svg style="display:none" aria-hidden="true">
+  <symbol id="ic-camera" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><path d="M23 19a2 2 0 01-2 2H3a2 2 0 01-2-2V8a2 2 0 012-2h4l2-3h6l2 3h4a2 2 0 012 2z"/><circle cx="12" cy="13" r="4"/></symbol>
+  <symbol id="ic-scene" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><path d="M17 21v-2a4 4 0 00-3-3.87M9 21v-2a4 4 0 00-4-4H3"/><path d="M1 21h22"/><path d="M12 2l3 7h-6l3-7z"/><path d="M7 10l-3 5"/><path d="M17 10l3 5"/></symbol>
+  <symbol id="ic-home" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><path d="M3 9l9-7 9 7v11a2 2 0 01-2 2H5a2 2 0 01-2-2z"/></symbol>
+  <symbol id="ic-depth" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><rect x="2" y="2" width="20" height="20" rx="2"/><path d="M7 7h10M9 12h6M11 17h2"/></symbol>
+  <symbol id="ic-pin" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><path d="M21 10c0 7-9 13-9 13s-9-6-9-13a9 9 0 1118 0z"/><circle cx="12" cy="10" r="3"/></symbol>
+  <symbol id="ic-palette" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><circle cx="13.5" cy="6.5" r="0.5" fill="currentColor"/><circle cx="17.5" cy="10.5" r="0.5" fill="currentColor"/><circle cx="8.5" cy="7.5" r="0.5" fill="currentColor"/><circle cx="6.5" cy="12" r="0.5" fill="currentColor"/><path d="M12 2C6.5 2 2 6.5 2 12s4.5 10 10 10c.93 0 1.4-.47 1.4-1.17 0-.31-.13-.6-.34-.82A1.2 1.2 0 0112.72 19H14a8 8 0 008-8c0-4.4-4.5-9-10-9z"/></symbol>
+  <symbol id="ic-sun" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><circle cx="12" cy="12" r="5"/><line x1="12" y1="1" x2="12" y2="3"/><line x1="12" y1="21" x2="12" y2="23"/><line x1="4.22" y1="4.22" x2="5.64" y2="5.64"/><line x1="18.36" y1="18.36" x2="19.78" y2="19.78"/><line x1="1" y1="12" x2="3" y2="12"/><line x1="21" y1="12" x2="23" y2="12"/><line x1="4.22" y1="19.78" x2="5.64" y2="18.36"/><line x1="18.36" y1="5.64" x2="19.78" y2="4.22"/></symbol>
+  <symbol id="ic-star" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><polygon points="12 2 15.09 8.26 22 9.27 17 14.14 18.18 21.02 12 17.77 5.82 21.02 7 14.14 2 9.27 8.91 8.26 12 2"/></symbol>
+  <symbol id="ic-sunset" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><path d="M17 18a5 5 0 00-10 0"/><line x1="12" y1="9" x2="12" y2="2"/><line x1="4.22" y1="10.22" x2="5.64" y2="11.64"/><line x1="1" y1="18" x2="3" y2="18"/><line x1="21" y1="18" x2="23" y2="18"/><line x1="18.36" y1="11.64" x2="19.78" y2="10.22"/><line x1="23" y1="22" x2="1" y2="22"/></symbol>
+  <symbol id="ic-bulb" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><path d="M9 18h6M10 22h4"/><path d="M12 2a7 7 0 00-4 12.7V17h8v-2.3A7 7 0 0012 2z"/></symbol>
+  <symbol id="ic-frame" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><rect x="3" y="3" width="18" height="18" rx="2"/><rect x="7" y="7" width="10" height="10"/></symbol>
+  <symbol id="ic-sparkle" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><path d="M12 2l2.4 7.2L22 12l-7.6 2.8L12 22l-2.4-7.2L2 12l7.6-2.8z"/></symbol>
+  <symbol id="ic-rotate" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><polyline points="1 4 1 10 7 10"/><path d="M3.51 15a9 9 0 102.13-9.36L1 10"/></symbol>
+  <symbol id="ic-film" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><rect x="2" y="2" width="20" height="20" rx="2.18" ry="2.18"/><line x1="7" y1="2" x2="7" y2="22"/><line x1="17" y1="2" x2="17" y2="22"/><line x1="2" y1="12" x2="22" y2="12"/></symbol>
+  <symbol id="ic-box" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><path d="M21 16V8a2 2 0 00-1-1.73l-7-4a2 2 0 00-2 0l-7 4A2 2 0 003 8v8a2 2 0 001 1.73l7 4a2 2 0 002 0l7-4A2 2 0 0021 16z"/><polyline points="3.27 6.96 12 12.01 20.73 6.96"/><line x1="12" y1="22.08" x2="12" y2="12"/></symbol>
+  <symbol id="ic-eye" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><path d="M1 12s4-8 11-8 11 8 11 8-4 8-11 8-11-8-11-8z"/><circle cx="12" cy="12" r="3"/></symbol>
+</svg>
 
 <nav class="sidebar" id="sidebar">
   <div class="sb-title">MADphotos</div>
@@ -1984,27 +2381,7 @@ PAGE_HTML = r"""<!DOCTYPE html>
 <!-- ═══ SIGNALS — All tags grouped by meaning ═══ -->
 <div class="section" id="sec-signals">
   <div class="section-title">Signals</div>
-
-  <!-- Scene & Setting -->
-  <div class="signal-group">
-    <div class="signal-group-label">Scene & Setting</div>
-    <div id="pills-scene-all" class="tag-row"></div>
-  </div>
-
-  <div class="signal-group">
-    <div class="signal-group-label">Visual Style</div>
-    <div id="pills-style-all" class="tag-row"></div>
-  </div>
-
-  <div class="signal-group">
-    <div class="signal-group-label">Structure</div>
-    <div id="pills-structure-all" class="tag-row"></div>
-  </div>
-
-  <div class="signal-group">
-    <div class="signal-group-label">Context</div>
-    <div id="pills-context-all" class="tag-row"></div>
-  </div>
+%%SIGNAL_GROUPS%%
 </div>
 
 <!-- ═══ VECTOR STORE ═══ -->
@@ -2012,21 +2389,7 @@ PAGE_HTML = r"""<!DOCTYPE html>
   <div class="section-title">Vector Store</div>
   <div id="vector-info" style="font-size:var(--text-sm);color:var(--muted);margin-bottom:var(--space-3);"></div>
   <div class="model-cards">
-    <div class="model-card">
-      <div class="mc-name">DINOv2</div>
-      <div class="mc-dim">768 dimensions</div>
-      <div class="mc-desc">Self-supervised vision transformer. Sees composition, texture, spatial layout. The artistic eye.</div>
-    </div>
-    <div class="model-card">
-      <div class="mc-name">SigLIP</div>
-      <div class="mc-dim">768 dimensions</div>
-      <div class="mc-desc">Multimodal image-text model. Sees meaning, enables text search. The semantic brain.</div>
-    </div>
-    <div class="model-card">
-      <div class="mc-name">CLIP</div>
-      <div class="mc-dim">512 dimensions</div>
-      <div class="mc-desc">Subject matching model. Finds duplicates and similar scenes. The pattern matcher.</div>
-    </div>
+%%VECTOR_MODEL_CARDS%%
   </div>
 </div>
 
@@ -2092,12 +2455,12 @@ PAGE_HTML = r"""<!DOCTYPE html>
 
 </div><!-- /.main-content -->
 
+<script id="boot-data" type="application/json">%%INLINE_DATA%%</script>
 <script>
 (function() {
   var POLL = %%POLL_MS%%;
   var API  = "%%API_URL%%";
-  var prev = null;
-  var prevTime = null;
+  var prevSample = null;
 
   /* ── Theme toggle ── */
   function getTheme() {
@@ -2120,26 +2483,125 @@ PAGE_HTML = r"""<!DOCTYPE html>
   applyTheme(getTheme());
 
   /* ── Helpers ── */
-  function fmt(n) { return n != null ? n.toLocaleString() : "\u2014"; }
-  function el(id) { return document.getElementById(id); }
-
-  function flash(id) {
-    var e = el(id);
-    if (!e) return;
-    e.classList.add("updated");
-    setTimeout(function() { e.classList.remove("updated"); }, 1200);
+  /* One shared formatter: Number#toLocaleString re-resolves locale data per call.
+     Counts repeat heavily across polls, so their strings are memoized too */
+  var numFmt = new Intl.NumberFormat();
+  var fmtCache = new Map();
+  function fmt(n) {
+    if (n == null) return "\u2014";
+    if (typeof n !== "number") return n.toLocaleString();
+    var s = fmtCache.get(n);
+    if (s === undefined) {
+      s = numFmt.format(n);
+      if (fmtCache.size < 2048) fmtCache.set(n, s);
+    }
+    return s;
+  }
+  /* Bound elements are never replaced, so each id is looked up once */
+  var nodes = {};
+  function el(id) { return nodes[id] || (nodes[id] = document.getElementById(id)); }
+
+  function cell(v) {
+    if (typeof v === "number") v = fmt(v);
+    return v || "\u2014";
+  }
+
+  /* Column schemas resolve once into per-column open tags and getters */
+  var rowRenderers = new WeakMap();
+  function keyGetter(k) { return function(r) { return r[k]; }; }
+  function compileRows(cols) {
+    var fn = rowRenderers.get(cols);
+    if (fn) return fn;
+    var n = cols.length, open = new Array(n), get = new Array(n);
+    for (var j = 0; j < n; j++) {
+      var c = cols[j];
+      open[j] = "<td" + (c.cls ? ' class="' + c.cls + '"' : "") + ">";
+      get[j] = typeof c.fn === "function" ? c.fn : keyGetter(c.key);
+    }
+    fn = function(data) {
+      var out = new Array(data.length);
+      for (var i = 0; i < data.length; i++) {
+        var r = data[i], tr = "<tr>";
+        for (var k = 0; k < n; k++) tr += open[k] + cell(get[k](r)) + "</td>";
+        out[i] = tr + "</tr>";
+      }
+      return out.join("\n");
+    };
+    rowRenderers.set(cols, fn);
+    return fn;
   }
 
   function rows(data, cols) {
-    return data.map(function(r) {
-      return "<tr>" + cols.map(function(c) {
-        var cls = c.cls ? ' class="' + c.cls + '"' : "";
-        var v = typeof c.fn === "function" ? c.fn(r) : r[c.key];
-        if (typeof v === "number") v = fmt(v);
-        return "<td" + cls + ">" + (v || "\u2014") + "</td>";
-      }).join("") + "</tr>";
-    }).join("\n");
-  }
+    return compileRows(cols)(data);
+  }
+
+  var CAMERA_COLS = [
+    {key: "body"},
+    {key: "count", cls: "num"},
+    {key: "medium"},
+    {key: "film"},
+    {key: "luminance", cls: "num"},
+    {fn: function(r) {
+      var cls = r.wb_r > 0.05 ? "wb-pos" : r.wb_r < -0.05 ? "wb-neg" : "wb-zero";
+      return '<span class="' + cls + '">' + (r.wb_r > 0 ? "+" : "") + r.wb_r.toFixed(3) + '</span>';
+    }, cls: "num"},
+    {fn: function(r) {
+      var cls = r.wb_b < -0.05 ? "wb-neg" : r.wb_b > 0.05 ? "wb-pos" : "wb-zero";
+      return '<span class="' + cls + '">' + (r.wb_b > 0 ? "+" : "") + r.wb_b.toFixed(3) + '</span>';
+    }, cls: "num"},
+    {key: "noise", cls: "num"},
+    {fn: function(r) { return r.shadow.toFixed(1) + "%"; }, cls: "num"}
+  ];
+  var RUN_COLS = [
+    {key: "phase"}, {key: "status"}, {key: "ok", cls: "num"},
+    {key: "failed", cls: "num"}, {key: "started"}
+  ];
+
+  /* Model grid: static card text lives here once; desc/count are a stats key
+     or a function of the stats for the few entries that mix in live numbers */
+  var SIG_EMPTY = {rows: 0, images: 0};
+  function sig(d, key) { return d.signals && d.signals[key] ? d.signals[key] : SIG_EMPTY; }
+  var EL_BADGE = {
+    done: '<span class="el-badge done">\u2713</span>',
+    pending: '<span class="el-badge pending">\u2014</span>'
+  };
+  var EL_MODELS = [
+    {n:'01', name:'Gemini 2.5 Pro', tech:'Vertex AI \u00B7 Google Cloud', desc:'Structured per-image analysis: vibes, exposure, composition, grading style, rotation, per-image edit prompts, semantic pops, alt text', count:'analyzed'},
+    {n:'02', name:'Pixel Analysis', tech:'Python \u00B7 Pillow \u00B7 NumPy', desc:'Mean luminance, white balance shift (R/B channels), noise estimation, shadow/highlight clipping %, contrast ratio, estimated color temperature', count:'pixel_analyzed'},
+    {n:'03', name:'DINOv2', tech:'PyTorch \u00B7 Meta FAIR \u00B7 ViT-B/14', desc:'Self-supervised vision transformer. 768-dim embeddings capturing composition, texture, spatial layout. The artistic eye of similarity search', count:'vector_count'},
+    {n:'04', name:'SigLIP', tech:'PyTorch \u00B7 Google \u00B7 ViT-B/16', desc:'Sigmoid-loss image-language pre-training. 768-dim embeddings enabling text-to-image search across the entire collection', count:'vector_count'},
+    {n:'05', name:'CLIP', tech:'PyTorch \u00B7 OpenAI \u00B7 ViT-B/32', desc:'Contrastive language-image pre-training. 512-dim embeddings for cross-modal matching, duplicate detection, subject similarity', count:'vector_count'},
+    {n:'06', name:'YuNet', tech:'OpenCV DNN \u00B7 ONNX \u00B7 C++',
+     desc:function(d) { return 'Lightweight face detector. ' + fmt(d.face_total) + ' faces detected across ' + fmt(sig(d, 'face_detections').images) + ' images with bounding box coordinates and confidence scores'; },
+     count:function(d) { var s = sig(d, 'face_detections'); return s.processed || s.images; }},
+    {n:'07', name:'YOLOv8n', tech:'PyTorch \u00B7 Ultralytics \u00B7 COCO',
+     desc:function(d) { return 'Real-time object detection. ' + fmt(sig(d, 'object_detections').rows) + ' objects detected across 80 COCO classes with bounding boxes and confidence thresholds'; },
+     count:function(d) { var s = sig(d, 'object_detections'); return s.processed || s.images; }},
+    {n:'08', name:'NIMA', tech:'PyTorch \u00B7 TensorFlow origin \u00B7 MobileNet',
+     desc:function(d) { return 'Neural Image Assessment. Aesthetic quality scoring on 1\u201310 scale. Collection avg: ' + (d.aesthetic_avg || 0).toFixed(1) + ', range ' + (d.aesthetic_min || 0).toFixed(1) + '\u2013' + (d.aesthetic_max || 0).toFixed(1); },
+     count:'aesthetic_count'},
+    {n:'09', name:'Depth Anything v2', tech:'PyTorch \u00B7 Hugging Face \u00B7 ViT', desc:'Monocular depth estimation. Near/mid/far zone percentages and depth complexity score per image. No stereo pair needed', count:'depth_count'},
+    {n:'10', name:'Places365', tech:'PyTorch \u00B7 MIT CSAIL \u00B7 ResNet-50', desc:'Scene classification across 365 environment categories. Top-3 predictions + indoor/outdoor environment label per image', count:'scene_count'},
+    {n:'11', name:'Style Net', tech:'PyTorch \u00B7 Custom classifier', desc:'Photographic style classification: street, portrait, landscape, architecture, macro, abstract, documentary, still life', count:'style_count'},
+    {n:'12', name:'BLIP', tech:'PyTorch \u00B7 Salesforce \u00B7 ViT+LLM', desc:'Bootstrapped Language-Image Pre-training. Natural language captions generated per image for search and accessibility', count:'caption_count'},
+    {n:'13', name:'EasyOCR', tech:'PyTorch \u00B7 CRAFT + CRNN',
+     desc:function(d) { return 'Text detection and recognition. ' + fmt(d.ocr_texts || 0) + ' text regions found across ' + fmt(d.ocr_images || 0) + ' images. English language model on CPU'; },
+     count:function(d) { return d.ocr_images || 0; }},
+    {n:'14', name:'Facial Emotions', tech:'PyTorch \u00B7 FER \u00B7 CNN', desc:'Emotion recognition on detected faces. 7 classes: angry, disgust, fear, happy, sad, surprise, neutral',
+     count:function(d) { return d.emotion_count || 0; }},
+    {n:'15', name:'Enhancement Engine', tech:'Python \u00B7 Pillow \u00B7 Camera-aware', desc:'6-step per-image editing pipeline: white balance, exposure, shadows/highlights, contrast, saturation, sharpening. Parameters derived from pixel analysis + camera body', count:'enhancement_count'},
+    {n:'16', name:'K-means LAB', tech:'Python \u00B7 scikit-learn \u00B7 LAB space',
+     desc:function(d) { return 'Dominant color extraction via K-means clustering in perceptually uniform CIELAB space. ' + fmt(sig(d, 'dominant_colors').rows) + ' color clusters with names mapped from nearest CSS4 colors'; },
+     count:function(d) { return sig(d, 'dominant_colors').images; }},
+    {n:'17', name:'EXIF Parser', tech:'Python \u00B7 Pillow \u00B7 piexif',
+     desc:function(d) { return 'Full metadata extraction: camera body, lens, ISO, shutter speed, aperture, focal length, date/time, GPS coordinates (' + fmt(d.exif_gps || 0) + ' geolocated)'; },
+     count:function(d) { return sig(d, 'exif_metadata').images; }}
+  ];
+  EL_MODELS.forEach(function(m) {
+    m.head = '<div class="el-num">' + m.n + '</div>' +
+      '<div class="el-model">' + m.name + '</div>' +
+      '<div class="el-tech">' + m.tech + '</div>';
+  });
 
   function badge(pct, total) {
     if (total === 0) return '<span class="badge empty">not started</span>';
@@ -2148,263 +2610,352 @@ PAGE_HTML = r"""<!DOCTYPE html>
     return '<span class="badge empty">pending</span>';
   }
 
-  /* ── SVG icon map ── */
-  var IC = {
-    camera:  '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><path d="M23 19a2 2 0 01-2 2H3a2 2 0 01-2-2V8a2 2 0 012-2h4l2-3h6l2 3h4a2 2 0 012 2z"/><circle cx="12" cy="13" r="4"/></svg>',
-    scene:   '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><path d="M17 21v-2a4 4 0 00-3-3.87M9 21v-2a4 4 0 00-4-4H3"/><path d="M1 21h22"/><path d="M12 2l3 7h-6l3-7z"/><path d="M7 10l-3 5"/><path d="M17 10l3 5"/></svg>',
-    home:    '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><path d="M3 9l9-7 9 7v11a2 2 0 01-2 2H5a2 2 0 01-2-2z"/></svg>',
-    depth:   '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><rect x="2" y="2" width="20" height="20" rx="2"/><path d="M7 7h10M9 12h6M11 17h2"/></svg>',
-    pin:     '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><path d="M21 10c0 7-9 13-9 13s-9-6-9-13a9 9 0 1118 0z"/><circle cx="12" cy="10" r="3"/></svg>',
-    palette: '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><circle cx="13.5" cy="6.5" r="0.5" fill="currentColor"/><circle cx="17.5" cy="10.5" r="0.5" fill="currentColor"/><circle cx="8.5" cy="7.5" r="0.5" fill="currentColor"/><circle cx="6.5" cy="12" r="0.5" fill="currentColor"/><path d="M12 2C6.5 2 2 6.5 2 12s4.5 10 10 10c.93 0 1.4-.47 1.4-1.17 0-.31-.13-.6-.34-.82A1.2 1.2 0 0112.72 19H14a8 8 0 008-8c0-4.4-4.5-9-10-9z"/></svg>',
-    sun:     '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><circle cx="12" cy="12" r="5"/><line x1="12" y1="1" x2="12" y2="3"/><line x1="12" y1="21" x2="12" y2="23"/><line x1="4.22" y1="4.22" x2="5.64" y2="5.64"/><line x1="18.36" y1="18.36" x2="19.78" y2="19.78"/><line x1="1" y1="12" x2="3" y2="12"/><line x1="21" y1="12" x2="23" y2="12"/><line x1="4.22" y1="19.78" x2="5.64" y2="18.36"/><line x1="18.36" y1="5.64" x2="19.78" y2="4.22"/></svg>',
-    star:    '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><polygon points="12 2 15.09 8.26 22 9.27 17 14.14 18.18 21.02 12 17.77 5.82 21.02 7 14.14 2 9.27 8.91 8.26 12 2"/></svg>',
-    sunset:  '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><path d="M17 18a5 5 0 00-10 0"/><line x1="12" y1="9" x2="12" y2="2"/><line x1="4.22" y1="10.22" x2="5.64" y2="11.64"/><line x1="1" y1="18" x2="3" y2="18"/><line x1="21" y1="18" x2="23" y2="18"/><line x1="18.36" y1="11.64" x2="19.78" y2="10.22"/><line x1="23" y1="22" x2="1" y2="22"/></svg>',
-    bulb:    '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><path d="M9 18h6M10 22h4"/><path d="M12 2a7 7 0 00-4 12.7V17h8v-2.3A7 7 0 0012 2z"/></svg>',
-    frame:   '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><rect x="3" y="3" width="18" height="18" rx="2"/><rect x="7" y="7" width="10" height="10"/></svg>',
-    sparkle: '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><path d="M12 2l2.4 7.2L22 12l-7.6 2.8L12 22l-2.4-7.2L2 12l7.6-2.8z"/></svg>',
-    rotate:  '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><polyline points="1 4 1 10 7 10"/><path d="M3.51 15a9 9 0 102.13-9.36L1 10"/></svg>',
-    film:    '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><rect x="2" y="2" width="20" height="20" rx="2.18" ry="2.18"/><line x1="7" y1="2" x2="7" y2="22"/><line x1="17" y1="2" x2="17" y2="22"/><line x1="2" y1="12" x2="22" y2="12"/></svg>',
-    box:     '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><path d="M21 16V8a2 2 0 00-1-1.73l-7-4a2 2 0 00-2 0l-7 4A2 2 0 003 8v8a2 2 0 001 1.73l7 4a2 2 0 002 0l7-4A2 2 0 0021 16z"/><polyline points="3.27 6.96 12 12.01 20.73 6.96"/><line x1="12" y1="22.08" x2="12" y2="12"/></svg>',
-    eye:     '<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.8" stroke-linecap="round" stroke-linejoin="round"><path d="M1 12s4-8 11-8 11 8 11 8-4 8-11 8-11-8-11-8z"/><circle cx="12" cy="12" r="3"/></svg>'
-  };
+  /* ── SVG icons: <use> refs into the #ic-* sprite at the top of <body> ── */
+  var IC = {};
+  ['camera', 'scene', 'home', 'depth', 'pin', 'palette', 'sun', 'star', 'sunset', 'bulb', 'frame', 'sparkle', 'rotate', 'film', 'box', 'eye'].forEach(function(k) {
+    IC[k] = '<svg><use href="#ic-' + k + '"/></svg>';
+  });
 
   function tags(data, containerId, iconKey, category) {
-    var container = el(containerId);
-    if (!container) return;
-    if (!data || !data.length) {
-      container.innerHTML = '<span style="color:var(--muted);font-size:var(--text-xs)">No data</span>';
-      return;
-    }
-    var svg = IC[iconKey] || IC.eye;
-    var catClass = category ? ' tag-cat-' + category : '';
-    container.innerHTML = data.map(function(r) {
-      var label = r.name || r.value || "\u2014";
-      return '<div class="tag' + catClass + '">' +
-        '<span class="tag-icon">' + svg + '</span>' +
-        '<span class="tag-label">' + label + '</span>' +
-        '<span class="tag-count">' + fmt(r.count) + '</span>' +
-        '</div>';
-    }).join("");
+    setTagRow(containerId, tagItems(data, iconKey, category));
   }
 
   /* Color dots tag (for dominant colors) */
   function colorTags(data, containerId) {
-    var container = el(containerId);
-    if (!container) return;
-    if (!data || !data.length) {
-      container.innerHTML = '<span style="color:var(--muted);font-size:var(--text-xs)">No data</span>';
+    setTagRow(containerId, colorTagItems(data));
+  }
+
+  /* Tag pills are cloned from one prebuilt node per icon/category family,
+     so the sprite <use> markup is parsed once instead of once per pill.
+     Builders return keyed items; setTagRow() reuses the row's existing
+     node for each key and only rewrites counts that changed. */
+  var tagProtos = {};
+  function span(cls) {
+    var s = document.createElement("span");
+    s.className = cls;
+    return s;
+  }
+  function tagProto(iconKey, category) {
+    var key = iconKey + "|" + (category || "");
+    var p = tagProtos[key];
+    if (!p) {
+      p = document.createElement("div");
+      p.className = "tag" + (category ? " tag-cat-" + category : "");
+      var icon = span("tag-icon");
+      icon.innerHTML = IC[iconKey] || IC.eye;
+      p.appendChild(icon);
+      p.appendChild(span("tag-label"));
+      p.appendChild(span("tag-count"));
+      tagProtos[key] = p;
+    }
+    return p;
+  }
+  function tagItems(data, iconKey, category) {
+    if (!data || !data.length) return [];
+    var proto = tagProto(iconKey, category);
+    var family = iconKey + "|" + (category || "") + "|";
+    var out = new Array(data.length);
+    for (var i = 0; i < data.length; i++) {
+      var r = data[i], label = r.name || r.value || "\u2014";
+      out[i] = {key: family + label, proto: proto, label: label, count: fmt(r.count)};
+    }
+    return out;
+  }
+  var colorProto = null;
+  function colorTagItems(data) {
+    if (!data || !data.length) return [];
+    if (!colorProto) {
+      colorProto = document.createElement("div");
+      colorProto.className = "tag";
+      colorProto.appendChild(span("tag-cdot"));
+      colorProto.appendChild(span("tag-count"));
+    }
+    var out = new Array(data.length);
+    for (var i = 0; i < data.length; i++) {
+      var c = data[i], hex = c.hex || "#999";
+      out[i] = {key: "color|" + hex, proto: colorProto, hex: hex, count: fmt(c.count)};
+    }
+    return out;
+  }
+  function setTagRow(id, items) {
+    var c = el(id);
+    if (!c) return;
+    if (!items.length) {
+      c._keyed = null;
+      c.innerHTML = '<span style="color:var(--muted);font-size:var(--text-xs)">No data</span>';
       return;
     }
-    container.innerHTML = data.map(function(c) {
-      var hex = c.hex || '#999';
-      return '<div class="tag">' +
-        '<span class="tag-cdot" style="background:' + hex + '"></span>' +
-        '<span class="tag-count">' + fmt(c.count) + '</span>' +
-        '</div>';
-    }).join("");
-  }
-
-  /* Inline tag HTML builders (return strings, don't set innerHTML) */
-  function tagHtml(data, iconKey, category) {
-    if (!data || !data.length) return '';
-    var svg = IC[iconKey] || IC.eye;
-    var catClass = category ? ' tag-cat-' + category : '';
-    return data.map(function(r) {
-      var label = r.name || r.value || "\u2014";
-      return '<div class="tag' + catClass + '">' +
-        '<span class="tag-icon">' + svg + '</span>' +
-        '<span class="tag-label">' + label + '</span>' +
-        '<span class="tag-count">' + fmt(r.count) + '</span>' +
-        '</div>';
-    }).join("");
-  }
-  function colorTagHtml(data) {
-    if (!data || !data.length) return '';
-    return data.map(function(c) {
-      var hex = c.hex || '#999';
-      return '<div class="tag">' +
-        '<span class="tag-cdot" style="background:' + hex + '"></span>' +
-        '<span class="tag-count">' + fmt(c.count) + '</span>' +
-        '</div>';
-    }).join("");
+    var prev = c._keyed || {}, keyed = {}, nodes = new Array(items.length);
+    var inPlace = !!c._keyed && c.children.length === items.length;
+    for (var i = 0; i < items.length; i++) {
+      var it = items[i], key = it.key;
+      if (keyed[key]) key += "#" + i;
+      var node = prev[key];
+      if (!node) {
+        node = it.proto.cloneNode(true);
+        if (it.hex !== undefined) node.children[0].style.background = it.hex;
+        else node.children[1].textContent = it.label;
+      }
+      if (node._count !== it.count) {
+        node.children[node.children.length - 1].textContent = it.count;
+        node._count = it.count;
+      }
+      keyed[key] = nodes[i] = node;
+      if (inPlace && c.children[i] !== node) inPlace = false;
+    }
+    c._keyed = keyed;
+    if (inPlace) return;
+    var frag = document.createDocumentFragment();
+    for (var j = 0; j < nodes.length; j++) frag.appendChild(nodes[j]);
+    c.replaceChildren(frag);
+  }
+
+  /* Small fixed-shape sections keep their nodes across polls: rows are
+     created once and only cell text that changed is rewritten, no parsing */
+  var TIER_CELLS = ["", "num", "num"];
+  var DISK_CELLS = ["di-val", "di-label"];
+  function syncRows(id, rowTag, rowClass, cellTag, cellClasses, rows) {
+    var c = el(id);
+    if (!c) return;
+    if (!c._synced) {
+      c.textContent = "";
+      c._synced = true;
+    }
+    while (c.children.length > rows.length) c.removeChild(c.lastElementChild);
+    for (var i = 0; i < rows.length; i++) {
+      var row = c.children[i];
+      if (!row) {
+        row = document.createElement(rowTag);
+        if (rowClass) row.className = rowClass;
+        for (var j = 0; j < cellClasses.length; j++) {
+          var cell = document.createElement(cellTag);
+          if (cellClasses[j]) cell.className = cellClasses[j];
+          row.appendChild(cell);
+        }
+        c.appendChild(row);
+      }
+      for (var k = 0; k < cellClasses.length; k++) {
+        var text = String(rows[i][k]);
+        if (row.children[k].textContent !== text) row.children[k].textContent = text;
+      }
+    }
+  }
+
+  /* Per-section input signatures: a section whose source data serializes
+     the same as last poll skips building its rows/pills entirely. The
+     serialized text is compared directly, which is exact and no dearer
+     than hashing it first */
+  var sigs = {};
+  function changed(key, value) {
+    var sig = JSON.stringify(value);
+    if (sigs[key] === sig) return false;
+    sigs[key] = sig;
+    return true;
   }
-  function setTagRow(id, html) {
+
+  /* Containers are only re-parsed when their markup actually changed */
+  var rendered = {};
+  function setHtml(id, html) {
+    if (rendered[id] === html) return;
+    rendered[id] = html;
     var c = el(id);
-    if (c) c.innerHTML = html || '<span style="color:var(--muted);font-size:var(--text-xs)">No data</span>';
+    if (c) c.innerHTML = html;
   }
 
   /* ════════════════════════════════════════════════════════════
      UPDATE — main data binding
      ════════════════════════════════════════════════════════════ */
+  /* Poll results land in the next frame; back-to-back responses coalesce
+     so all DOM writes happen in one layout pass */
+  var pendingData = null;
   function update(d) {
-    el("subtitle").innerHTML =
-      '<span class="live-dot"></span>' + d.timestamp;
+    var scheduled = pendingData !== null;
+    pendingData = d;
+    if (!scheduled) requestAnimationFrame(function() {
+      var data = pendingData;
+      pendingData = null;
+      applyUpdate(data);
+    });
+  }
+
+  function applyUpdate(d) {
+    setHtml("subtitle",
+      '<span class="live-dot"></span>' + d.timestamp);
     el("footer-ts").textContent = d.timestamp;
 
     /* ── Model intelligence grid ── */
     var mc = d.models_complete || 0;
-    el("el-sub").textContent = fmt(d.total) + " images \u00D7 17 models = " + fmt(d.total_signals || 0) + " signals \u2014 " + mc + " complete";
-    var sigFD = d.signals && d.signals.face_detections ? d.signals.face_detections : {rows:0, images:0};
-    var sigOD = d.signals && d.signals.object_detections ? d.signals.object_detections : {rows:0, images:0};
-    var sigDC = d.signals && d.signals.dominant_colors ? d.signals.dominant_colors : {rows:0, images:0};
-    var sigEX = d.signals && d.signals.exif_metadata ? d.signals.exif_metadata : {rows:0, images:0};
-    var models = [
-      {n:'01', name:'Gemini 2.5 Pro', tech:'Vertex AI \u00B7 Google Cloud', desc:'Structured per-image analysis: vibes, exposure, composition, grading style, rotation, per-image edit prompts, semantic pops, alt text', count:d.analyzed},
-      {n:'02', name:'Pixel Analysis', tech:'Python \u00B7 Pillow \u00B7 NumPy', desc:'Mean luminance, white balance shift (R/B channels), noise estimation, shadow/highlight clipping %, contrast ratio, estimated color temperature', count:d.pixel_analyzed},
-      {n:'03', name:'DINOv2', tech:'PyTorch \u00B7 Meta FAIR \u00B7 ViT-B/14', desc:'Self-supervised vision transformer. 768-dim embeddings capturing composition, texture, spatial layout. The artistic eye of similarity search', count:d.vector_count},
-      {n:'04', name:'SigLIP', tech:'PyTorch \u00B7 Google \u00B7 ViT-B/16', desc:'Sigmoid-loss image-language pre-training. 768-dim embeddings enabling text-to-image search across the entire collection', count:d.vector_count},
-      {n:'05', name:'CLIP', tech:'PyTorch \u00B7 OpenAI \u00B7 ViT-B/32', desc:'Contrastive language-image pre-training. 512-dim embeddings for cross-modal matching, duplicate detection, subject similarity', count:d.vector_count},
-      {n:'06', name:'YuNet', tech:'OpenCV DNN \u00B7 ONNX \u00B7 C++', desc:'Lightweight face detector. ' + fmt(d.face_total) + ' faces detected across ' + fmt(sigFD.images) + ' images with bounding box coordinates and confidence scores', count: sigFD.processed || sigFD.images},
-      {n:'07', name:'YOLOv8n', tech:'PyTorch \u00B7 Ultralytics \u00B7 COCO', desc:'Real-time object detection. ' + fmt(sigOD.rows) + ' objects detected across 80 COCO classes with bounding boxes and confidence thresholds', count: sigOD.processed || sigOD.images},
-      {n:'08', name:'NIMA', tech:'PyTorch \u00B7 TensorFlow origin \u00B7 MobileNet', desc:'Neural Image Assessment. Aesthetic quality scoring on 1\u201310 scale. Collection avg: ' + (d.aesthetic_avg || 0).toFixed(1) + ', range ' + (d.aesthetic_min || 0).toFixed(1) + '\u2013' + (d.aesthetic_max || 0).toFixed(1), count:d.aesthetic_count},
-      {n:'09', name:'Depth Anything v2', tech:'PyTorch \u00B7 Hugging Face \u00B7 ViT', desc:'Monocular depth estimation. Near/mid/far zone percentages and depth complexity score per image. No stereo pair needed', count:d.depth_count},
-      {n:'10', name:'Places365', tech:'PyTorch \u00B7 MIT CSAIL \u00B7 ResNet-50', desc:'Scene classification across 365 environment categories. Top-3 predictions + indoor/outdoor environment label per image', count:d.scene_count},
-      {n:'11', name:'Style Net', tech:'PyTorch \u00B7 Custom classifier', desc:'Photographic style classification: street, portrait, landscape, architecture, macro, abstract, documentary, still life', count:d.style_count},
-      {n:'12', name:'BLIP', tech:'PyTorch \u00B7 Salesforce \u00B7 ViT+LLM', desc:'Bootstrapped Language-Image Pre-training. Natural language captions generated per image for search and accessibility', count:d.caption_count},
-      {n:'13', name:'EasyOCR', tech:'PyTorch \u00B7 CRAFT + CRNN', desc:'Text detection and recognition. ' + fmt(d.ocr_texts || 0) + ' text regions found across ' + fmt(d.ocr_images || 0) + ' images. English language model on CPU', count:d.ocr_images || 0},
-      {n:'14', name:'Facial Emotions', tech:'PyTorch \u00B7 FER \u00B7 CNN', desc:'Emotion recognition on detected faces. 7 classes: angry, disgust, fear, happy, sad, surprise, neutral', count:d.emotion_count || 0},
-      {n:'15', name:'Enhancement Engine', tech:'Python \u00B7 Pillow \u00B7 Camera-aware', desc:'6-step per-image editing pipeline: white balance, exposure, shadows/highlights, contrast, saturation, sharpening. Parameters derived from pixel analysis + camera body', count:d.enhancement_count},
-      {n:'16', name:'K-means LAB', tech:'Python \u00B7 scikit-learn \u00B7 LAB space', desc:'Dominant color extraction via K-means clustering in perceptually uniform CIELAB space. ' + fmt(sigDC.rows) + ' color clusters with names mapped from nearest CSS4 colors', count:sigDC.images},
-      {n:'17', name:'EXIF Parser', tech:'Python \u00B7 Pillow \u00B7 piexif', desc:'Full metadata extraction: camera body, lens, ISO, shutter speed, aperture, focal length, date/time, GPS coordinates (' + fmt(d.exif_gps || 0) + ' geolocated)', count:sigEX.images}
-    ];
-    var elHtml = models.map(function(m) {
-      var pctVal = d.total > 0 ? (m.count / d.total * 100) : 0;
+    var totalFmt = fmt(d.total);
+    el("el-sub").textContent = totalFmt + " images \u00D7 17 models = " + fmt(d.total_signals || 0) + " signals \u2014 " + mc + " complete";
+    var elHtml = new Array(EL_MODELS.length);
+    for (var mi = 0; mi < EL_MODELS.length; mi++) {
+      var m = EL_MODELS[mi];
+      var count = typeof m.count === "function" ? m.count(d) : d[m.count];
+      var desc = typeof m.desc === "function" ? m.desc(d) : m.desc;
+      var pctVal = d.total > 0 ? (count / d.total * 100) : 0;
+      var countFmt = fmt(count);
       var status = pctVal >= 99.5 ? 'done' : pctVal > 0 ? 'active' : 'pending';
-      var bdg = status === 'done' ? '<span class="el-badge done">\u2713</span>' :
-                status === 'active' ? '<span class="el-badge active">' + pctVal.toFixed(0) + '%</span>' :
-                '<span class="el-badge pending">\u2014</span>';
-      return '<div class="el-card status-' + status + '">' +
-        '<div class="el-num">' + m.n + '</div>' +
-        '<div class="el-model">' + m.name + '</div>' +
-        '<div class="el-tech">' + m.tech + '</div>' +
-        '<div class="el-desc">' + m.desc + '</div>' +
-        '<div class="el-count">' + fmt(m.count) + ' ' + bdg + '</div>' +
-        '<div class="el-bar"><div class="el-fill" style="width:' + Math.min(pctVal, 100) + '%"></div></div>' +
-        '<div class="el-pct">' + fmt(m.count) + ' / ' + fmt(d.total) + '</div>' +
+      var bdg = status === 'active' ? '<span class="el-badge active">' + pctVal.toFixed(0) + '%</span>' : EL_BADGE[status];
+      elHtml[mi] = '<div class="el-card status-' + status + '">' + m.head +
+        '<div class="el-desc">' + desc + '</div>' +
+        '<div class="el-count">' + countFmt + ' ' + bdg + '</div>' +
+        '<div class="el-bar"><div class="el-fill" style="transform:scaleX(' + Math.min(pctVal, 100) / 100 + ')"></div></div>' +
+        '<div class="el-pct">' + countFmt + ' / ' + totalFmt + '</div>' +
         '</div>';
-    }).join('');
-    el('el-grid').innerHTML = elHtml;
+    }
+    setHtml('el-grid', elHtml.join(''));
 
     /* ── Camera fleet ── */
-    el("tbl-cameras").innerHTML = rows(d.cameras, [
-      {key: "body"},
-      {key: "count", cls: "num"},
-      {key: "medium"},
-      {key: "film"},
-      {key: "luminance", cls: "num"},
-      {fn: function(r) {
-        var cls = r.wb_r > 0.05 ? "wb-pos" : r.wb_r < -0.05 ? "wb-neg" : "wb-zero";
-        return '<span class="' + cls + '">' + (r.wb_r > 0 ? "+" : "") + r.wb_r.toFixed(3) + '</span>';
-      }, cls: "num"},
-      {fn: function(r) {
-        var cls = r.wb_b < -0.05 ? "wb-neg" : r.wb_b > 0.05 ? "wb-pos" : "wb-zero";
-        return '<span class="' + cls + '">' + (r.wb_b > 0 ? "+" : "") + r.wb_b.toFixed(3) + '</span>';
-      }, cls: "num"},
-      {key: "noise", cls: "num"},
-      {fn: function(r) { return r.shadow.toFixed(1) + "%"; }, cls: "num"}
-    ]);
+    if (changed("cameras", d.cameras)) setHtml("tbl-cameras", rows(d.cameras, CAMERA_COLS));
 
     /* Signal extraction table removed — data shown in model cards */
 
     /* ── Signals (flat inline layout, leaf categories removed) ── */
 
     /* Scene & Setting — teal family */
-    setTagRow('pills-scene-all',
-      tagHtml(d.top_scenes, 'scene', 'scene') +
-      tagHtml(d.scene_environments, 'home', 'scene-env') +
-      tagHtml(d.settings, 'scene', 'scene-set') +
-      tagHtml(d.top_objects || [], 'eye', 'scene-obj') +
-      tagHtml(d.location_sources, 'pin', 'scene-loc'));
+    if (changed("scene", [d.top_scenes, d.scene_environments, d.settings, d.top_objects, d.location_sources]))
+      setTagRow('pills-scene-all', [].concat(
+        tagItems(d.top_scenes, 'scene', 'scene'),
+        tagItems(d.scene_environments, 'home', 'scene-env'),
+        tagItems(d.settings, 'scene', 'scene-set'),
+        tagItems(d.top_objects || [], 'eye', 'scene-obj'),
+        tagItems(d.location_sources, 'pin', 'scene-loc')));
 
     /* Visual Style — purple family (no cast / temp / exposure) */
-    setTagRow('pills-style-all',
-      tagHtml(d.vibes, 'sparkle', 'style') +
-      tagHtml(d.top_emotions || [], 'sparkle', 'style-emo') +
-      tagHtml(d.grading, 'star', 'style-grad') +
-      tagHtml(d.top_styles || [], 'sparkle', 'style-cls') +
-      colorTagHtml(d.top_color_names || []));
+    if (changed("style", [d.vibes, d.top_emotions, d.grading, d.top_styles, d.top_color_names]))
+      setTagRow('pills-style-all', [].concat(
+        tagItems(d.vibes, 'sparkle', 'style'),
+        tagItems(d.top_emotions || [], 'sparkle', 'style-emo'),
+        tagItems(d.grading, 'star', 'style-grad'),
+        tagItems(d.top_styles || [], 'sparkle', 'style-cls'),
+        colorTagItems(d.top_color_names || [])));
 
     /* Structure — composition only (no depth zones / complexity / aspect ratio) */
-    setTagRow('pills-structure-all',
-      tagHtml(d.composition, 'frame', 'depth-comp'));
+    if (changed("structure", d.composition))
+      setTagRow('pills-structure-all',
+        tagItems(d.composition, 'frame', 'depth-comp'));
 
     /* Context — camera + time only (no enhancement / rotation) */
-    setTagRow('pills-context-all',
-      tagHtml(d.subcategories, 'film', 'camera') +
-      tagHtml(d.time_of_day, 'sunset', 'camera-time'));
+    if (changed("context", [d.subcategories, d.time_of_day]))
+      setTagRow('pills-context-all', [].concat(
+        tagItems(d.subcategories, 'film', 'camera'),
+        tagItems(d.time_of_day, 'sunset', 'camera-time')));
 
     /* ── Vector store ── */
-    el("vector-info").innerHTML =
+    setHtml("vector-info",
       fmt(d.vector_count) + ' images \u00D7 3 models \u2014 ' + d.vector_size + ' on disk' +
       (d.vector_count >= d.total ? ' \u2014 <span class="badge done">complete</span>' :
        d.vector_count > 0 ? ' \u2014 <span class="badge partial">' + (d.vector_count / d.total * 100).toFixed(1) + '%</span>' :
-       ' \u2014 <span class="badge empty">not started</span>');
+       ' \u2014 <span class="badge empty">not started</span>'));
 
     /* ── Render tiers ── */
-    el("tbl-tiers").innerHTML = d.tiers.map(function(t) {
-      return "<tr><td>" + t.name + "</td><td class='num'>" + fmt(t.count) + "</td><td class='num'>" + t.size_human + "</td></tr>";
-    }).join("\n");
+    if (changed("tiers", d.tiers)) {
+      var tierRows = new Array(d.tiers.length);
+      for (var ti = 0; ti < d.tiers.length; ti++) {
+        var t = d.tiers[ti];
+        tierRows[ti] = [t.name, fmt(t.count), t.size_human];
+      }
+      syncRows("tbl-tiers", "tr", "", "td", TIER_CELLS, tierRows);
+    }
 
     /* ── Disk / Storage ── */
-    var diskHtml = '';
-    diskHtml += '<div class="disk-item"><div class="di-val">' + d.total_rendered_human + '</div><div class="di-label">Rendered tiers</div></div>';
-    diskHtml += '<div class="disk-item"><div class="di-val">' + d.db_size + '</div><div class="di-label">Database</div></div>';
-    diskHtml += '<div class="disk-item"><div class="di-val">' + d.vector_size + '</div><div class="di-label">Vectors (LanceDB)</div></div>';
+    var diskItems = [
+      [d.total_rendered_human, 'Rendered tiers'],
+      [d.db_size, 'Database'],
+      [d.vector_size, 'Vectors (LanceDB)']
+    ];
     if (d.web_photo_count > 0) {
-      diskHtml += '<div class="disk-item"><div class="di-val">' + d.web_json_size + '</div><div class="di-label">Web gallery (' + fmt(d.web_photo_count) + ' photos)</div></div>';
+      diskItems.push([d.web_json_size, 'Web gallery (' + fmt(d.web_photo_count) + ' photos)']);
     }
-    el("disk-info").innerHTML = diskHtml;
+    syncRows("disk-info", "div", "disk-item", "div", DISK_CELLS, diskItems);
 
     /* ── Pipeline runs ── */
-    el("tbl-runs").innerHTML = rows(d.runs, [
-      {key: "phase"}, {key: "status"}, {key: "ok", cls: "num"},
-      {key: "failed", cls: "num"}, {key: "started"}
-    ]);
+    if (changed("runs", d.runs)) setHtml("tbl-runs", rows(d.runs, RUN_COLS));
 
     /* ── Sample JSON ── */
-    var sampleEl = el("sample-json");
     var sampleMeta = el("sample-meta");
     if (d.sample && d.sample.data) {
       sampleMeta.textContent = d.sample.uuid + " \u2014 analyzed " + d.sample.time;
-      sampleEl.innerHTML = syntaxHighlight(JSON.stringify(d.sample.data, null, 2));
+      var sampleSrc = JSON.stringify(d.sample.data, null, 2);
+      if (sampleSrc !== prevSample) setHtml("sample-json", syntaxHighlight(sampleSrc));
+      prevSample = sampleSrc;
     } else {
       sampleMeta.textContent = "";
-      sampleEl.textContent = "No analyses yet";
+      setHtml("sample-json", "No analyses yet");
+      prevSample = null;
     }
-
-    prevTime = now;
-    prev = d;
   }
 
+  /* One pass over JSON.stringify output: strings (keys when followed by ':'),
+     numbers and literals become spans, everything else is copied through.
+     Only string tokens can hold & < >, so only they are HTML-escaped */
+  var HTML_ESC = {"&": "&amp;", "<": "&lt;", ">": "&gt;"};
+  function escChar(ch) { return HTML_ESC[ch]; }
+  function isDigit(c) { return c >= 48 && c <= 57; }
   function syntaxHighlight(json) {
-    json = json.replace(/&/g, "&amp;").replace(/</g, "&lt;").replace(/>/g, "&gt;");
-    return json.replace(
-      /("(\\u[a-zA-Z0-9]{4}|\\[^u]|[^\\"])*"(\s*:)?|\b(true|false|null)\b|-?\d+(?:\.\d*)?(?:[eE][+\-]?\d+)?)/g,
-      function(match) {
-        var cls = "json-num";
-        if (/^"/.test(match)) {
-          cls = /:$/.test(match) ? "json-key" : "json-str";
-        } else if (/true|false/.test(match)) {
-          cls = "json-bool";
-        } else if (/null/.test(match)) {
-          cls = "json-null";
+    var out = [], n = json.length, i = 0, last = 0;
+    while (i < n) {
+      var c = json.charCodeAt(i), j = i, cls;
+      if (c === 34) {
+        j++;
+        while (j < n && json.charCodeAt(j) !== 34) j += json.charCodeAt(j) === 92 ? 2 : 1;
+        var k = ++j;
+        while (k < n && (json.charCodeAt(k) === 32 || json.charCodeAt(k) === 10 || json.charCodeAt(k) === 13 || json.charCodeAt(k) === 9)) k++;
+        if (json.charCodeAt(k) === 58) { cls = "json-key"; j = k + 1; } else cls = "json-str";
+      } else if (isDigit(c) || (c === 45 && isDigit(json.charCodeAt(i + 1)))) {
+        j++;
+        while (isDigit(json.charCodeAt(j))) j++;
+        if (json.charCodeAt(j) === 46) { j++; while (isDigit(json.charCodeAt(j))) j++; }
+        c = json.charCodeAt(j);
+        if (c === 101 || c === 69) {
+          var e = j + 1;
+          c = json.charCodeAt(e);
+          if (c === 43 || c === 45) e++;
+          if (isDigit(json.charCodeAt(e))) { j = e; while (isDigit(json.charCodeAt(j))) j++; }
         }
-        return '<span class="' + cls + '">' + match + '</span>';
-      }
-    );
+        cls = "json-num";
+      } else if (json.startsWith("true", i)) { j += 4; cls = "json-bool"; }
+      else if (json.startsWith("false", i)) { j += 5; cls = "json-bool"; }
+      else if (json.startsWith("null", i)) { j += 4; cls = "json-null"; }
+      else { i++; continue; }
+      if (last < i) out.push(json.slice(last, i));
+      var tok = json.slice(i, j);
+      out.push('<span class="' + cls + '">', tok.charCodeAt(0) === 34 ? tok.replace(/[&<>]/g, escChar) : tok, '</span>');
+      i = last = j;
+    }
+    if (last < n) out.push(json.slice(last));
+    return out.join("");
   }
 
+  /* A revalidated (304) response hands back the same body: skip it whole */
+  var prevBody = null;
   function poll() {
-    fetch(API).then(function(r) { return r.json(); }).then(update)
-      .catch(function() {});
-  }
-
-  if (API === "inline") {
-    update(%%INLINE_DATA%%);
-  } else {
-    poll();
-    setInterval(poll, POLL);
-  }
+    fetch(API).then(function(r) { return r.text(); }).then(function(body) {
+      if (body === prevBody) return;
+      prevBody = body;
+      update(JSON.parse(body));
+    }).catch(function() {});
+  }
+
+  /* Stats embedded by the server render on first paint; polling only refreshes them.
+     They ship as JSON text: JSON.parse is much cheaper than parsing a JS literal */
+  var initial = JSON.parse(el("boot-data").textContent);
+  if (initial) applyUpdate(initial);
+  /* Hidden tabs stop polling; one immediate poll catches up when shown again */
+  function schedule() {
+    setTimeout(function() {
+      if (!document.hidden) poll();
+      schedule();
+    }, POLL);
+  }
+  if (API !== "inline") {
+    if (!initial) poll();
+    schedule();
+  }
+  document.addEventListener("visibilitychange", function() {
+    document.documentElement.classList.toggle("tab-hidden", document.hidden);
+    if (!document.hidden && API !== "inline") poll();
+  });
 
   /* ── Scroll spy ── */
   (function() {
@@ -2415,17 +2966,22 @@ PAGE_HTML = r"""<!DOCTYPE html>
       var sec = document.getElementById(id);
       if (sec) sections.push({el: sec, a: a});
     });
-    function onScroll() {
-      var scrollY = window.scrollY;
-      var current = null;
-      sections.forEach(function(s) {
-        if (s.el.offsetTop - 120 <= scrollY) current = s;
+    /* Highlight the first section crossing a band just below the top of the
+       viewport; the observer reports crossings without any layout reads */
+    var inBand = new Set();
+    var io = new IntersectionObserver(function(entries) {
+      entries.forEach(function(e) {
+        if (e.isIntersecting) inBand.add(e.target); else inBand.delete(e.target);
       });
-      sectionLinks.forEach(function(a) { a.classList.remove('active'); });
-      if (current) current.a.classList.add('active');
-    }
-    window.addEventListener('scroll', onScroll);
-    onScroll();
+      for (var i = 0; i < sections.length; i++) {
+        if (inBand.has(sections[i].el)) {
+          sectionLinks.forEach(function(a) { a.classList.remove('active'); });
+          sections[i].a.classList.add('active');
+          return;
+        }
+      }
+    }, {rootMargin: '-120px 0px -70% 0px'});
+    sections.forEach(function(s) { io.observe(s.el); });
   })();
 })();
 </script>
@@ -2433,17 +2989,40 @@ PAGE_HTML = r"""<!DOCTYPE html>
 </html>"""
 
 
+# Signal pill rows (filled by applyUpdate() via setTagRow) and vector model cards
+_SIGNAL_GROUPS = (
+    ("scene", "Scene & Setting"),
+    ("style", "Visual Style"),
+    ("structure", "Structure"),
+    ("context", "Context"),
+)
+_VECTOR_MODELS = (
+    ("DINOv2", 768, "Self-supervised vision transformer. Sees composition, texture, spatial layout. The artistic eye."),
+    ("SigLIP", 768, "Multimodal image-text model. Sees meaning, enables text search. The semantic brain."),
+    ("CLIP", 512, "Subject matching model. Finds duplicates and similar scenes. The pattern matcher."),
+)
+PAGE_HTML = PAGE_HTML.replace("%%SIGNAL_GROUPS%%", "\n".join(
+    f"""  <div class="signal-group">
+    <div class="signal-group-label">{label}</div>
+    <div id="pills-{key}-all" class="tag-row"></div>
+  </div>"""
+    for key, label in _SIGNAL_GROUPS
+)).replace("%%VECTOR_MODEL_CARDS%%", "\n".join(
+    f"""    <div class="model-card">
+      <div class="mc-name">{name}</div>
+      <div class="mc-dim">{dims} dimensions</div>
+      <div class="mc-desc">{desc}</div>
+    </div>"""
+    for name, dims, desc in _VECTOR_MODELS
+))
+
+
 # ---------------------------------------------------------------------------
 # Shared page shell (sidebar + layout for all sub-pages)
 # ---------------------------------------------------------------------------
 
-def page_shell(title, content, active="", extra_css="", extra_js=""):
-    # type: (str, str, str, str, str) -> str
-    """Wrap content in the shared sidebar + main layout."""
-    def _active(page):
-        return ' class="active"' if page == active else ''
-
-    return f"""<!DOCTYPE html>
+# Static chrome shared by every page_shell() page, built once at import
+_SHELL_HEAD = """<!DOCTYPE html>
 <html lang="en" data-theme="light">
 <head>
 <meta charset="utf-8">
@@ -2451,7 +3030,7 @@ def page_shell(title, content, active="", extra_css="", extra_js=""):
 <title>MADphotos Dashboard</title>
 <link rel="icon" href="data:image/svg+xml,<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 100 100'><circle cx='50' cy='50' r='45' fill='%23111'/></svg>">
 <style>
-  :root {{
+  :root {
     --font-sans: -apple-system, BlinkMacSystemFont, "SF Pro Text", "Helvetica Neue", system-ui, sans-serif;
     --font-display: -apple-system, BlinkMacSystemFont, "SF Pro Display", "Helvetica Neue", system-ui, sans-serif;
     --font-mono: "SF Mono", ui-monospace, "Cascadia Code", monospace;
@@ -2466,167 +3045,212 @@ def page_shell(title, content, active="", extra_css="", extra_js=""):
     --tracking-tight: -0.01em; --tracking-caps: 0.06em;
     --duration-fast: 150ms; --ease-default: cubic-bezier(0.25, 0.1, 0.25, 1);
     --apple-purple: #AF52DE; --apple-pink: #FF2D55; --apple-orange: #FF9500;
-  }}
-  [data-theme="light"] {{
+  }
+  [data-theme="light"] {
     --bg: #F5F5F7; --bg-secondary: #FFFFFF; --fg: #1D1D1F;
     --fg-secondary: #3A3A3C; --muted: #86868B;
     --border: rgba(0,0,0,0.08); --border-strong: rgba(0,0,0,0.14);
     --card-bg: #FFFFFF; --sidebar-bg: #FFFFFF;
     --sidebar-active-bg: rgba(0,0,0,0.04); --hover-overlay: rgba(0,0,0,0.03);
     color-scheme: light;
-  }}
-  [data-theme="dark"] {{
+  }
+  [data-theme="dark"] {
     --bg: #1C1C1E; --bg-secondary: #2C2C2E; --fg: #F5F5F7;
     --fg-secondary: #D1D1D6; --muted: #98989D;
     --border: rgba(255,255,255,0.08); --border-strong: rgba(255,255,255,0.14);
     --card-bg: #2C2C2E; --sidebar-bg: #2C2C2E;
     --sidebar-active-bg: rgba(255,255,255,0.06); --hover-overlay: rgba(255,255,255,0.04);
     color-scheme: dark;
-  }}
-  @keyframes ai-gradient {{
-    0% {{ background-position: 0% 50%; }}
-    50% {{ background-position: 100% 50%; }}
-    100% {{ background-position: 0% 50%; }}
-  }}
-  @keyframes fade-up {{
-    from {{ opacity: 0; transform: translateY(12px); }}
-    to {{ opacity: 1; transform: translateY(0); }}
-  }}
-  html {{ scroll-behavior: smooth; }}
-  *, *::before, *::after {{ margin: 0; padding: 0; box-sizing: border-box; }}
-  body {{
+  }
+  @keyframes ai-gradient {
+    0% { background-position: 0% 50%; }
+    50% { background-position: 100% 50%; }
+    100% { background-position: 0% 50%; }
+  }
+  @keyframes fade-up {
+    from { opacity: 0; transform: translateY(12px); }
+    to { opacity: 1; transform: translateY(0); }
+  }
+  html { scroll-behavior: smooth; }
+  *, *::before, *::after { margin: 0; padding: 0; box-sizing: border-box; }
+  body {
     font-family: var(--font-sans); font-size: var(--text-base);
     line-height: var(--leading-normal); background: var(--bg); color: var(--fg);
     display: flex; min-height: 100vh;
     -webkit-font-smoothing: antialiased;
-  }}
-  .sidebar {{
+  }
+  .sidebar {
     width: var(--sidebar-w); min-width: var(--sidebar-w);
     background: var(--sidebar-bg); border-right: 1px solid var(--border);
     padding: var(--space-5) 0; position: sticky; top: 0; height: 100vh;
     overflow-y: auto; display: flex; flex-direction: column;
     transition: width var(--duration-normal) var(--ease-default),
                 min-width var(--duration-normal) var(--ease-default);
-  }}
-  .sidebar::after {{
+  }
+  .sidebar::after {
     content: '';
     position: absolute; top: 0; right: 0; width: 2px; height: 100%;
     background: linear-gradient(180deg, var(--apple-blue) 0%, var(--apple-purple) 35%, var(--apple-pink) 65%, var(--apple-orange) 100%);
     opacity: 0.35; background-size: 100% 300%; animation: ai-gradient 8s ease infinite;
-  }}
-  .sidebar .sb-title {{
+  }
+  .sidebar .sb-title {
     font-family: var(--font-display); font-size: var(--text-lg); font-weight: 700;
     letter-spacing: var(--tracking-tight); padding: 0 var(--space-5) var(--space-4);
     border-bottom: 1px solid var(--border); margin-bottom: var(--space-2);
-  }}
-  .sidebar a {{
+  }
+  .sidebar a {
     display: flex; align-items: center; gap: var(--space-2);
     padding: var(--space-2) var(--space-5); color: var(--muted);
     text-decoration: none; font-size: var(--text-sm);
     transition: background var(--duration-fast) var(--ease-default),
                 color var(--duration-fast) var(--ease-default);
-  }}
-  .sidebar a:hover {{ background: var(--sidebar-active-bg); color: var(--fg); }}
-  .sidebar a.active {{
+  }
+  .sidebar a:hover { background: var(--sidebar-active-bg); color: var(--fg); }
+  .sidebar a.active {
     color: var(--fg); font-weight: 600; background: var(--sidebar-active-bg);
-  }}
-  .sidebar a.sb-sub {{ padding-left: var(--space-8); font-size: var(--text-xs); }}
-  .sidebar .sb-sep {{ height: 1px; background: var(--border); margin: var(--space-2) var(--space-5); }}
-  .sidebar .sb-group {{
+  }
+  .sidebar a.sb-sub { padding-left: var(--space-8); font-size: var(--text-xs); }
+  .sidebar .sb-sep { height: 1px; background: var(--border); margin: var(--space-2) var(--space-5); }
+  .sidebar .sb-group {
     font-size: var(--text-xs); font-weight: 600; text-transform: uppercase;
     letter-spacing: var(--tracking-caps); color: var(--muted);
     padding: var(--space-3) var(--space-5) var(--space-1);
-  }}
-  .sidebar .sb-bottom {{
+  }
+  .sidebar .sb-bottom {
     margin-top: auto; padding: var(--space-3) var(--space-5);
     border-top: 1px solid var(--border);
-  }}
-  .theme-toggle {{
+  }
+  .theme-toggle {
     display: flex; align-items: center; gap: var(--space-2);
     font-size: var(--text-sm); color: var(--muted); cursor: pointer;
     padding: var(--space-2) 0; background: none; border: none;
     font-family: inherit; width: 100%;
     transition: color var(--duration-fast);
-  }}
-  .theme-toggle:hover {{ color: var(--fg); }}
-  .theme-toggle .theme-icon {{ font-size: 16px; }}
-  .sb-collapse {{
+  }
+  .theme-toggle:hover { color: var(--fg); }
+  .theme-toggle .theme-icon { font-size: 16px; }
+  .sb-collapse {
     display: flex; align-items: center; gap: var(--space-2);
     font-size: var(--text-sm); color: var(--muted); cursor: pointer;
     padding: var(--space-2) 0; background: none; border: none;
     font-family: inherit; width: 100%; transition: color var(--duration-fast);
     margin-bottom: var(--space-2); white-space: nowrap; overflow: hidden;
-  }}
-  .sb-collapse:hover {{ color: var(--fg); }}
-  .sb-expand {{
+  }
+  .sb-collapse:hover { color: var(--fg); }
+  .sb-expand {
     display: none; position: fixed; top: var(--space-4); left: var(--space-4);
     z-index: 50; width: 36px; height: 36px; border-radius: var(--radius-sm);
     border: 1px solid var(--border); background: var(--card-bg);
     cursor: pointer; color: var(--muted); box-shadow: 0 2px 8px rgba(0,0,0,0.1);
     align-items: center; justify-content: center; font-size: 18px;
     transition: color var(--duration-fast), box-shadow var(--duration-fast);
-  }}
-  .sb-expand:hover {{ color: var(--fg); box-shadow: 0 4px 16px rgba(0,0,0,0.15); }}
-  body.sb-collapsed .sidebar {{ width: 0; min-width: 0; overflow: hidden; padding: 0; border-right: none; }}
-  body.sb-collapsed .sb-expand {{ display: flex; }}
-  .sb-hamburger {{
+  }
+  .sb-expand:hover { color: var(--fg); box-shadow: 0 4px 16px rgba(0,0,0,0.15); }
+  body.sb-collapsed .sidebar { width: 0; min-width: 0; overflow: hidden; padding: 0; border-right: none; }
+  body.sb-collapsed .sb-expand { display: flex; }
+  .sb-hamburger {
     display: none; align-items: center; justify-content: center;
     width: 36px; height: 36px; background: none; border: none;
     cursor: pointer; color: var(--fg); font-size: 20px;
     border-radius: var(--radius-sm); flex-shrink: 0;
-  }}
-  .main-content {{
+  }
+  .main-content {
     flex: 1; padding: var(--space-10) var(--space-8);
     max-width: 900px; min-width: 0; margin: 0 auto;
     animation: fade-up 0.5s var(--ease-default) both;
-  }}
-  @media (max-width: 900px) {{
-    body {{ flex-direction: column; }}
-    body.sb-collapsed .sidebar {{
+  }
+  @media (max-width: 900px) {
+    body { flex-direction: column; }
+    body.sb-collapsed .sidebar {
       width: 100%; min-width: unset; overflow: visible; padding: var(--space-2) var(--space-3);
       border-right: none; border-bottom: 1px solid var(--border);
-    }}
-    body.sb-collapsed .sb-expand {{ display: none; }}
-    .sb-collapse {{ display: none !important; }}
-    .sidebar {{ width: 100%; min-width: unset; height: auto; position: sticky; top: 0;
+    }
+    body.sb-collapsed .sb-expand { display: none; }
+    .sb-collapse { display: none !important; }
+    .sidebar { width: 100%; min-width: unset; height: auto; position: sticky; top: 0;
                z-index: 100; border-right: none; border-bottom: 1px solid var(--border);
                flex-direction: row; flex-wrap: wrap; padding: var(--space-2) var(--space-3);
                backdrop-filter: blur(20px); -webkit-backdrop-filter: blur(20px);
-               background: color-mix(in srgb, var(--sidebar-bg) 85%, transparent); }}
-    .sidebar .sb-title {{ width: auto; border-bottom: none; padding: 0 var(--space-2) 0 0; margin-bottom: 0; font-size: var(--text-base); }}
-    .sb-hamburger {{ display: flex; margin-left: auto; }}
-    .sidebar > a, .sidebar .sb-group, .sidebar .sb-sep, .sidebar .sb-bottom {{ display: none; }}
-    .sidebar.open > a {{ display: flex; width: 100%; }}
-    .sidebar.open .sb-sep {{ display: block; width: 100%; }}
-    .sidebar.open .sb-bottom {{ display: block; width: 100%; }}
-    .main-content {{ padding: var(--space-6); }}
-  }}
-  h1 {{ font-family: var(--font-display); font-size: var(--text-3xl); font-weight: 700;
-       letter-spacing: var(--tracking-tight); margin-bottom: var(--space-2); }}
-  h2 {{ font-family: var(--font-display); font-size: var(--text-xl); font-weight: 700;
+               background: color-mix(in srgb, var(--sidebar-bg) 85%, transparent); }
+    .sidebar .sb-title { width: auto; border-bottom: none; padding: 0 var(--space-2) 0 0; margin-bottom: 0; font-size: var(--text-base); }
+    .sb-hamburger { display: flex; margin-left: auto; }
+    .sidebar > a, .sidebar .sb-group, .sidebar .sb-sep, .sidebar .sb-bottom { display: none; }
+    .sidebar.open > a { display: flex; width: 100%; }
+    .sidebar.open .sb-sep { display: block; width: 100%; }
+    .sidebar.open .sb-bottom { display: block; width: 100%; }
+    .main-content { padding: var(--space-6); }
+  }
+  h1 { font-family: var(--font-display); font-size: var(--text-3xl); font-weight: 700;
+       letter-spacing: var(--tracking-tight); margin-bottom: var(--space-2); }
+  h2 { font-family: var(--font-display); font-size: var(--text-xl); font-weight: 700;
        margin: var(--space-8) 0 var(--space-3); color: var(--fg);
-       border-bottom: 1px solid var(--border); padding-bottom: var(--space-2); }}
-  h3 {{ font-size: var(--text-lg); font-weight: 600; margin: var(--space-6) 0 var(--space-2); color: var(--fg); }}
-  h4 {{ font-size: var(--text-base); font-weight: 600; margin: var(--space-4) 0 var(--space-2); color: var(--muted); }}
-  p {{ font-size: var(--text-sm); margin: var(--space-2) 0; line-height: var(--leading-relaxed); }}
-  ul {{ font-size: var(--text-sm); margin: var(--space-2) 0 var(--space-2) var(--space-5); }}
-  li {{ margin: var(--space-1) 0; }}
-  table {{ width: 100%; border-collapse: collapse; font-size: var(--text-sm); margin: var(--space-3) 0 var(--space-4); }}
-  th {{ text-align: left; font-size: var(--text-xs); font-weight: 600; text-transform: uppercase;
+       border-bottom: 1px solid var(--border); padding-bottom: var(--space-2); }
+  h3 { font-size: var(--text-lg); font-weight: 600; margin: var(--space-6) 0 var(--space-2); color: var(--fg); }
+  h4 { font-size: var(--text-base); font-weight: 600; margin: var(--space-4) 0 var(--space-2); color: var(--muted); }
+  p { font-size: var(--text-sm); margin: var(--space-2) 0; line-height: var(--leading-relaxed); }
+  ul { font-size: var(--text-sm); margin: var(--space-2) 0 var(--space-2) var(--space-5); }
+  li { margin: var(--space-1) 0; }
+  table { width: 100%; border-collapse: collapse; font-size: var(--text-sm); margin: var(--space-3) 0 var(--space-4); }
+  th { text-align: left; font-size: var(--text-xs); font-weight: 600; text-transform: uppercase;
        letter-spacing: var(--tracking-caps); color: var(--muted);
-       border-bottom: 1px solid var(--border-strong); padding: var(--space-2) var(--space-3); }}
-  td {{ padding: var(--space-2) var(--space-3); border-bottom: 1px solid var(--border); }}
-  code {{ background: var(--hover-overlay); padding: 2px var(--space-2); font-size: var(--text-sm);
-         font-family: var(--font-mono); border-radius: var(--radius-sm); }}
-  strong {{ font-weight: 700; }}
-  a {{ color: var(--fg); }}
-  blockquote {{ font-size: var(--text-sm); color: var(--muted); border-left: 3px solid var(--border);
-               padding-left: var(--space-4); margin: var(--space-2) 0; font-style: normal; }}
-  footer {{ margin-top: var(--space-10); padding-top: var(--space-4);
-           border-top: 1px solid var(--border); font-size: var(--text-xs); color: var(--muted); }}
-  footer a {{ color: var(--muted); text-decoration: none; }}
-  {extra_css}
-</style>
+       border-bottom: 1px solid var(--border-strong); padding: var(--space-2) var(--space-3); }
+  td { padding: var(--space-2) var(--space-3); border-bottom: 1px solid var(--border); }
+  code { background: var(--hover-overlay); padding: 2px var(--space-2); font-size: var(--text-sm);
+         font-family: var(--font-mono); border-radius: var(--radius-sm); }
+  strong { font-weight: 700; }
+  a { color: var(--fg); }
+  blockquote { font-size: var(--text-sm); color: var(--muted); border-left: 3px solid var(--border);
+               padding-left: var(--space-4); margin: var(--space-2) 0; font-style: normal; }
+  footer { margin-top: var(--space-10); padding-top: var(--space-4);
+           border-top: 1px solid var(--border); font-size: var(--text-xs); color: var(--muted); }
+  footer a { color: var(--muted); text-decoration: none; }
+"""
+_head, _sep, _css = _SHELL_HEAD.partition("<style>\n")
+_SHELL_HEAD = _head + _sep + _minify_css(_css) + "\n"
+del _head, _sep, _css
+
+_SHELL_TAIL = """<footer>MADphotos &mdash; <a href="https://github.com/LAEH/MADphotos">github.com/LAEH/MADphotos</a></footer>
+</div>
+<script>
+(function() {
+  function getTheme() {
+    var s = localStorage.getItem('mad-theme');
+    if (s) return s;
+    return window.matchMedia && window.matchMedia('(prefers-color-scheme: dark)').matches ? 'dark' : 'light';
+  }
+  function applyTheme(t) {
+    document.documentElement.setAttribute('data-theme', t);
+    var icon = document.getElementById('themeIcon');
+    var label = document.getElementById('themeLabel');
+    if (icon) icon.textContent = t === 'dark' ? '\\u2600' : '\\u263E';
+    if (label) label.textContent = t === 'dark' ? 'Light Mode' : 'Dark Mode';
+  }
+  window.toggleTheme = function() {
+    var t = getTheme() === 'dark' ? 'light' : 'dark';
+    localStorage.setItem('mad-theme', t);
+    applyTheme(t);
+  };
+  window.toggleSidebar = function() {
+    document.body.classList.toggle('sb-collapsed');
+    localStorage.setItem('mad-sidebar', document.body.classList.contains('sb-collapsed') ? 'collapsed' : 'expanded');
+  };
+  applyTheme(getTheme());
+  if (localStorage.getItem('mad-sidebar') === 'collapsed') {
+    document.body.classList.add('sb-collapsed');
+  }
+})();
+</script>
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _shell_nav(active):
+    # type: (str) -> str
+    """Everything between the page CSS and the content, rendered once per active page."""
+    def _active(page):
+        return ' class="active"' if page == active else ''
+
+    return f"""</style>
 </head>
 <body>
 <button class="sb-expand" onclick="toggleSidebar()" title="Show sidebar">&#9776;</button>
@@ -2652,41 +3276,16 @@ def page_shell(title, content, active="", extra_css="", extra_js=""):
   </div>
 </nav>
 <div class="main-content">
-{content}
-<footer>MADphotos &mdash; <a href="https://github.com/LAEH/MADphotos">github.com/LAEH/MADphotos</a></footer>
-</div>
-<script>
-(function() {{
-  function getTheme() {{
-    var s = localStorage.getItem('mad-theme');
-    if (s) return s;
-    return window.matchMedia && window.matchMedia('(prefers-color-scheme: dark)').matches ? 'dark' : 'light';
-  }}
-  function applyTheme(t) {{
-    document.documentElement.setAttribute('data-theme', t);
-    var icon = document.getElementById('themeIcon');
-    var label = document.getElementById('themeLabel');
-    if (icon) icon.textContent = t === 'dark' ? '\\u2600' : '\\u263E';
-    if (label) label.textContent = t === 'dark' ? 'Light Mode' : 'Dark Mode';
-  }}
-  window.toggleTheme = function() {{
-    var t = getTheme() === 'dark' ? 'light' : 'dark';
-    localStorage.setItem('mad-theme', t);
-    applyTheme(t);
-  }};
-  window.toggleSidebar = function() {{
-    document.body.classList.toggle('sb-collapsed');
-    localStorage.setItem('mad-sidebar', document.body.classList.contains('sb-collapsed') ? 'collapsed' : 'expanded');
-  }};
-  applyTheme(getTheme());
-  if (localStorage.getItem('mad-sidebar') === 'collapsed') {{
-    document.body.classList.add('sb-collapsed');
-  }}
-}})();
-</script>
-{extra_js}
-</body>
-</html>"""
+"""
+
+
+def page_shell(title, content, active="", extra_css="", extra_js=""):
+    # type: (str, str, str, str, str) -> str
+    """Wrap content in the shared sidebar + main layout."""
+    return "".join([
+        _SHELL_HEAD, "  ", extra_css, "\n", _shell_nav(active),
+        content, "\n", _SHELL_TAIL, extra_js, "\n</body>\n</html>",
+    ])
 
 
 # ---------------------------------------------------------------------------
@@ -2695,7 +3294,112 @@ def page_shell(title, content, active="", extra_css="", extra_js=""):
 
 README_PATH = Path(__file__).resolve().parent / "README.md"
 
+# Rendered pages keyed by renderer name: (source mtime_ns, html)
+_RENDER_CACHE = {}  # type: dict[str, tuple[int, str]]
+
+
+def _cached_by_mtime(path):
+    # type: (Path) -> object
+    """Reuse a renderer's output until *path* changes (mtime 0 when missing)."""
+    def wrap(fn):
+        @functools.wraps(fn)
+        def render():
+            # type: () -> str
+            try:
+                mtime = path.stat().st_mtime_ns
+            except OSError:
+                mtime = 0
+            hit = _RENDER_CACHE.get(fn.__name__)
+            if hit is not None and hit[0] == mtime:
+                return hit[1]
+            html = fn()
+            _RENDER_CACHE[fn.__name__] = (mtime, html)
+            return html
+        return render
+    return wrap
+
+# Markdown patterns shared by the README and journal renderers
+_MD_HEADING_RE = re.compile(r'^(#{1,4})\s+(.*)')
+_MD_LINK_RE = re.compile(r'\[(.+?)\]\((.+?)\)')
+_MD_LINK_TEXT_RE = re.compile(r'\[(.+?)\]\(.+?\)')
+# Inline code, strong and emphasis in one scan; negated classes cannot backtrack
+_MD_INLINE_RE = re.compile(r'`([^`]+)`|\*\*([^*]+)\*\*|\*([^*]+)\*')
+_MD_TABLE_SEP_RE = re.compile(r'^[-:]+$')
+_MD_OLIST_RE = re.compile(r'^(\d+)\.\s+(.*)')
+_MD_BULLET_RE = re.compile(r'^[-*]\s+')
+
+
+def _md_inline_sub(m):
+    # type: (re.Match) -> str
+    code, strong, em = m.groups()
+    if code is not None:
+        return f'<code>{code}</code>'
+    # Strong/emphasis text may still hold a code span
+    if strong is not None:
+        return f'<strong>{_MD_INLINE_RE.sub(_md_inline_sub, strong)}</strong>'
+    return f'<em>{_MD_INLINE_RE.sub(_md_inline_sub, em)}</em>'
+
+
+def md_inline(text):
+    # type: (str) -> str
+    """Inline Markdown (`code`, **strong**, *em*) to HTML in a single pass."""
+    return _MD_INLINE_RE.sub(_md_inline_sub, text)
+
+
+_README_STYLE = """<style>
+  .inst-hero { text-align: center; margin-bottom: var(--space-8); padding: var(--space-8) 0 var(--space-4); }
+  .inst-hero h1 { font-size: 28px; font-weight: 800; letter-spacing: -0.02em; margin: 0; }
+  .inst-hero .hero-sub, .inst-hero p { font-size: var(--text-sm); color: var(--muted); margin-top: var(--space-2); max-width: 640px; margin-left: auto; margin-right: auto; line-height: var(--leading-relaxed); }
+  .inst-card {
+    background: var(--card-bg); border: 1px solid var(--border); border-radius: var(--radius-lg);
+    padding: var(--space-5) var(--space-6); margin-bottom: var(--space-4);
+    transition: border-color var(--duration-fast) var(--ease-default);
+  }
+  .inst-card:hover { border-color: var(--border-strong); }
+  .inst-card.inst-accent {
+    border-color: var(--apple-indigo);
+    background: linear-gradient(135deg, var(--card-bg) 0%, rgba(88,86,214,0.05) 100%);
+  }
+  .inst-card.inst-creative {
+    border-color: var(--apple-pink);
+    background: linear-gradient(135deg, var(--card-bg) 0%, rgba(255,55,95,0.04) 100%);
+  }
+  .inst-card.inst-status {
+    border-color: var(--apple-green);
+    background: linear-gradient(135deg, var(--card-bg) 0%, rgba(52,199,89,0.04) 100%);
+  }
+  .inst-card h2 { font-size: 16px; font-weight: 700; margin: 0 0 var(--space-3); letter-spacing: -0.01em; border-bottom: none; padding-bottom: 0; }
+  .inst-card h3 { font-size: 13px; font-weight: 600; margin: var(--space-4) 0 var(--space-2); color: var(--fg); }
+  .inst-card p, .inst-card li { font-size: var(--text-sm); color: var(--fg-secondary); line-height: var(--leading-relaxed); }
+  .inst-card ul { list-style: none; padding: 0; margin: var(--space-2) 0; }
+  .inst-card li { padding: var(--space-1) 0 var(--space-1) var(--space-4); position: relative; }
+  .inst-card li::before { content: "\\2014"; position: absolute; left: 0; color: var(--muted); }
+  .inst-card ol { padding-left: var(--space-5); margin: var(--space-2) 0; }
+  .inst-card ol li { padding: var(--space-1) 0; position: static; }
+  .inst-card ol li::before { content: none; }
+  .inst-card table { width: 100%; border-collapse: collapse; font-size: var(--text-xs); margin: var(--space-2) 0; }
+  .inst-card th, .inst-card td { padding: 6px 10px; text-align: left; border-bottom: 1px solid var(--border); }
+  .inst-card th { font-weight: 600; color: var(--fg); font-size: 11px; text-transform: uppercase; letter-spacing: 0.04em; }
+  .inst-card code { font-family: var(--font-mono); font-size: 0.88em; color: var(--apple-blue); }
+  .inst-pill {
+    display: inline-block; font-size: 10px; font-weight: 600; text-transform: uppercase;
+    letter-spacing: 0.05em; padding: 2px 8px; border-radius: var(--radius-full, 9999px);
+    margin-bottom: var(--space-2);
+  }
+  .inst-pill-orange { color: var(--apple-orange); background: color-mix(in srgb, var(--apple-orange) 12%, transparent); }
+  .inst-pill-pink { color: var(--apple-pink); background: color-mix(in srgb, var(--apple-pink) 12%, transparent); }
+  .inst-pill-blue { color: var(--apple-blue); background: color-mix(in srgb, var(--apple-blue) 12%, transparent); }
+  .inst-pill-teal { color: var(--apple-teal); background: color-mix(in srgb, var(--apple-teal) 12%, transparent); }
+  .app-trio { display: grid; grid-template-columns: repeat(3, 1fr); gap: var(--space-3); margin: var(--space-3) 0; }
+  .app-box { background: var(--hover-overlay); border-radius: var(--radius-md); padding: var(--space-3) var(--space-4); }
+  .app-box strong { display: block; font-size: 14px; margin-bottom: 4px; }
+  .app-box p { font-size: 12px; margin: 0; color: var(--muted); line-height: 1.5; }
+  @media (max-width: 700px) { .app-trio { grid-template-columns: 1fr; } }
+</style>
+"""
+
 
+@_cached_by_mtime(README_PATH)
 def render_readme():
     # type: () -> str
     """Read README.md and render a card-based styled HTML page matching System Instructions."""
@@ -2703,21 +3407,15 @@ def render_readme():
         return "<p>No README.md found.</p>"
     raw = README_PATH.read_text()
 
-    import re
-
-    def md_inline(text):
+    def md_link_inline(text):
         # type: (str) -> str
-        text = re.sub(r'\[(.+?)\]\((.+?)\)', r'<a href="\2">\1</a>', text)
-        text = re.sub(r'`(.+?)`', r'<code>\1</code>', text)
-        text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
-        text = re.sub(r'\*(.+?)\*', r'<em>\1</em>', text)
-        return text
+        return md_inline(_MD_LINK_RE.sub(r'<a href="\2">\1</a>', text))
 
     # Parse into sections: {heading, level, content_lines}
     sections = []  # type: list[dict]
     current = {"heading": "", "level": 0, "lines": []}  # type: dict
     for line in raw.split('\n'):
-        m = re.match(r'^(#{1,4})\s+(.*)', line)
+        m = _MD_HEADING_RE.match(line) if line[:1] == '#' else None
         if m:
             if current["heading"] or current["lines"]:
                 sections.append(current)
@@ -2730,7 +3428,11 @@ def render_readme():
     def render_block(content_lines):
         # type: (list[str]) -> str
         """Render a block of markdown lines to HTML."""
+        rendered = _markdown_html('\n'.join(content_lines))
+        if rendered is not None:
+            return rendered
         parts = []  # type: list[str]
+        add = parts.append
         in_table = False
         in_list = False
         in_olist = False
@@ -2738,61 +3440,62 @@ def render_readme():
             s = ln.strip()
             if not s:
                 if in_list:
-                    parts.append('</ul>')
+                    add('</ul>')
                     in_list = False
                 if in_olist:
-                    parts.append('</ol>')
+                    add('</ol>')
                     in_olist = False
                 if in_table:
-                    parts.append('</tbody></table>')
+                    add('</tbody></table>')
                     in_table = False
                 continue
+            # Dispatch on the first character; patterns only run for candidates
+            first = s[0]
             # Table
-            if s.startswith('|'):
+            if first == '|':
                 cells = [c.strip() for c in s.strip('|').split('|')]
-                if all(re.match(r'^[-:]+$', c) for c in cells):
+                if all(_MD_TABLE_SEP_RE.match(c) for c in cells):
                     continue
                 if not in_table:
-                    parts.append('<table><thead><tr>')
-                    parts.append(''.join(f'<th>{md_inline(c)}</th>' for c in cells))
-                    parts.append('</tr></thead><tbody>')
+                    add('<table><thead><tr>\n' + ''.join([f'<th>{md_link_inline(c)}</th>' for c in cells])
+                        + '\n</tr></thead><tbody>')
                     in_table = True
                 else:
-                    parts.append('<tr>' + ''.join(f'<td>{md_inline(c)}</td>' for c in cells) + '</tr>')
+                    add('<tr>' + ''.join([f'<td>{md_link_inline(c)}</td>' for c in cells]) + '</tr>')
                 continue
             if in_table:
-                parts.append('</tbody></table>')
+                add('</tbody></table>')
                 in_table = False
             # Ordered list
-            m_ol = re.match(r'^(\d+)\.\s+(.*)', s)
+            m_ol = _MD_OLIST_RE.match(s) if first.isdigit() else None
             if m_ol:
                 if not in_olist:
-                    parts.append('<ol>')
+                    add('<ol>')
                     in_olist = True
-                parts.append(f'<li>{md_inline(m_ol.group(2))}</li>')
+                add(f'<li>{md_link_inline(m_ol.group(2))}</li>')
                 continue
             if in_olist:
-                parts.append('</ol>')
+                add('</ol>')
                 in_olist = False
             # Unordered list
-            if re.match(r'^[-*]\s', s):
+            if (first == '-' or first == '*') and _MD_BULLET_RE.match(s):
                 if not in_list:
-                    parts.append('<ul>')
+                    add('<ul>')
                     in_list = True
-                item_text = md_inline(re.sub(r'^[-*]\s+', '', s))
-                parts.append(f'<li>{item_text}</li>')
+                item_text = md_link_inline(_MD_BULLET_RE.sub('', s))
+                add(f'<li>{item_text}</li>')
                 continue
             if in_list:
-                parts.append('</ul>')
+                add('</ul>')
                 in_list = False
             # Paragraph
-            parts.append(f'<p>{md_inline(s)}</p>')
+            add(f'<p>{md_link_inline(s)}</p>')
         if in_list:
-            parts.append('</ul>')
+            add('</ul>')
         if in_olist:
-            parts.append('</ol>')
+            add('</ol>')
         if in_table:
-            parts.append('</tbody></table>')
+            add('</tbody></table>')
         return '\n'.join(parts)
 
     # Map sections to card styles
@@ -2812,7 +3515,7 @@ def render_readme():
         intro_lines = [l for l in intro_sec["lines"] if l.strip()]
         html_parts.append(f'''<div class="inst-hero">
   <h1>MADphotos</h1>
-  <p class="hero-sub">{md_inline(intro_lines[0].strip()) if intro_lines else ""}</p>
+  <p class="hero-sub">{md_link_inline(intro_lines[0].strip()) if intro_lines else ""}</p>
 </div>''')
         if len(intro_lines) > 1:
             html_parts.append(render_block(intro_lines[1:]))
@@ -2830,7 +3533,7 @@ def render_readme():
         if sec["level"] >= 3:
             continue
         heading = sec["heading"]
-        clean_heading = re.sub(r'\[(.+?)\]\(.+?\)', r'\1', heading)
+        clean_heading = _MD_LINK_TEXT_RE.sub(r'\1', heading)
 
         style_info = SECTION_STYLES.get(clean_heading)
         if style_info:
@@ -2851,11 +3554,11 @@ def render_readme():
             for cs in child_secs:
                 body = render_block(cs["lines"])
                 raw_name = cs["heading"]
-                sub_name = re.sub(r'\[(.+?)\]\(.+?\)', r'\1', raw_name)
-                sub_link = re.search(r'\[.+?\]\((.+?)\)', raw_name)
+                sub_name = _MD_LINK_TEXT_RE.sub(r'\1', raw_name)
+                sub_link = _MD_LINK_RE.search(raw_name)
                 name = sub_name
                 if sub_link:
-                    name = f'<a href="{sub_link.group(1)}" style="text-decoration:none;color:inherit">{name}</a>'
+                    name = f'<a href="{sub_link.group(2)}" style="text-decoration:none;color:inherit">{name}</a>'
                 boxes.append(f'<div class="app-box"><strong>{name}</strong>{body}</div>')
 
             html_parts.append(f'''<div class="inst-card {card_class}">
@@ -2869,7 +3572,7 @@ def render_readme():
             # Render parent body + child subsections inside same card
             body = render_block(sec["lines"])
             for cs in child_secs:
-                cs_name = re.sub(r'\[(.+?)\]\(.+?\)', r'\1', cs["heading"])
+                cs_name = _MD_LINK_TEXT_RE.sub(r'\1', cs["heading"])
                 body += f'\n<h3>{cs_name}</h3>\n' + render_block(cs["lines"])
             html_parts.append(f'''<div class="inst-card {card_class}">
   <span class="inst-pill inst-pill-{pill_color}">{pill_label}</span>
@@ -2886,58 +3589,7 @@ def render_readme():
 
     body = '\n'.join(html_parts)
 
-    readme_style = """<style>
-  .inst-hero { text-align: center; margin-bottom: var(--space-8); padding: var(--space-8) 0 var(--space-4); }
-  .inst-hero h1 { font-size: 28px; font-weight: 800; letter-spacing: -0.02em; margin: 0; }
-  .inst-hero .hero-sub, .inst-hero p { font-size: var(--text-sm); color: var(--muted); margin-top: var(--space-2); max-width: 640px; margin-left: auto; margin-right: auto; line-height: var(--leading-relaxed); }
-  .inst-card {
-    background: var(--card-bg); border: 1px solid var(--border); border-radius: var(--radius-lg);
-    padding: var(--space-5) var(--space-6); margin-bottom: var(--space-4);
-    transition: border-color var(--duration-fast) var(--ease-default);
-  }
-  .inst-card:hover { border-color: var(--border-strong); }
-  .inst-card.inst-accent {
-    border-color: var(--apple-indigo);
-    background: linear-gradient(135deg, var(--card-bg) 0%, rgba(88,86,214,0.05) 100%);
-  }
-  .inst-card.inst-creative {
-    border-color: var(--apple-pink);
-    background: linear-gradient(135deg, var(--card-bg) 0%, rgba(255,55,95,0.04) 100%);
-  }
-  .inst-card.inst-status {
-    border-color: var(--apple-green);
-    background: linear-gradient(135deg, var(--card-bg) 0%, rgba(52,199,89,0.04) 100%);
-  }
-  .inst-card h2 { font-size: 16px; font-weight: 700; margin: 0 0 var(--space-3); letter-spacing: -0.01em; border-bottom: none; padding-bottom: 0; }
-  .inst-card h3 { font-size: 13px; font-weight: 600; margin: var(--space-4) 0 var(--space-2); color: var(--fg); }
-  .inst-card p, .inst-card li { font-size: var(--text-sm); color: var(--fg-secondary); line-height: var(--leading-relaxed); }
-  .inst-card ul { list-style: none; padding: 0; margin: var(--space-2) 0; }
-  .inst-card li { padding: var(--space-1) 0 var(--space-1) var(--space-4); position: relative; }
-  .inst-card li::before { content: "\\2014"; position: absolute; left: 0; color: var(--muted); }
-  .inst-card ol { padding-left: var(--space-5); margin: var(--space-2) 0; }
-  .inst-card ol li { padding: var(--space-1) 0; position: static; }
-  .inst-card ol li::before { content: none; }
-  .inst-card table { width: 100%; border-collapse: collapse; font-size: var(--text-xs); margin: var(--space-2) 0; }
-  .inst-card th, .inst-card td { padding: 6px 10px; text-align: left; border-bottom: 1px solid var(--border); }
-  .inst-card th { font-weight: 600; color: var(--fg); font-size: 11px; text-transform: uppercase; letter-spacing: 0.04em; }
-  .inst-card code { font-family: var(--font-mono); font-size: 0.88em; color: var(--apple-blue); }
-  .inst-pill {
-    display: inline-block; font-size: 10px; font-weight: 600; text-transform: uppercase;
-    letter-spacing: 0.05em; padding: 2px 8px; border-radius: var(--radius-full, 9999px);
-    margin-bottom: var(--space-2);
-  }
-  .inst-pill-orange { color: var(--apple-orange); background: color-mix(in srgb, var(--apple-orange) 12%, transparent); }
-  .inst-pill-pink { color: var(--apple-pink); background: color-mix(in srgb, var(--apple-pink) 12%, transparent); }
-  .inst-pill-blue { color: var(--apple-blue); background: color-mix(in srgb, var(--apple-blue) 12%, transparent); }
-  .inst-pill-teal { color: var(--apple-teal); background: color-mix(in srgb, var(--apple-teal) 12%, transparent); }
-  .app-trio { display: grid; grid-template-columns: repeat(3, 1fr); gap: var(--space-3); margin: var(--space-3) 0; }
-  .app-box { background: var(--hover-overlay); border-radius: var(--radius-md); padding: var(--space-3) var(--space-4); }
-  .app-box strong { display: block; font-size: 14px; margin-bottom: 4px; }
-  .app-box p { font-size: 12px; margin: 0; color: var(--muted); line-height: 1.5; }
-  @media (max-width: 700px) { .app-trio { grid-template-columns: 1fr; } }
-</style>
-"""
-    content = readme_style + body
+    content = _README_STYLE + body
     return page_shell("README", content, active="readme")
 
 
@@ -2945,9 +3597,7 @@ def render_readme():
 # System Instructions renderer
 # ---------------------------------------------------------------------------
 
-def render_instructions():
-    # type: () -> str
-    content = """<style>
+_INSTRUCTIONS_CONTENT = """<style>
   .inst-hero { text-align: center; margin-bottom: var(--space-8); padding: var(--space-8) 0 var(--space-4); }
   .inst-hero h1 { font-size: 28px; font-weight: 800; letter-spacing: -0.02em; margin: 0; }
   .inst-hero p { font-size: var(--text-sm); color: var(--muted); margin-top: var(--space-2); }
@@ -3257,44 +3907,27 @@ def render_instructions():
   <p>File: <code>docs/journal.md</code>. Write after EVERY significant action. Format: <code>### HH:MM &mdash; Title</code> under <code>## YYYY-MM-DD</code> headers. Include intent, what happened, what was learned. Rendered as timeline with auto-classified event type labels.</p>
 </div>
 """
-    return page_shell("System Instructions", content, active="instructions")
-
 
-# ---------------------------------------------------------------------------
-# Mosaics renderer
-# ---------------------------------------------------------------------------
 
-def render_mosaics():
+@functools.lru_cache(maxsize=1)
+def render_instructions():
     # type: () -> str
-    """Render the mosaics gallery page."""
-    meta_path = MOSAIC_DIR / "mosaics.json"
-    mosaics = []
-    if meta_path.exists():
-        mosaics = json.loads(meta_path.read_text())
+    return page_shell("System Instructions", _INSTRUCTIONS_CONTENT, active="instructions")
 
-    if not mosaics:
-        return page_shell("Mosaics", "<h1>Mosaics</h1><p>No mosaics generated yet. Run <code>python3 backend/mosaics.py</code></p>", active="mosaics")
 
-    cards = []
-    for m in mosaics:
-        cards.append(
-            f'<div class="mosaic-card" onclick="openMosaic(\'/mosaics/{m["file"]}\', \'{m["title"]}\')">'
-            f'<img src="/mosaics/{m["file"]}" loading="lazy" alt="{m["title"]}">'
-            f'<div class="mosaic-meta">'
-            f'<div class="mosaic-title">{m["title"]}</div>'
-            f'<div class="mosaic-desc">{m["desc"]}</div>'
-            f'<div class="mosaic-count">{m["count"]:,} images</div>'
-            f'</div></div>'
-        )
+# ---------------------------------------------------------------------------
+# Mosaics renderer
+# ---------------------------------------------------------------------------
 
-    content = f"""<style>
-  .mosaic-grid {{
+# Gallery styles, zoom modal and intro; render_mosaics() appends the cards
+_MOSAIC_CHROME = """<style>
+  .mosaic-grid {
     display: grid;
     grid-template-columns: repeat(auto-fill, minmax(320px, 1fr));
     gap: var(--space-6);
     margin-top: var(--space-4);
-  }}
-  .mosaic-card {{
+  }
+  .mosaic-card {
     background: var(--card-bg);
     border: 1px solid var(--border);
     border-radius: var(--radius-md);
@@ -3302,41 +3935,41 @@ def render_mosaics():
     overflow: hidden;
     transition: transform var(--duration-fast) var(--ease-default),
                 box-shadow var(--duration-fast) var(--ease-default);
-  }}
-  .mosaic-card:hover {{
+  }
+  .mosaic-card:hover {
     transform: translateY(-2px);
     box-shadow: 0 4px 16px rgba(0,0,0,0.12);
-  }}
-  .mosaic-card img {{
+  }
+  .mosaic-card img {
     width: 100%;
     display: block;
     aspect-ratio: 1;
     object-fit: cover;
-  }}
-  .mosaic-meta {{
+  }
+  .mosaic-meta {
     padding: var(--space-3) var(--space-4);
-  }}
-  .mosaic-title {{
+  }
+  .mosaic-title {
     font-weight: 700;
     font-size: var(--text-sm);
     text-transform: uppercase;
     letter-spacing: var(--tracking-caps);
-  }}
-  .mosaic-desc {{
+  }
+  .mosaic-desc {
     font-size: var(--text-xs);
     color: var(--muted);
     margin-top: var(--space-1);
     line-height: var(--leading-normal);
-  }}
-  .mosaic-count {{
+  }
+  .mosaic-count {
     font-size: var(--text-xs);
     color: var(--muted);
     margin-top: var(--space-1);
     font-weight: 600;
-  }}
+  }
 
   /* Mosaic zoom modal — fullscreen overlay, keeps its own color scheme */
-  .mosaic-modal {{
+  .mosaic-modal {
     display: none;
     position: fixed;
     top: 0; left: 0; right: 0; bottom: 0;
@@ -3345,11 +3978,11 @@ def render_mosaics():
     justify-content: center;
     align-items: center;
     flex-direction: column;
-  }}
-  .mosaic-modal.active {{
+  }
+  .mosaic-modal.active {
     display: flex;
-  }}
-  .mosaic-modal-header {{
+  }
+  .mosaic-modal-header {
     position: fixed;
     top: 0; left: 0; right: 0;
     display: flex;
@@ -3360,20 +3993,20 @@ def render_mosaics():
     backdrop-filter: blur(12px);
     -webkit-backdrop-filter: blur(12px);
     z-index: 10001;
-  }}
-  .mosaic-modal-title {{
+  }
+  .mosaic-modal-title {
     font-size: var(--text-sm);
     font-weight: 700;
     color: rgba(255,255,255,0.95);
     text-transform: uppercase;
     letter-spacing: var(--tracking-caps);
-  }}
-  .mosaic-modal-controls {{
+  }
+  .mosaic-modal-controls {
     display: flex;
     gap: var(--space-2);
     align-items: center;
-  }}
-  .mosaic-modal-controls button {{
+  }
+  .mosaic-modal-controls button {
     background: rgba(255,255,255,0.15);
     border: 1px solid rgba(255,255,255,0.25);
     color: rgba(255,255,255,0.95);
@@ -3383,33 +4016,33 @@ def render_mosaics():
     cursor: pointer;
     border-radius: var(--radius-sm);
     transition: background var(--duration-fast) var(--ease-default);
-  }}
-  .mosaic-modal-controls button:hover {{
+  }
+  .mosaic-modal-controls button:hover {
     background: rgba(255,255,255,0.25);
-  }}
-  .mosaic-modal-zoom-label {{
+  }
+  .mosaic-modal-zoom-label {
     font-size: var(--text-xs);
     color: rgba(255,255,255,0.6);
     min-width: 48px;
     text-align: center;
     font-variant-numeric: tabular-nums;
-  }}
-  .mosaic-modal-viewport {{
+  }
+  .mosaic-modal-viewport {
     position: fixed;
     top: 0; left: 0; right: 0; bottom: 0;
     overflow: auto;
     cursor: grab;
     z-index: 10000;
     padding-top: 48px;
-  }}
-  .mosaic-modal-viewport:active {{
+  }
+  .mosaic-modal-viewport:active {
     cursor: grabbing;
-  }}
-  .mosaic-modal-viewport img {{
+  }
+  .mosaic-modal-viewport img {
     display: block;
     transform-origin: 0 0;
     transition: transform var(--duration-fast) var(--ease-default);
-  }}
+  }
 </style>
 
 <!-- Mosaic zoom modal -->
@@ -3431,7 +4064,7 @@ def render_mosaics():
 </div>
 
 <script>
-(function() {{
+(function() {
   var modal = document.getElementById('mosaicModal');
   var viewport = document.getElementById('mosaicViewport');
   var img = document.getElementById('mosaicImg');
@@ -3439,90 +4072,90 @@ def render_mosaics():
   var zoomLabel = document.getElementById('mosaicZoomLabel');
   var scale = 1;
   var isDragging = false;
-  var dragStart = {{x: 0, y: 0}};
-  var scrollStart = {{x: 0, y: 0}};
+  var dragStart = {x: 0, y: 0};
+  var scrollStart = {x: 0, y: 0};
 
-  window.openMosaic = function(src, title) {{
+  window.openMosaic = function(src, title) {
     img.src = src;
     titleEl.textContent = title;
     modal.classList.add('active');
     document.body.style.overflow = 'hidden';
-    img.onload = function() {{
+    img.onload = function() {
       mosaicFit();
-    }};
-  }};
+    };
+  };
 
-  window.closeMosaic = function() {{
+  window.closeMosaic = function() {
     modal.classList.remove('active');
     document.body.style.overflow = '';
     img.src = '';
-  }};
+  };
 
-  window.mosaicZoom = function(dir) {{
+  window.mosaicZoom = function(dir) {
     var steps = [0.25, 0.33, 0.5, 0.67, 0.75, 1, 1.25, 1.5, 2, 2.5, 3, 4];
     var idx = 0;
-    for (var i = 0; i < steps.length; i++) {{
-      if (Math.abs(steps[i] - scale) < 0.01) {{ idx = i; break; }}
-      if (steps[i] > scale) {{ idx = dir > 0 ? i : Math.max(0, i-1); break; }}
+    for (var i = 0; i < steps.length; i++) {
+      if (Math.abs(steps[i] - scale) < 0.01) { idx = i; break; }
+      if (steps[i] > scale) { idx = dir > 0 ? i : Math.max(0, i-1); break; }
       idx = i;
-    }}
+    }
     idx = Math.max(0, Math.min(steps.length - 1, idx + dir));
     setScale(steps[idx]);
-  }};
+  };
 
-  window.mosaicFit = function() {{
+  window.mosaicFit = function() {
     if (!img.naturalWidth) return;
     var vw = viewport.clientWidth;
     var vh = viewport.clientHeight - 48;
     var s = Math.min(vw / img.naturalWidth, vh / img.naturalHeight, 1);
     setScale(s);
-  }};
+  };
 
-  window.mosaicActual = function() {{
+  window.mosaicActual = function() {
     setScale(1);
-  }};
+  };
 
-  function setScale(s) {{
+  function setScale(s) {
     scale = s;
     img.style.width = (img.naturalWidth * scale) + 'px';
     img.style.height = (img.naturalHeight * scale) + 'px';
     zoomLabel.textContent = Math.round(scale * 100) + '%';
-  }}
+  }
 
   // Mouse wheel zoom
-  viewport.addEventListener('wheel', function(e) {{
+  viewport.addEventListener('wheel', function(e) {
     e.preventDefault();
     var dir = e.deltaY < 0 ? 1 : -1;
     mosaicZoom(dir);
-  }}, {{passive: false}});
+  }, {passive: false});
 
   // Drag to pan
-  viewport.addEventListener('mousedown', function(e) {{
+  viewport.addEventListener('mousedown', function(e) {
     isDragging = true;
     dragStart.x = e.clientX;
     dragStart.y = e.clientY;
     scrollStart.x = viewport.scrollLeft;
     scrollStart.y = viewport.scrollTop;
-  }});
-  window.addEventListener('mousemove', function(e) {{
+  });
+  window.addEventListener('mousemove', function(e) {
     if (!isDragging) return;
     viewport.scrollLeft = scrollStart.x - (e.clientX - dragStart.x);
     viewport.scrollTop = scrollStart.y - (e.clientY - dragStart.y);
-  }});
-  window.addEventListener('mouseup', function() {{
+  });
+  window.addEventListener('mouseup', function() {
     isDragging = false;
-  }});
+  });
 
   // Keyboard shortcuts
-  window.addEventListener('keydown', function(e) {{
+  window.addEventListener('keydown', function(e) {
     if (!modal.classList.contains('active')) return;
     if (e.key === 'Escape') closeMosaic();
     else if (e.key === '+' || e.key === '=') mosaicZoom(1);
     else if (e.key === '-') mosaicZoom(-1);
     else if (e.key === 'f' || e.key === 'F') mosaicFit();
     else if (e.key === '1') mosaicActual();
-  }});
-}})();
+  });
+})();
 </script>
 
 <h1>Mosaics</h1>
@@ -3532,8 +4165,43 @@ def render_mosaics():
   <span style="color:var(--muted);opacity:0.6;">Scroll to zoom, drag to pan. Keys: +/- zoom, F fit, 1 actual size, Esc close.</span>
 </p>
 <div class="mosaic-grid">
-{''.join(cards)}
-</div>"""
+"""
+
+
+_MOSAIC_CARD = (
+    '<div class="mosaic-card" onclick="openMosaic(\'/mosaics/{file}\', {js_title})">'
+    '<img src="/mosaics/{file}" loading="lazy" alt="{title}">'
+    '<div class="mosaic-meta">'
+    '<div class="mosaic-title">{title}</div>'
+    '<div class="mosaic-desc">{desc}</div>'
+    '<div class="mosaic-count">{count:,} images</div>'
+    '</div></div>'
+)
+
+
+def _mosaic_card(m):
+    # type: (dict) -> str
+    """One gallery card; catalog text is escaped once, the onclick title as a JS string."""
+    return _MOSAIC_CARD.format(
+        file=html_escape(m["file"]), title=html_escape(m["title"]),
+        js_title=html_escape(json.dumps(m["title"])), desc=html_escape(m["desc"]),
+        count=m["count"],
+    )
+
+
+@_cached_by_mtime(MOSAIC_DIR / "mosaics.json")
+def render_mosaics():
+    # type: () -> str
+    """Render the mosaics gallery page."""
+    meta_path = MOSAIC_DIR / "mosaics.json"
+    mosaics = []
+    if meta_path.exists():
+        mosaics = _loads(meta_path.read_bytes())
+
+    if not mosaics:
+        return page_shell("Mosaics", "<h1>Mosaics</h1><p>No mosaics generated yet. Run <code>python3 backend/mosaics.py</code></p>", active="mosaics")
+
+    content = _MOSAIC_CHROME + "".join(map(_mosaic_card, mosaics)) + "\n</div>"
 
     return page_shell("Mosaics", content, active="mosaics")
 
@@ -3545,43 +4213,157 @@ def render_mosaics():
 JOURNAL_PATH = PROJECT_ROOT / "docs" / "journal.md"
 
 
+# Journal event labels: the first two rules matching title + body win
+_JOURNAL_LABEL_RULES = (
+    ("Deploy",       re.compile(r'GCS|GCP|bucket|upload|push|deploy|GitHub Pages|sync', re.I)),
+    ("Infrastructure", re.compile(r'database|schema|table|migration|SQLite|column|UUID', re.I)),
+    ("Pipeline",     re.compile(r'pipeline|engine|render|tier|enhancement|enhance|batch|process|worker|shard', re.I)),
+    ("AI",           re.compile(r'Gemini|Imagen|BLIP|CLIP|DINO|SigLIP|YOLO|YuNet|OCR|emotion|vector|embedding|model|Places365|Depth|NIMA|aesthetic|caption', re.I)),
+    ("Investigation", re.compile(r'discovered|blind test|audit|bug|broke|fix|root cause|debug|purple cast|crash', re.I)),
+    ("UI/UX",        re.compile(r'dashboard|sidebar|card|design|CSS|layout|landing|hero|mosaic|responsive|mobile|pill|tag|icon|SVG|page|README|gallery|curator|app|SwiftUI', re.I)),
+    ("Security",     re.compile(r'secret|API key|credential|redact|git-filter', re.I)),
+    ("Architecture", re.compile(r'architecture|two-stage|vision|endgame|three experience|faceted|curation', re.I)),
+    ("Signal",       re.compile(r'signal|pixel.level|analysis|extraction|EXIF|color|face|object|hash|depth|scene|style', re.I)),
+)
+_JOURNAL_LABEL_COLORS = {
+    "Deploy": "var(--apple-green)",
+    "Infrastructure": "var(--apple-brown, #a2845e)",
+    "Pipeline": "var(--apple-blue)",
+    "AI": "var(--apple-purple)",
+    "Investigation": "var(--apple-orange)",
+    "UI/UX": "var(--apple-pink)",
+    "Security": "var(--apple-red)",
+    "Architecture": "var(--apple-indigo)",
+    "Signal": "var(--apple-teal)",
+}
+_JOURNAL_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+_JOURNAL_QUOTE_RE = re.compile(r'(.+?)\s*\*\((.+?)\)\*\s*$')
+
+
+_JOURNAL_STYLE = """<style>
+  .date-header {
+    font-size: var(--text-sm); font-weight: 600; margin: var(--space-8) 0 var(--space-3);
+    padding: var(--space-2) var(--space-3); color: var(--muted);
+    background: var(--hover-overlay); border-radius: var(--radius-sm);
+    letter-spacing: var(--tracking-caps); text-transform: uppercase;
+  }
+  .event {
+    background: var(--card-bg);
+    border: 1px solid var(--border);
+    border-radius: var(--radius-md);
+    padding: var(--space-4) var(--space-5);
+    margin-bottom: var(--space-3);
+    transition: border-color var(--duration-fast) var(--ease-default);
+    position: relative;
+  }
+  .event:hover {
+    border-color: var(--border-strong);
+  }
+  .event-genesis {
+    border-color: var(--apple-indigo);
+    background: linear-gradient(135deg, var(--card-bg) 0%, rgba(88,86,214,0.06) 100%);
+  }
+  .event-genesis h3 {
+    font-size: var(--text-base) !important; font-weight: 800;
+    letter-spacing: -0.01em;
+  }
+  /* Thread connector line */
+  .event + .event::before {
+    content: "";
+    position: absolute;
+    top: calc(-1 * var(--space-3));
+    left: var(--space-6);
+    width: 2px;
+    height: var(--space-3);
+    background: var(--border);
+  }
+  /* Event type labels */
+  .ev-labels {
+    display: flex; gap: 6px; margin-bottom: 6px; flex-wrap: wrap;
+  }
+  .ev-label {
+    font-size: 10px; font-weight: 600; text-transform: uppercase;
+    letter-spacing: 0.05em;
+    padding: 2px 8px; border-radius: var(--radius-full);
+    color: var(--label-color);
+    background: color-mix(in srgb, var(--label-color) 12%, transparent);
+    border: 1px solid color-mix(in srgb, var(--label-color) 25%, transparent);
+    line-height: 1.4;
+  }
+  .main-content h3 {
+    font-size: var(--text-sm); font-weight: 700; margin: 0;
+    color: var(--fg); display: block; line-height: var(--leading-normal);
+  }
+  .quote {
+    font-size: var(--text-xs); color: var(--muted); font-style: italic;
+    font-weight: 400; display: block; margin-top: 2px;
+  }
+  /* Compact/expanded toggle */
+  .event { cursor: pointer; }
+  .ev-expand-hint {
+    font-size: 10px; color: var(--muted); transition: transform 0.2s;
+    display: inline-block; margin-left: 4px;
+  }
+  .ev-collapsed .ev-body { display: none; }
+  .ev-collapsed .ev-summary { display: block; }
+  .event:not(.ev-collapsed) .ev-body { display: block; }
+  .event:not(.ev-collapsed) .ev-summary { display: none; }
+  .event:not(.ev-collapsed) .ev-expand-hint { transform: rotate(90deg); }
+  .ev-summary {
+    font-size: var(--text-sm); color: var(--muted);
+    margin-top: var(--space-1); line-height: var(--leading-relaxed);
+  }
+  .ev-summary p { margin: 0; }
+  .event p {
+    font-size: var(--text-sm); color: var(--fg-secondary);
+    margin: var(--space-1) 0; line-height: var(--leading-relaxed);
+  }
+  .event ul { list-style: none; margin: var(--space-2) 0; padding: 0; }
+  .event li {
+    font-size: var(--text-sm); color: var(--fg-secondary);
+    padding: var(--space-1) 0 var(--space-1) var(--space-5); position: relative;
+    line-height: var(--leading-relaxed);
+  }
+  .event li::before { content: "\u2014"; position: absolute; left: 0; color: var(--muted); }
+  .event pre {
+    background: var(--hover-overlay); border-radius: var(--radius-sm);
+    padding: var(--space-3); margin: var(--space-2) 0; overflow-x: auto;
+    font-size: 11px; line-height: 1.5;
+  }
+  .event code { font-family: var(--font-mono); font-size: 0.9em; }
+  .event .table-wrap { overflow-x: auto; margin: var(--space-2) 0; }
+  .event table {
+    width: 100%; border-collapse: collapse; font-size: var(--text-xs);
+  }
+  .event th, .event td {
+    padding: var(--space-1) var(--space-2); text-align: left;
+    border-bottom: 1px solid var(--border);
+  }
+  .event th { font-weight: 600; color: var(--fg); }
+  .main-content p { font-size: var(--text-sm); color: var(--fg-secondary); margin-bottom: var(--space-2); line-height: var(--leading-relaxed); }
+  .main-content ul { list-style: none; margin: var(--space-3) 0; }
+  .main-content li {
+    font-size: var(--text-sm); color: var(--fg-secondary);
+    padding: var(--space-1) 0 var(--space-1) var(--space-5); position: relative;
+  }
+  .main-content li::before { content: "\u2014"; position: absolute; left: 0; color: var(--muted); }
+  hr { border: none; margin: 0; }
+</style>
+"""
+
+
+@_cached_by_mtime(JOURNAL_PATH)
 def render_journal():
     """Read journal.md and render a rich timeline with event type labels."""
     if not JOURNAL_PATH.exists():
         return "<p>No journal found.</p>"
     raw = JOURNAL_PATH.read_text()
 
-    import re
-
-    # -- Event type classification ----------------------------------------
-    LABEL_RULES = [
-        ("Deploy",       re.compile(r'GCS|GCP|bucket|upload|push|deploy|GitHub Pages|sync', re.I)),
-        ("Infrastructure", re.compile(r'database|schema|table|migration|SQLite|column|UUID', re.I)),
-        ("Pipeline",     re.compile(r'pipeline|engine|render|tier|enhancement|enhance|batch|process|worker|shard', re.I)),
-        ("AI",           re.compile(r'Gemini|Imagen|BLIP|CLIP|DINO|SigLIP|YOLO|YuNet|OCR|emotion|vector|embedding|model|Places365|Depth|NIMA|aesthetic|caption', re.I)),
-        ("Investigation", re.compile(r'discovered|blind test|audit|bug|broke|fix|root cause|debug|purple cast|crash', re.I)),
-        ("UI/UX",        re.compile(r'dashboard|sidebar|card|design|CSS|layout|landing|hero|mosaic|responsive|mobile|pill|tag|icon|SVG|page|README|gallery|curator|app|SwiftUI', re.I)),
-        ("Security",     re.compile(r'secret|API key|credential|redact|git-filter', re.I)),
-        ("Architecture", re.compile(r'architecture|two-stage|vision|endgame|three experience|faceted|curation', re.I)),
-        ("Signal",       re.compile(r'signal|pixel.level|analysis|extraction|EXIF|color|face|object|hash|depth|scene|style', re.I)),
-    ]
-    LABEL_COLORS = {
-        "Deploy": "var(--apple-green)",
-        "Infrastructure": "var(--apple-brown, #a2845e)",
-        "Pipeline": "var(--apple-blue)",
-        "AI": "var(--apple-purple)",
-        "Investigation": "var(--apple-orange)",
-        "UI/UX": "var(--apple-pink)",
-        "Security": "var(--apple-red)",
-        "Architecture": "var(--apple-indigo)",
-        "Signal": "var(--apple-teal)",
-    }
-
     def classify_event(title, body_text):
         """Return up to 2 labels for an event based on title + body content."""
         combined = title + " " + body_text
         labels = []
-        for label, pattern in LABEL_RULES:
+        for label, pattern in _JOURNAL_LABEL_RULES:
             if pattern.search(combined):
                 labels.append(label)
                 if len(labels) >= 2:
@@ -3591,22 +4373,18 @@ def render_journal():
     def label_html(labels):
         parts = []
         for lb in labels:
-            color = LABEL_COLORS.get(lb, "var(--muted)")
+            color = _JOURNAL_LABEL_COLORS.get(lb, "var(--muted)")
             parts.append(
                 f'<span class="ev-label" style="--label-color:{color}">{lb}</span>'
             )
         return "".join(parts)
 
-    # -- Markdown inline formatting ---------------------------------------
-    def md_inline(text):
-        text = re.sub(r'`(.+?)`', r'<code>\1</code>', text)
-        text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
-        text = re.sub(r'\*(.+?)\*', r'<em>\1</em>', text)
-        return text
-
     # -- Parse journal.md -------------------------------------------------
     lines = raw.split("\n")
-    date_sections = []          # type: list[dict]
+    # Newest first: sections and their events are prepended as they are parsed.
+    # A repeated date header reopens its first section, which keeps its place.
+    date_sections = deque()     # type: deque[dict]
+    sections_by_header = {}     # type: dict[str, dict]
     current_date = None         # type: Optional[dict]
     current_event = None        # type: Optional[dict]
     in_intro = True
@@ -3617,7 +4395,7 @@ def render_journal():
     def flush_event():
         nonlocal current_event
         if current_event and current_date is not None:
-            current_date["events"].append(current_event)
+            current_date["events"].appendleft(current_event)
         current_event = None
 
     for line in lines:
@@ -3636,7 +4414,6 @@ def render_journal():
 
         if in_code:
             if current_event is not None:
-                from html import escape as html_escape
                 current_event["body"].append(html_escape(line))
             continue
 
@@ -3658,10 +4435,13 @@ def render_journal():
         if stripped.startswith("## "):
             flush_event()
             header_text = stripped[3:]
-            if re.match(r'\d{4}-\d{2}-\d{2}', header_text):
+            if _JOURNAL_DATE_RE.match(header_text):
                 in_intro = False
-                current_date = {"header": header_text, "events": []}
-                date_sections.append(current_date)
+                current_date = sections_by_header.get(header_text)
+                if current_date is None:
+                    current_date = {"header": header_text, "events": deque()}
+                    sections_by_header[header_text] = current_date
+                    date_sections.appendleft(current_date)
             # Skip intro sections entirely (The Beginning, The Numbers, etc.)
             continue
 
@@ -3678,7 +4458,7 @@ def render_journal():
         if stripped.startswith("### "):
             flush_event()
             heading = stripped[4:]
-            m = re.match(r'(.+?)\s*\*\((.+?)\)\*\s*$', heading)
+            m = _JOURNAL_QUOTE_RE.match(heading)
             if m:
                 title = m.group(1).rstrip()
                 quote = m.group(2)
@@ -3697,7 +4477,7 @@ def render_journal():
         if stripped.startswith("|") and current_event is not None:
             cells = [c.strip() for c in stripped.split("|")[1:-1]]
             # Separator row (|---|---|)
-            if all(re.match(r'^[-:]+$', c) for c in cells):
+            if all(_MD_TABLE_SEP_RE.match(c) for c in cells):
                 if not in_table:
                     # Previous row was the header — rewrite it
                     if current_event["body"] and current_event["body"][-1].startswith("<tr class=\"thead\">"):
@@ -3710,7 +4490,7 @@ def render_journal():
             row_cls = "thead" if not in_table else ""
             tag = "th" if not in_table else "td"
             row_html = f'<tr class="{row_cls}">' + "".join(
-                f"<{tag}>{md_inline(c)}</{tag}>" for c in cells
+                [f"<{tag}>{md_inline(c)}</{tag}>" for c in cells]
             ) + "</tr>"
             current_event["body"].append(row_html)
             continue
@@ -3741,17 +4521,6 @@ def render_journal():
     if in_table and current_event:
         current_event["body"].append("</tbody></table></div>")
 
-    # -- Merge duplicate date sections ------------------------------------
-    merged = []  # type: list[dict]
-    seen_dates = {}  # type: dict[str, int]
-    for ds in date_sections:
-        if ds["header"] in seen_dates:
-            merged[seen_dates[ds["header"]]]["events"].extend(ds["events"])
-        else:
-            seen_dates[ds["header"]] = len(merged)
-            merged.append(ds)
-    date_sections = merged
-
     # -- Genesis event (special card at the bottom) -----------------------
     genesis_html = """<div class="event event-genesis">
 <div class="ev-labels"><span class="ev-label" style="--label-color:var(--apple-indigo)">Genesis</span></div>
@@ -3763,9 +4532,9 @@ def render_journal():
 
     # -- Build HTML -------------------------------------------------------
     html_parts = []
-    for date_sec in reversed(date_sections):
+    for date_sec in date_sections:
         html_parts.append(f'<h2 class="date-header">{date_sec["header"]}</h2>')
-        for ev in reversed(date_sec["events"]):
+        for ev in date_sec["events"]:
             labels = classify_event(ev["title"], ev["raw_text"])
             body_lines = ev["body"]
             body_html = "\n".join(body_lines)
@@ -3797,116 +4566,7 @@ def render_journal():
 
     body = "\n".join(html_parts)
 
-    journal_content = f"""<style>
-  .date-header {{
-    font-size: var(--text-sm); font-weight: 600; margin: var(--space-8) 0 var(--space-3);
-    padding: var(--space-2) var(--space-3); color: var(--muted);
-    background: var(--hover-overlay); border-radius: var(--radius-sm);
-    letter-spacing: var(--tracking-caps); text-transform: uppercase;
-  }}
-  .event {{
-    background: var(--card-bg);
-    border: 1px solid var(--border);
-    border-radius: var(--radius-md);
-    padding: var(--space-4) var(--space-5);
-    margin-bottom: var(--space-3);
-    transition: border-color var(--duration-fast) var(--ease-default);
-    position: relative;
-  }}
-  .event:hover {{
-    border-color: var(--border-strong);
-  }}
-  .event-genesis {{
-    border-color: var(--apple-indigo);
-    background: linear-gradient(135deg, var(--card-bg) 0%, rgba(88,86,214,0.06) 100%);
-  }}
-  .event-genesis h3 {{
-    font-size: var(--text-base) !important; font-weight: 800;
-    letter-spacing: -0.01em;
-  }}
-  /* Thread connector line */
-  .event + .event::before {{
-    content: "";
-    position: absolute;
-    top: calc(-1 * var(--space-3));
-    left: var(--space-6);
-    width: 2px;
-    height: var(--space-3);
-    background: var(--border);
-  }}
-  /* Event type labels */
-  .ev-labels {{
-    display: flex; gap: 6px; margin-bottom: 6px; flex-wrap: wrap;
-  }}
-  .ev-label {{
-    font-size: 10px; font-weight: 600; text-transform: uppercase;
-    letter-spacing: 0.05em;
-    padding: 2px 8px; border-radius: var(--radius-full);
-    color: var(--label-color);
-    background: color-mix(in srgb, var(--label-color) 12%, transparent);
-    border: 1px solid color-mix(in srgb, var(--label-color) 25%, transparent);
-    line-height: 1.4;
-  }}
-  .main-content h3 {{
-    font-size: var(--text-sm); font-weight: 700; margin: 0;
-    color: var(--fg); display: block; line-height: var(--leading-normal);
-  }}
-  .quote {{
-    font-size: var(--text-xs); color: var(--muted); font-style: italic;
-    font-weight: 400; display: block; margin-top: 2px;
-  }}
-  /* Compact/expanded toggle */
-  .event {{ cursor: pointer; }}
-  .ev-expand-hint {{
-    font-size: 10px; color: var(--muted); transition: transform 0.2s;
-    display: inline-block; margin-left: 4px;
-  }}
-  .ev-collapsed .ev-body {{ display: none; }}
-  .ev-collapsed .ev-summary {{ display: block; }}
-  .event:not(.ev-collapsed) .ev-body {{ display: block; }}
-  .event:not(.ev-collapsed) .ev-summary {{ display: none; }}
-  .event:not(.ev-collapsed) .ev-expand-hint {{ transform: rotate(90deg); }}
-  .ev-summary {{
-    font-size: var(--text-sm); color: var(--muted);
-    margin-top: var(--space-1); line-height: var(--leading-relaxed);
-  }}
-  .ev-summary p {{ margin: 0; }}
-  .event p {{
-    font-size: var(--text-sm); color: var(--fg-secondary);
-    margin: var(--space-1) 0; line-height: var(--leading-relaxed);
-  }}
-  .event ul {{ list-style: none; margin: var(--space-2) 0; padding: 0; }}
-  .event li {{
-    font-size: var(--text-sm); color: var(--fg-secondary);
-    padding: var(--space-1) 0 var(--space-1) var(--space-5); position: relative;
-    line-height: var(--leading-relaxed);
-  }}
-  .event li::before {{ content: "\u2014"; position: absolute; left: 0; color: var(--muted); }}
-  .event pre {{
-    background: var(--hover-overlay); border-radius: var(--radius-sm);
-    padding: var(--space-3); margin: var(--space-2) 0; overflow-x: auto;
-    font-size: 11px; line-height: 1.5;
-  }}
-  .event code {{ font-family: var(--font-mono); font-size: 0.9em; }}
-  .event .table-wrap {{ overflow-x: auto; margin: var(--space-2) 0; }}
-  .event table {{
-    width: 100%; border-collapse: collapse; font-size: var(--text-xs);
-  }}
-  .event th, .event td {{
-    padding: var(--space-1) var(--space-2); text-align: left;
-    border-bottom: 1px solid var(--border);
-  }}
-  .event th {{ font-weight: 600; color: var(--fg); }}
-  .main-content p {{ font-size: var(--text-sm); color: var(--fg-secondary); margin-bottom: var(--space-2); line-height: var(--leading-relaxed); }}
-  .main-content ul {{ list-style: none; margin: var(--space-3) 0; }}
-  .main-content li {{
-    font-size: var(--text-sm); color: var(--fg-secondary);
-    padding: var(--space-1) 0 var(--space-1) var(--space-5); position: relative;
-  }}
-  .main-content li::before {{ content: "\u2014"; position: absolute; left: 0; color: var(--muted); }}
-  hr {{ border: none; margin: 0; }}
-</style>
-{body}"""
+    journal_content = _JOURNAL_STYLE + body
 
     return page_shell("Journal de Bord", journal_content, active="journal")
 
@@ -3920,11 +4580,15 @@ RENDERED_DIR = PROJECT_ROOT / "images" / "rendered"
 # Shared lancedb connection (lazy)
 _lance_db = None  # type: Optional[object]
 _lance_tbl = None  # type: Optional[object]
+_lance_df = None  # type: Optional[object]
 
 
 def _get_lance():
-    """Lazy-load lancedb connection, returns (tbl, df) or (None, None)."""
-    global _lance_db, _lance_tbl
+    """Lazy-load lancedb connection, returns (tbl, df) or (None, None).
+
+    df is materialized once per connection and indexed by uuid (the column is kept).
+    """
+    global _lance_db, _lance_tbl, _lance_df
     try:
         import lancedb as _ldb
     except ImportError:
@@ -3935,7 +4599,19 @@ def _get_lance():
     if _lance_db is None:
         _lance_db = _ldb.connect(str(lance_path))
         _lance_tbl = _lance_db.open_table("image_vectors")
-    return _lance_tbl, _lance_tbl.to_pandas()
+        _lance_df = _lance_tbl.to_pandas().set_index("uuid", drop=False)
+    return _lance_tbl, _lance_df
+
+
+def _vector_row(df, uuid):
+    # type: (object, str) -> Optional[object]
+    """First vector-store row for *uuid* via the uuid index, or None."""
+    try:
+        row = df.loc[uuid]
+    except KeyError:
+        return None
+    # A uuid stored twice yields a frame; keep the first row like the old mask did
+    return row.iloc[0] if row.ndim == 2 else row
 
 
 def similarity_search(query_uuid):
@@ -3944,10 +4620,9 @@ def similarity_search(query_uuid):
     tbl, df = _get_lance()
     if tbl is None:
         return None
-    matches = df[df["uuid"] == query_uuid]
-    if matches.empty:
+    query_row = _vector_row(df, query_uuid)
+    if query_row is None:
         return None
-    query_row = matches.iloc[0]
     models = [
         ("dino", "DINOv2", "Texture & structure — finds images with similar visual geometry"),
         ("siglip", "SigLIP", "Semantic meaning — finds images about similar things"),
@@ -4223,10 +4898,9 @@ def drift_search(query_uuid):
     tbl, df = _get_lance()
     if tbl is None:
         return None
-    matches = df[df["uuid"] == query_uuid]
-    if matches.empty:
+    query_row = _vector_row(df, query_uuid)
+    if query_row is None:
         return None
-    query_row = matches.iloc[0]
 
     # Get DINOv2 neighbors (structural) — skip top 3 closest (too similar), take rank 4-20
     dino_vec = query_row["dino"]
@@ -4859,7 +5533,7 @@ def get_mosaics_data():
     """Return mosaics catalog as a list of dicts."""
     meta_path = MOSAIC_DIR / "mosaics.json"
     if meta_path.exists():
-        mosaics = json.loads(meta_path.read_text())
+        mosaics = _loads(meta_path.read_bytes())
         return [{"title": m["title"], "description": m["desc"],
                  "filename": m["file"], "count": m["count"]} for m in mosaics]
     return []
@@ -5235,7 +5909,7 @@ def generate_embedding_audit_data():
             (scene_name, per_scene)
         ).fetchall()]
         # Only keep UUIDs that are in the vector store
-        valid = [u for u in uuids if u in df["uuid"].values]
+        valid = [u for u in uuids if u in df.index]
         sample_uuids.extend(valid)
         if len(sample_uuids) >= 100:
             break
@@ -5248,10 +5922,9 @@ def generate_embedding_audit_data():
 
     anchors = []
     for uuid in sample_uuids:
-        matches = df[df["uuid"] == uuid]
-        if matches.empty:
+        query_row = _vector_row(df, uuid)
+        if query_row is None:
             continue
-        query_row = matches.iloc[0]
 
         # Get metadata
         g = conn.execute("SELECT alt_text, vibe FROM gemini_analysis WHERE image_uuid=?", (uuid,)).fetchone()
@@ -5660,7 +6333,203 @@ def generate_schema_data():
     }
 
 
+# Live-server response caches: (etag, body bytes, gzipped body bytes[, brotli body or None])
+_page_rendered = None  # type: Optional[tuple]
+# Live page around its embedded stats: (template digest, head bytes, tail bytes)
+_page_template = None  # type: Optional[tuple]
+_stats_rendered = None  # type: Optional[tuple]
+# Below-the-fold stylesheet of the live page:
+# (url path, etag, body, gzipped body, brotli body or None)
+_deferred_css = None  # type: Optional[tuple]
+# Pipeline writes land seconds apart; auto-refreshing tabs reuse the last
+# stats etag for this long instead of stat()ing every input per request
+STATS_ETAG_TTL = 5.0
+_stats_etag_cached = None  # type: Optional[tuple]
+
+
+def _inline_json(data):
+    # type: (object) -> str
+    """JSON safe to embed in a <script type="application/json"> block."""
+    return json.dumps(data).replace("</", "<\\/")
+
+
+def _live_page_template():
+    # type: () -> tuple
+    """The live dashboard page, substituted once per process and split at its data slot.
+
+    Only the critical CSS stays inline; the rest is preloaded from a
+    content-hashed /static/ URL so it can be cached across visits.
+    """
+    global _page_template, _deferred_css
+    if _page_template is None:
+        html = PAGE_HTML.replace("%%POLL_MS%%", "5000")
+        html = html.replace("%%API_URL%%", "/api/stats")
+        m = _STYLE_BLOCK_RE.search(html)
+        critical, deferred = _split_critical_css(_minify_css(m.group(2)))
+        css = deferred.encode()
+        digest = hashlib.sha1(css).hexdigest()[:12]
+        href = f"/static/status-deferred.{digest}.css"
+        try:
+            import brotli
+            css_br = brotli.compress(css, quality=11)
+        except ImportError:
+            css_br = None
+        _deferred_css = (href, f'"{digest}"', css, gzip.compress(css, compresslevel=9), css_br)
+        html = "".join([
+            html[:m.start()], "<style>", critical, "</style>\n",
+            f'<link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n',
+            f'<noscript><link rel="stylesheet" href="{href}"></noscript>',
+            html[m.end():],
+        ])
+        head, tail = html.encode().split(b"%%INLINE_DATA%%")
+        _page_template = (hashlib.sha1(head + tail).hexdigest()[:16], head, tail)
+    return _page_template
+
+
+def _page_etag(stats_etag):
+    # type: (str) -> str
+    return '"page-%s-%s"' % (_live_page_template()[0], stats_etag.strip('"'))
+
+
+def _live_page(etag):
+    # type: (str) -> tuple
+    """(body, gzipped body) of the live page with the current stats server-rendered into it."""
+    if _page_rendered is None or _page_rendered[0] != etag:
+        _, head, tail = _live_page_template()
+        _store_live_page(etag, head + _inline_json(get_stats()).encode() + tail)
+    return _page_rendered[1:]
+
+
+def _store_live_page(etag, body):
+    # type: (str, bytes) -> None
+    global _page_rendered
+    try:
+        import brotli
+        br = brotli.compress(body, quality=5)
+    except ImportError:
+        br = None
+    _page_rendered = (etag, body, gzip.compress(body, compresslevel=6), br)
+
+
+def _stats_etag():
+    # type: () -> str
+    """Etag of the current stats inputs, recomputed at most every STATS_ETAG_TTL seconds."""
+    global _stats_etag_cached
+    now = time.monotonic()
+    if _stats_etag_cached is None or now - _stats_etag_cached[0] >= STATS_ETAG_TTL:
+        key = _stats_cache_key()
+        etag = '"stats-%s"' % hashlib.sha1(repr(key).encode()).hexdigest()[:16]
+        mtime = max(key) / 1e9 if any(key) else time.time()
+        _stats_etag_cached = (now, etag, formatdate(mtime, usegmt=True))
+    return _stats_etag_cached[1]
+
+
+def _stats_last_modified():
+    # type: () -> str
+    """HTTP date of the newest stats input behind the current _stats_etag()."""
+    if _stats_etag_cached is None:
+        _stats_etag()
+    return _stats_etag_cached[2]
+
+
+def _stats_body(etag):
+    # type: (str) -> tuple
+    """Serialized (and gzipped) get_stats(), re-encoded only when the stats cache key changes."""
+    global _stats_rendered
+    if _stats_rendered is None or _stats_rendered[0] != etag:
+        body = _dumps(get_stats())
+        _stats_rendered = (etag, body, gzip.compress(body, compresslevel=6))
+    return _stats_rendered[1:]
+
+
+# (source path, mtime_ns, JPEG bytes): one slot, so a regenerated mosaic replaces the old bytes
+_hero_cache = None  # type: Optional[tuple]
+
+def _hero_mosaic():
+    # type: () -> Optional[bytes]
+    """1200px brightness mosaic for /mosaic-hero, re-read or re-encoded only when the source changes."""
+    global _hero_cache
+    mosaic_path = RENDERED_DIR / "mosaics" / "by_brightness.jpg"
+    if not mosaic_path.exists():
+        return None
+    hero_file = PROJECT_ROOT / "frontend" / "system" / "hero-mosaic.jpg"
+    source = hero_file if hero_file.exists() else mosaic_path
+    try:
+        mtime = source.stat().st_mtime_ns
+    except OSError:
+        return None
+    if _hero_cache is None or _hero_cache[:2] != (source, mtime):
+        if source == hero_file:
+            data = hero_file.read_bytes()
+        else:
+            import io
+            from PIL import Image as _PILImage
+            img = _PILImage.open(str(mosaic_path))
+            w, h = img.size
+            img = img.resize((1200, int(h * 1200 / w)), _PILImage.LANCZOS)
+            buf = io.BytesIO()
+            img.save(buf, "JPEG", quality=75, optimize=True)
+            data = buf.getvalue()
+        _hero_cache = (source, mtime, data)
+    return _hero_cache[2]
+
+
 class Handler(BaseHTTPRequestHandler):
+    def _cached_response(self, etag, body_fn, content_type, cache_control="no-cache",
+                         last_modified=None):
+        # 304 when the client already holds this version; body_fn only runs
+        # otherwise and returns (plain, gzipped[, brotli]) bytes
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", cache_control)
+            if last_modified:
+                self.send_header("Last-Modified", last_modified)
+            self.end_headers()
+            return
+        variants = body_fn()
+        body = variants[0]
+        accept = self.headers.get("Accept-Encoding", "")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        if len(variants) > 2 and variants[2] is not None and "br" in accept:
+            body = variants[2]
+            self.send_header("Content-Encoding", "br")
+        elif "gzip" in accept:
+            body = variants[1]
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        if last_modified:
+            self.send_header("Last-Modified", last_modified)
+        self.send_header("Cache-Control", cache_control)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream_live_page(self, etag):
+        # Stats are stale: flush the static head (CSS, sidebar, empty sections)
+        # so the browser parses it while get_stats() runs, then send the rest.
+        # The response is close-delimited (HTTP/1.0), so no Content-Length.
+        _, head, tail = _live_page_template()
+        z = None
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            z = zlib.compressobj(6, zlib.DEFLATED, 31)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", _stats_last_modified())
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(z.compress(head) + z.flush(zlib.Z_SYNC_FLUSH) if z else head)
+        self.wfile.flush()
+        rest = _inline_json(get_stats()).encode() + tail
+        self.wfile.write(z.compress(rest) + z.flush() if z else rest)
+        _store_live_page(etag, head + rest)
+
     def _json_response(self, data):
         body = json.dumps(data).encode()
         self.send_response(200)
@@ -5671,7 +6540,9 @@ class Handler(BaseHTTPRequestHandler):
 
     def do_GET(self):
         if self.path == "/api/stats":
-            self._json_response(get_stats())
+            etag = _stats_etag()
+            self._cached_response(etag, lambda: _stats_body(etag), "application/json",
+                                  last_modified=_stats_last_modified())
         elif self.path == "/api/journal":
             self._json_response({"html": get_journal_html()})
         elif self.path == "/api/instructions":
@@ -5712,25 +6583,11 @@ class Handler(BaseHTTPRequestHandler):
             else:
                 self.send_error(404)
         elif self.path == "/mosaic-hero":
-            mosaic_path = RENDERED_DIR / "mosaics" / "by_brightness.jpg"
-            if mosaic_path.exists():
-                # Serve a resized version for the hero
-                hero_cache = PROJECT_ROOT / "frontend" / "system" / "hero-mosaic.jpg"
-                if hero_cache.exists():
-                    data = hero_cache.read_bytes()
-                else:
-                    from PIL import Image as _PILImage
-                    img = _PILImage.open(str(mosaic_path))
-                    w, h = img.size
-                    new_w = 1200
-                    new_h = int(h * new_w / w)
-                    img = img.resize((new_w, new_h), _PILImage.LANCZOS)
-                    import io
-                    buf = io.BytesIO()
-                    img.save(buf, "JPEG", quality=75, optimize=True)
-                    data = buf.getvalue()
+            data = _hero_mosaic()
+            if data is not None:
                 self.send_response(200)
                 self.send_header("Content-Type", "image/jpeg")
+                self.send_header("Content-Length", str(len(data)))
                 self.send_header("Cache-Control", "public, max-age=86400")
                 self.end_headers()
                 self.wfile.write(data)
@@ -5796,14 +6653,23 @@ class Handler(BaseHTTPRequestHandler):
             self.send_header("Content-Type", "text/html")
             self.end_headers()
             self.wfile.write(html)
+        elif self.path.startswith("/static/status-deferred."):
+            _live_page_template()
+            href, etag, css, gz, br = _deferred_css
+            if self.path == href:
+                # The URL changes with the content, so it never needs revalidating
+                self._cached_response(etag, lambda: (css, gz, br), "text/css",
+                                      cache_control="public, max-age=31536000, immutable")
+            else:
+                self.send_error(404)
         else:
-            html = PAGE_HTML.replace("%%POLL_MS%%", "5000")
-            html = html.replace("%%API_URL%%", "/api/stats")
-            html = html.replace("%%INLINE_DATA%%", "null")
-            self.send_response(200)
-            self.send_header("Content-Type", "text/html")
-            self.end_headers()
-            self.wfile.write(html.encode())
+            etag = _page_etag(_stats_etag())
+            if self.headers.get("If-None-Match") == etag or (
+                    _page_rendered is not None and _page_rendered[0] == etag):
+                self._cached_response(etag, lambda: _live_page(etag), "text/html",
+                                      last_modified=_stats_last_modified())
+            else:
+                self._stream_live_page(etag)
 
     def log_message(self, fmt, *args):
         pass
@@ -5857,12 +6723,12 @@ def generate_static():
     stats = get_stats()
     html = PAGE_HTML.replace("%%POLL_MS%%", "0")
     html = html.replace("%%API_URL%%", "inline")
-    html = html.replace("%%INLINE_DATA%%", json.dumps(stats))
+    html = html.replace("%%INLINE_DATA%%", _inline_json(stats))
     html = html.replace('animation: blink 2s infinite;', 'display: none;')
     ts_pretty = datetime.now(timezone.utc).strftime("%B %-d, %Y at %H:%M UTC")
     html = html.replace('System Dashboard</p>',
                          f'As of {ts_pretty}</p>')
-    html = _static_links(html)
+    html = _minify_styles(_static_links(html))
     OUT_PATH.write_text(html)
     print(f"  system.html ({len(html):,} bytes)")
 
@@ -8,6 +8,7 @@ AI variant tracking, Gemini analysis, GCS uploads, and pipeline runs.
 """
 from __future__ import annotations
 
+import gzip
 import json
 import sqlite3
 from datetime import datetime, timezone
@@ -107,7 +108,15 @@ CREATE TABLE IF NOT EXISTS gemini_analysis (
     alt_text        TEXT,
     raw_json        TEXT NOT NULL,
     analyzed_at     TEXT NOT NULL,
-    error           TEXT
+    error           TEXT,
+    analyzed        INTEGER NOT NULL DEFAULT 0
+);
+
+-- Materialized dashboard stats, refreshed by pipeline.py after each phase
+CREATE TABLE IF NOT EXISTS dashboard_stats (
+    key             TEXT PRIMARY KEY,
+    json            TEXT NOT NULL,
+    updated_at      TEXT NOT NULL
 );
 
 -- Pipeline execution log
@@ -407,15 +416,60 @@ _MIGRATIONS = [
     ("image_analysis", "shadow_wb_b", "ALTER TABLE image_analysis ADD COLUMN shadow_wb_b REAL"),
     ("image_analysis", "highlight_wb_r", "ALTER TABLE image_analysis ADD COLUMN highlight_wb_r REAL"),
     ("image_analysis", "highlight_wb_b", "ALTER TABLE image_analysis ADD COLUMN highlight_wb_b REAL"),
+    # v4: indexed source-file extension for format breakdowns
+    ("images", "ext", "ALTER TABLE images ADD COLUMN ext TEXT "
+                      "GENERATED ALWAYS AS (lower(substr(original_path, -4))) VIRTUAL"),
+    # v5: cheap "has a successful analysis" flag, so queries skip the raw_json blob
+    ("gemini_analysis", "analyzed",
+     "ALTER TABLE gemini_analysis ADD COLUMN analyzed INTEGER NOT NULL DEFAULT 0"),
+]
+
+# Fill a freshly added column from existing data
+_MIGRATION_BACKFILLS = {
+    ("gemini_analysis", "analyzed"):
+        "UPDATE gemini_analysis SET analyzed = (raw_json IS NOT NULL AND raw_json != '')",
+}
+
+# v6: one row per gemini_analysis.vibe entry (analyzed rows only), so vibe
+# counts don't re-parse the JSON; maintained by upsert_analysis(). Created
+# by _run_migrations, which backfills it once from existing analyses.
+_VIBES_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS image_vibes (
+    image_uuid      TEXT NOT NULL REFERENCES images(uuid),
+    vibe            TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_image_vibes_uuid ON image_vibes(image_uuid);
+CREATE INDEX IF NOT EXISTS idx_image_vibes_vibe ON image_vibes(vibe);
+"""
+
+_FILL_VIBES_SQL = """
+    INSERT INTO image_vibes (image_uuid, vibe)
+    SELECT image_uuid, value FROM gemini_analysis, json_each(gemini_analysis.vibe)
+    WHERE vibe IS NOT NULL AND analyzed = 1
+"""
+
+_MIGRATION_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_images_ext ON images(ext)",
+    "CREATE INDEX IF NOT EXISTS idx_gemini_analyzed ON gemini_analysis(analyzed)",
 ]
 
 
 def _run_migrations(conn: sqlite3.Connection) -> None:
     """Add columns that don't exist yet (safe to run repeatedly)."""
     for table, column, sql in _MIGRATIONS:
-        existing = {r[1] for r in conn.execute(f"PRAGMA table_info({table})").fetchall()}
+        # table_xinfo also lists generated columns, which table_info hides
+        existing = {r[1] for r in conn.execute(f"PRAGMA table_xinfo({table})").fetchall()}
         if column not in existing:
             conn.execute(sql)
+            if (table, column) in _MIGRATION_BACKFILLS:
+                conn.execute(_MIGRATION_BACKFILLS[(table, column)])
+    for sql in _MIGRATION_INDEXES:
+        conn.execute(sql)
+    # Backfill image_vibes only in the migration that creates it (needs v5's analyzed)
+    if not conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='image_vibes'").fetchone():
+        conn.executescript(_VIBES_SCHEMA_SQL)
+        conn.execute(_FILL_VIBES_SQL)
     conn.commit()
 
 
@@ -698,8 +752,8 @@ def upsert_analysis(conn: sqlite3.Connection, *, image_uuid: str, model: str,
         INSERT INTO gemini_analysis (image_uuid, model, exposure, sharpness, lens_artifacts,
             composition_technique, depth, geometry, color_palette, semantic_pops,
             grading_style, time_of_day, setting, weather, faces_count, vibe, alt_text,
-            raw_json, analyzed_at, error)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            raw_json, analyzed_at, error, analyzed)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         ON CONFLICT(image_uuid) DO UPDATE SET
             model=excluded.model, exposure=excluded.exposure, sharpness=excluded.sharpness,
             lens_artifacts=excluded.lens_artifacts, composition_technique=excluded.composition_technique,
@@ -707,7 +761,8 @@ def upsert_analysis(conn: sqlite3.Connection, *, image_uuid: str, model: str,
             semantic_pops=excluded.semantic_pops, grading_style=excluded.grading_style,
             time_of_day=excluded.time_of_day, setting=excluded.setting, weather=excluded.weather,
             faces_count=excluded.faces_count, vibe=excluded.vibe, alt_text=excluded.alt_text,
-            raw_json=excluded.raw_json, analyzed_at=excluded.analyzed_at, error=excluded.error
+            raw_json=excluded.raw_json, analyzed_at=excluded.analyzed_at, error=excluded.error,
+            analyzed=excluded.analyzed
     """, (
         image_uuid, model,
         tech.get("exposure"), tech.get("sharpness"),
@@ -720,8 +775,10 @@ def upsert_analysis(conn: sqlite3.Connection, *, image_uuid: str, model: str,
         env.get("time"), env.get("setting"), env.get("weather"),
         narr.get("faces"), json.dumps(narr.get("vibe")) if narr.get("vibe") else None,
         narr.get("alt_text"),
-        raw_json, now, error,
+        raw_json, now, error, 1 if raw_json else 0,
     ))
+    conn.execute("DELETE FROM image_vibes WHERE image_uuid = ?", (image_uuid,))
+    conn.execute(_FILL_VIBES_SQL + " AND image_uuid = ?", (image_uuid,))
     conn.commit()
 
 
@@ -817,24 +874,39 @@ def get_stats(conn: sqlite3.Connection) -> Dict[str, Any]:
 
 
 def export_json(conn: sqlite3.Connection, output_path: Path) -> None:
-    """Export the entire database as a JSON file."""
-    data = {"version": SCHEMA_VERSION, "exported_at": _now(), "images": {}}
-    rows = conn.execute("SELECT * FROM images ORDER BY uuid").fetchall()
-    for img in rows:
-        uuid = img["uuid"]
-        entry = dict(img)
-        # Attach tiers
-        tier_rows = conn.execute(
-            "SELECT * FROM tiers WHERE image_uuid = ?", (uuid,)).fetchall()
-        entry["tiers"] = [dict(t) for t in tier_rows]
-        # Attach variants
-        var_rows = conn.execute(
-            "SELECT * FROM ai_variants WHERE image_uuid = ?", (uuid,)).fetchall()
-        entry["ai_variants"] = [dict(v) for v in var_rows]
-        # Attach analysis
-        analysis = conn.execute(
-            "SELECT * FROM gemini_analysis WHERE image_uuid = ?", (uuid,)).fetchone()
-        entry["gemini_analysis"] = dict(analysis) if analysis else None
-        data["images"][uuid] = entry
-    with open(output_path, "w") as f:
-        json.dump(data, f, indent=2)
+    """Export the entire database as a JSON file (gzipped if the path ends in .gz).
+
+    Streams one image entry at a time so memory stays flat regardless of
+    collection size.
+    """
+    opener = gzip.open if str(output_path).endswith(".gz") else open
+    header = json.dumps({"version": SCHEMA_VERSION, "exported_at": _now()})
+    with opener(output_path, "wt") as f:
+        f.write(header[:-1] + ', "images": {')
+        first = True
+        for img in conn.execute("SELECT * FROM images ORDER BY uuid"):
+            uuid = img["uuid"]
+            entry = dict(img)
+            # ext is a generated index column (v4), not part of the export schema
+            entry.pop("ext", None)
+            # Attach tiers
+            tier_rows = conn.execute(
+                "SELECT * FROM tiers WHERE image_uuid = ?", (uuid,)).fetchall()
+            entry["tiers"] = [dict(t) for t in tier_rows]
+            # Attach variants
+            var_rows = conn.execute(
+                "SELECT * FROM ai_variants WHERE image_uuid = ?", (uuid,)).fetchall()
+            entry["ai_variants"] = [dict(v) for v in var_rows]
+            # Attach analysis
+            analysis = conn.execute(
+                "SELECT * FROM gemini_analysis WHERE image_uuid = ?", (uuid,)).fetchone()
+            if analysis:
+                # analyzed is a derived query flag (v5), not part of the export schema
+                analysis = dict(analysis)
+                analysis.pop("analyzed", None)
+            entry["gemini_analysis"] = analysis
+            if not first:
+                f.write(",")
+            first = False
+            f.write(f"\n{json.dumps(uuid)}: {json.dumps(entry)}")
+        f.write("\n}}\n")
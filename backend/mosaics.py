@@ -14,10 +14,12 @@ import os
 import random
 import sqlite3
 import sys
-import colorsys
+from collections import Counter
+from multiprocessing import Pool, resource_tracker, shared_memory
 from pathlib import Path
 from typing import Optional, List, Tuple, Dict
 
+import numpy as np
 from PIL import Image
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -29,8 +31,15 @@ TARGET_SIZE = 4096
 
 def get_conn():
     # type: () -> sqlite3.Connection
-    conn = sqlite3.connect(str(DB_PATH))
+    # Pure read workload: autocommit (no implicit BEGIN), big page cache,
+    # and mmap so the wide sort-key scan reads straight from the page cache.
+    conn = sqlite3.connect(str(DB_PATH), isolation_level=None)
     conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA cache_size=-262144")  # 256 MB
+    conn.execute("PRAGMA mmap_size=8589934592")  # 8 GB
+    conn.execute("PRAGMA temp_store=MEMORY")
     return conn
 
 
@@ -43,60 +52,263 @@ def get_micro_paths():
         "WHERE tier_name='micro' AND format='jpeg' AND variant_id IS NULL"
     ).fetchall()
     conn.close()
+    # One scandir per parent directory (normally just rendered/micro/jpeg)
+    # instead of a stat() per row.
+    existing = set()
+    for d in {os.path.dirname(r["local_path"]) for r in rows if r["local_path"]}:
+        try:
+            with os.scandir(d) as it:
+                existing.update(e.path for e in it if e.is_file())
+        except OSError:
+            continue
     result = {}
     for r in rows:
         p = r["local_path"]
-        if p and os.path.exists(p):
+        if p and p in existing:
             result[r["image_uuid"]] = p
     return result
 
 
-def build_mosaic(uuids, micro_paths, filename, title):
-    # type: (List[str], Dict[str, str], str, str) -> Optional[str]
-    """Build a square mosaic from ordered UUIDs. Returns output path."""
-    # Filter to UUIDs that have micro paths
-    valid = [u for u in uuids if u in micro_paths]
-    if not valid:
-        print(f"  [SKIP] {filename} — no valid images")
-        return None
-
-    n = int(math.ceil(math.sqrt(len(valid))))
-    tile_size = TARGET_SIZE // n
-    mosaic_size = n * tile_size
-
-    print(f"  [{filename}] {len(valid)} images, {n}x{n} grid, {tile_size}px tiles, {mosaic_size}px mosaic")
-
-    mosaic = Image.new("RGB", (mosaic_size, mosaic_size), (0, 0, 0))
-
-    for idx, uuid in enumerate(valid):
-        if idx >= n * n:
-            break
-        row = idx // n
-        col = idx % n
-        x = col * tile_size
-        y = row * tile_size
-
+def _render_tile(path, tile_size):
+    # type: (str, int) -> Image.Image
+    """Decode one micro JPEG and return a center-cropped square tile."""
+    img = Image.open(path)
+    # Let libjpeg scale during IDCT (1/2, 1/4, 1/8) — tiles are ~18-24px,
+    # so decoding the full micro image is wasted work. Ask for 2x the tile
+    # size so LANCZOS still has headroom; crop math uses the drafted size.
+    img.draft("RGB", (tile_size * 2, tile_size * 2))
+    if img.mode not in ("RGB", "L"):
+        img = img.convert("RGB")
+    # Center-crop to square, then resize
+    w, h = img.size
+    side = min(w, h)
+    left = (w - side) // 2
+    top = (h - side) // 2
+    img = img.crop((left, top, left + side, top + side))
+    img = img.resize((tile_size, tile_size), Image.LANCZOS)
+    # Monochrome micros stay single-channel through crop/resize; only the
+    # finished tile is expanded to RGB.
+    if img.mode == "L":
+        img = img.convert("RGB")
+    return img
+
+
+_jpeg_encoder = None  # (TurboJPEG, pixel format, subsampling), built on first use; False if unavailable
+
+
+def _save_jpeg(canvas, out_path, quality=92):
+    # type: (np.ndarray, Path, int) -> None
+    """Encode an RGB canvas to JPEG, via libjpeg-turbo directly when available."""
+    global _jpeg_encoder
+    if _jpeg_encoder is None:
         try:
-            img = Image.open(micro_paths[uuid])
-            img = img.convert("RGB")
-            # Center-crop to square, then resize
-            w, h = img.size
-            side = min(w, h)
-            left = (w - side) // 2
-            top = (h - side) // 2
-            img = img.crop((left, top, left + side, top + side))
-            img = img.resize((tile_size, tile_size), Image.LANCZOS)
-            mosaic.paste(img, (x, y))
-        except Exception as e:
-            pass  # Leave black tile
-
+            from turbojpeg import TurboJPEG, TJPF_RGB, TJSAMP_420
+            _jpeg_encoder = (TurboJPEG(), TJPF_RGB, TJSAMP_420)
+        except (ImportError, OSError, RuntimeError):
+            # Missing package or missing native libturbojpeg
+            _jpeg_encoder = False
+    if not _jpeg_encoder:
+        Image.fromarray(canvas).save(str(out_path), "JPEG", quality=quality)
+        return
+    encoder, pixel_format, subsample = _jpeg_encoder
+    data = encoder.encode(canvas, quality=quality, pixel_format=pixel_format,
+                          jpeg_subsample=subsample)
+    with open(str(out_path), "wb") as f:
+        f.write(data)
+
+
+_blit_kernel = None  # numba kernel, compiled on first use; False if unavailable
+
+
+def _numba_blit():
+    """Return a serial numba tile-blit kernel, or None without numba.
+
+    It runs inside render_all's pool workers, which already occupy every
+    core, so a threaded (parallel=True) kernel would only oversubscribe.
+    """
+    global _blit_kernel
+    if _blit_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _blit_kernel = False
+            return None
+
+        @njit
+        def blit(tiles, order, canvas, n, t):
+            for i in range(order.shape[0]):
+                r = i // n
+                c = i % n
+                canvas[r * t:(r + 1) * t, c * t:(c + 1) * t] = tiles[order[i]]
+
+        _blit_kernel = blit
+    return _blit_kernel or None
+
+
+def _assemble(tiles, order, n, tile_size):
+    # type: (np.ndarray, np.ndarray, int, int) -> np.ndarray
+    """Place tiles[order] row-major on an n x n grid; unused cells stay black."""
+    side = n * tile_size
+    blit = _numba_blit()
+    if blit is not None:
+        canvas = np.zeros((side, side, 3), np.uint8)
+        blit(tiles, order, canvas, n, tile_size)
+        return canvas
+    # numpy: gather into an (n*n) stack, then one reshape/swap makes the canvas
+    grid = np.zeros((n * n, tile_size, tile_size, 3), np.uint8)
+    grid[:len(order)] = tiles[order]
+    canvas = grid.reshape(n, n, tile_size, tile_size, 3).swapaxes(1, 2)
+    return canvas.reshape(side, side, 3)
+
+
+def _attach_shm(name):
+    # type: (str) -> shared_memory.SharedMemory
+    """Attach a worker to the parent's tile buffer.
+
+    Workers share the parent's resource tracker (started before the pool),
+    so the attach re-registers an already-tracked name and the parent's
+    unlink() clears it once.
+    """
+    return shared_memory.SharedMemory(name=name)
+
+
+def _decode_chunk(shm_name, shape, start, paths, tile_size):
+    # type: (str, Tuple[int, ...], int, List[str], int) -> None
+    """Pool worker: decode a run of micro JPEGs into the shared tile buffer."""
+    shm = _attach_shm(shm_name)
+    try:
+        tiles = np.ndarray(shape, np.uint8, buffer=shm.buf)
+        for i, path in enumerate(paths, start):
+            try:
+                tiles[i] = np.asarray(_render_tile(path, tile_size))
+            except Exception as e:
+                pass  # Leave black tile
+        del tiles
+    finally:
+        shm.close()
+
+
+def _render_job(shm_name, shape, order, n, tile_size, filename):
+    # type: (str, Tuple[int, ...], np.ndarray, int, int, str) -> str
+    """Pool worker: assemble one mosaic from the shared tile buffer and save it."""
+    shm = _attach_shm(shm_name)
+    try:
+        tiles = np.ndarray(shape, np.uint8, buffer=shm.buf)
+        canvas = _assemble(tiles, order, n, tile_size)
+        del tiles
+    finally:
+        shm.close()
     out_path = MOSAIC_DIR / f"{filename}.jpg"
-    mosaic.save(str(out_path), "JPEG", quality=92)
+    _save_jpeg(canvas, out_path)
     size_mb = out_path.stat().st_size / (1024 * 1024)
     print(f"    → {out_path.name} ({size_mb:.1f} MB)")
     return str(out_path)
 
 
+def render_all(jobs, micro_paths, workers=None):
+    # type: (List[Tuple[List[str], str]], Dict[str, str], Optional[int]) -> None
+    """Render (ordered_uuids, filename) jobs across a process pool.
+
+    Tiles are decoded once per tile size — in parallel, straight into a
+    SharedMemory buffer — and every mosaic at that size is then assembled
+    and encoded by its own worker reading the same buffer.
+    """
+    plans = {}  # type: Dict[int, List[Tuple[List[str], int, str]]]
+    for ordered, filename in jobs:
+        valid = [u for u in ordered if u in micro_paths]
+        if not valid:
+            print(f"  [SKIP] {filename} — no valid images")
+            continue
+        n = int(math.ceil(math.sqrt(len(valid))))
+        tile_size = TARGET_SIZE // n
+        print(f"  [{filename}] {len(valid)} images, {n}x{n} grid, {tile_size}px tiles, "
+              f"{n * tile_size}px mosaic")
+        plans.setdefault(tile_size, []).append((valid, n, filename))
+
+    workers = workers or os.cpu_count() or 1
+    # Start the tracker before forking/spawning so every worker inherits it
+    resource_tracker.ensure_running()
+    with Pool(workers) as pool:
+        for tile_size, planned in plans.items():
+            uuids = sorted({u for valid, _, _ in planned for u in valid})
+            index = {u: i for i, u in enumerate(uuids)}
+            shape = (len(uuids), tile_size, tile_size, 3)
+            # Fresh shared memory is zero-filled, so failed decodes stay black
+            shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)))
+            try:
+                step = max(1, len(uuids) // (workers * 4))
+                pool.starmap(_decode_chunk, [
+                    (shm.name, shape, start, [micro_paths[u] for u in uuids[start:start + step]], tile_size)
+                    for start in range(0, len(uuids), step)
+                ])
+                pool.starmap(_render_job, [
+                    (shm.name, shape, np.fromiter((index[u] for u in valid), np.intp, len(valid)),
+                     n, tile_size, filename)
+                    for valid, n, filename in planned
+                ])
+            finally:
+                shm.close()
+                shm.unlink()
+
+
+def _hue_saturation(rgb):
+    # type: (np.ndarray) -> Tuple[np.ndarray, np.ndarray]
+    """Vectorized colorsys.rgb_to_hsv over an (N, 3) array in [0, 1]; returns (h, s)."""
+    maxc = rgb.max(axis=1)
+    minc = rgb.min(axis=1)
+    rangec = maxc - minc
+    grey = rangec == 0
+    safe = np.where(grey, 1.0, rangec)
+    sat = np.where(grey, 0.0, rangec / np.where(maxc == 0, 1.0, maxc))
+    rc, gc, bc = ((maxc[:, None] - rgb) / safe[:, None]).T
+    r, g = rgb[:, 0], rgb[:, 1]
+    hue = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+    hue = np.where(grey, 0.0, (hue / 6.0) % 1.0)
+    return hue, sat
+
+
+def load_micro_table(conn, micro_paths):
+    # type: (sqlite3.Connection, Dict[str, str]) -> None
+    """Load the micro-tile uuids into TEMP TABLE micro so queries can JOIN on it."""
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS micro (uuid TEXT PRIMARY KEY)")
+    conn.execute("BEGIN")
+    conn.execute("DELETE FROM micro")
+    conn.executemany("INSERT INTO micro VALUES (?)", ((u,) for u in micro_paths))
+    conn.execute("COMMIT")
+    conn.execute("ANALYZE micro")
+
+
+def load_sort_keys(conn):
+    # type: (sqlite3.Connection) -> List[sqlite3.Row]
+    """Fetch every sortable dimension for micro-tile images in one joined pass.
+
+    Every per-image table here is keyed by image_uuid, so the LEFT JOINs
+    yield exactly one row per image. Rows come back ordered by uuid so
+    that stable sorts downstream are deterministic. Requires
+    load_micro_table().
+    """
+    return conn.execute(
+        "SELECT i.uuid, i.category, i.subcategory, "
+        "a.mean_brightness, a.dominant_hue, a.mean_saturation, "
+        "a.est_color_temp, a.contrast_ratio, h.blur_score, "
+        "g.time_of_day, g.grading_style, e.gps_lat "
+        "FROM images i JOIN micro m ON m.uuid = i.uuid "
+        "LEFT JOIN image_analysis a ON a.image_uuid = i.uuid "
+        "LEFT JOIN image_hashes h ON h.image_uuid = i.uuid "
+        "LEFT JOIN gemini_analysis g ON g.image_uuid = i.uuid "
+        "LEFT JOIN exif_metadata e ON e.image_uuid = i.uuid "
+        "ORDER BY i.uuid"
+    ).fetchall()
+
+
+def _ordered_by(rows, column):
+    # type: (List[sqlite3.Row], str) -> List[str]
+    """UUIDs sorted ascending by column, skipping rows where it is NULL."""
+    present = [r for r in rows if r[column] is not None]
+    present.sort(key=lambda r: r[column])
+    return [r["uuid"] for r in present]
+
+
 def generate_all():
     # type: () -> List[Dict]
     """Generate all mosaic variants. Returns metadata list."""
@@ -105,18 +317,22 @@ def generate_all():
     micro_paths = get_micro_paths()
     all_uuids = list(micro_paths.keys())
 
+    load_micro_table(conn, micro_paths)
+    keys = load_sort_keys(conn)
+
     print(f"Loaded {len(all_uuids)} images with micro tier paths")
     print(f"Target: {TARGET_SIZE}px mosaics")
     print()
 
     mosaics = []  # type: List[Dict]
+    jobs = []  # type: List[Tuple[List[str], str]]
 
     # ── 1. Random ─────────────────────────────────────────────
     print("1/14 Random")
     shuffled = list(all_uuids)
     random.seed(42)
     random.shuffle(shuffled)
-    build_mosaic(shuffled, micro_paths, "random", "Random")
+    jobs.append((shuffled, "random"))
     mosaics.append({
         "file": "random.jpg",
         "title": "Random",
@@ -126,17 +342,10 @@ def generate_all():
 
     # ── 2. By Category ───────────────────────────────────────
     print("2/14 By Category")
-    rows = conn.execute(
-        "SELECT uuid, category FROM images ORDER BY category, uuid"
-    ).fetchall()
-    ordered = [r["uuid"] for r in rows if r["uuid"] in micro_paths]
-    cats = {}
-    for r in rows:
-        cats.setdefault(r["category"], 0)
-        if r["uuid"] in micro_paths:
-            cats[r["category"]] += 1
-    build_mosaic(ordered, micro_paths, "by_category", "By Category")
-    cat_desc = ", ".join(f"{k}: {v}" for k, v in sorted(cats.items(), key=lambda x: -x[1]))
+    ordered = [r["uuid"] for r in sorted(keys, key=lambda r: (r["category"] or "", r["uuid"]))]
+    cats = Counter(r["category"] for r in keys)
+    jobs.append((ordered, "by_category"))
+    cat_desc = ", ".join(f"{k}: {v}" for k, v in cats.most_common())
     mosaics.append({
         "file": "by_category.jpg",
         "title": "By Category",
@@ -157,25 +366,19 @@ def generate_all():
         ("Osmo", "OsmoPro"): "DJI Osmo Pro", ("Osmo", "OsmoMemo"): "DJI Osmo Memo",
         ("Osmo", None): "DJI Osmo",
     }
-    rows = conn.execute("SELECT uuid, category, subcategory FROM images").fetchall()
     cam_order = ["Leica Analog", "Leica Digital", "Leica Monochrom", "Canon G12", "DJI Osmo Pro", "DJI Osmo Memo"]
     cam_groups = {c: [] for c in cam_order}
-    for r in rows:
-        if r["uuid"] not in micro_paths:
-            continue
+    for r in keys:
         cam = _cam_map.get((r["category"], r["subcategory"]),
                            _cam_map.get((r["category"], None), r["category"]))
-        if cam in cam_groups:
-            cam_groups[cam].append(r["uuid"])
-        else:
-            cam_groups.setdefault(cam, []).append(r["uuid"])
+        cam_groups.setdefault(cam, []).append(r["uuid"])
     ordered = []
     cam_desc_parts = []
     for cam in cam_order:
         if cam in cam_groups:
             cam_desc_parts.append(f"{cam}: {len(cam_groups[cam])}")
             ordered.extend(cam_groups[cam])
-    build_mosaic(ordered, micro_paths, "by_camera", "By Camera Body")
+    jobs.append((ordered, "by_camera"))
     mosaics.append({
         "file": "by_camera.jpg",
         "title": "By Camera Body",
@@ -185,12 +388,8 @@ def generate_all():
 
     # ── 4. By Brightness (dark → light) ──────────────────────
     print("4/14 By Brightness")
-    rows = conn.execute(
-        "SELECT image_uuid, mean_brightness FROM image_analysis "
-        "WHERE mean_brightness IS NOT NULL ORDER BY mean_brightness ASC"
-    ).fetchall()
-    ordered = [r["image_uuid"] for r in rows if r["image_uuid"] in micro_paths]
-    build_mosaic(ordered, micro_paths, "by_brightness", "By Brightness")
+    ordered = _ordered_by(keys, "mean_brightness")
+    jobs.append((ordered, "by_brightness"))
     mosaics.append({
         "file": "by_brightness.jpg",
         "title": "By Brightness",
@@ -200,12 +399,8 @@ def generate_all():
 
     # ── 5. By Dominant Hue ────────────────────────────────────
     print("5/14 By Dominant Hue")
-    rows = conn.execute(
-        "SELECT image_uuid, dominant_hue FROM image_analysis "
-        "WHERE dominant_hue IS NOT NULL ORDER BY dominant_hue ASC"
-    ).fetchall()
-    ordered = [r["image_uuid"] for r in rows if r["image_uuid"] in micro_paths]
-    build_mosaic(ordered, micro_paths, "by_hue", "By Dominant Hue")
+    ordered = _ordered_by(keys, "dominant_hue")
+    jobs.append((ordered, "by_hue"))
     mosaics.append({
         "file": "by_hue.jpg",
         "title": "By Dominant Hue",
@@ -215,12 +410,8 @@ def generate_all():
 
     # ── 6. By Saturation ─────────────────────────────────────
     print("6/14 By Saturation")
-    rows = conn.execute(
-        "SELECT image_uuid, mean_saturation FROM image_analysis "
-        "WHERE mean_saturation IS NOT NULL ORDER BY mean_saturation ASC"
-    ).fetchall()
-    ordered = [r["image_uuid"] for r in rows if r["image_uuid"] in micro_paths]
-    build_mosaic(ordered, micro_paths, "by_saturation", "By Saturation")
+    ordered = _ordered_by(keys, "mean_saturation")
+    jobs.append((ordered, "by_saturation"))
     mosaics.append({
         "file": "by_saturation.jpg",
         "title": "By Saturation",
@@ -230,12 +421,8 @@ def generate_all():
 
     # ── 7. By Color Temperature ───────────────────────────────
     print("7/14 By Color Temperature")
-    rows = conn.execute(
-        "SELECT image_uuid, est_color_temp FROM image_analysis "
-        "WHERE est_color_temp IS NOT NULL ORDER BY est_color_temp ASC"
-    ).fetchall()
-    ordered = [r["image_uuid"] for r in rows if r["image_uuid"] in micro_paths]
-    build_mosaic(ordered, micro_paths, "by_colortemp", "By Color Temperature")
+    ordered = _ordered_by(keys, "est_color_temp")
+    jobs.append((ordered, "by_colortemp"))
     mosaics.append({
         "file": "by_colortemp.jpg",
         "title": "By Color Temperature",
@@ -246,19 +433,14 @@ def generate_all():
     # ── 8. By Dominant Color (K-means cluster 0 hue) ─────────
     print("8/14 By Dominant Color")
     rows = conn.execute(
-        "SELECT image_uuid, r, g, b FROM dominant_colors WHERE cluster_index = 0"
+        "SELECT d.image_uuid, d.r, d.g, d.b FROM dominant_colors d "
+        "JOIN micro m ON m.uuid = d.image_uuid WHERE d.cluster_index = 0"
     ).fetchall()
-    uuid_hue = []
-    for r in rows:
-        if r["image_uuid"] not in micro_paths:
-            continue
-        rgb = (r["r"] / 255.0, r["g"] / 255.0, r["b"] / 255.0)
-        h, s, v = colorsys.rgb_to_hsv(*rgb)
-        uuid_hue.append((r["image_uuid"], h, s, v))
+    rgb = np.array([(r["r"], r["g"], r["b"]) for r in rows], np.float64).reshape(-1, 3)
+    hue, sat = _hue_saturation(rgb / 255.0)
     # Sort by hue, then saturation
-    uuid_hue.sort(key=lambda x: (x[1], x[2]))
-    ordered = [u[0] for u in uuid_hue]
-    build_mosaic(ordered, micro_paths, "by_dominant_color", "By Dominant Color")
+    ordered = [rows[i]["image_uuid"] for i in np.lexsort((sat, hue))]
+    jobs.append((ordered, "by_dominant_color"))
     mosaics.append({
         "file": "by_dominant_color.jpg",
         "title": "By Dominant Color",
@@ -268,12 +450,8 @@ def generate_all():
 
     # ── 9. By Contrast ───────────────────────────────────────
     print("9/14 By Contrast")
-    rows = conn.execute(
-        "SELECT image_uuid, contrast_ratio FROM image_analysis "
-        "WHERE contrast_ratio IS NOT NULL ORDER BY contrast_ratio ASC"
-    ).fetchall()
-    ordered = [r["image_uuid"] for r in rows if r["image_uuid"] in micro_paths]
-    build_mosaic(ordered, micro_paths, "by_contrast", "By Contrast")
+    ordered = _ordered_by(keys, "contrast_ratio")
+    jobs.append((ordered, "by_contrast"))
     mosaics.append({
         "file": "by_contrast.jpg",
         "title": "By Contrast",
@@ -283,12 +461,8 @@ def generate_all():
 
     # ── 10. By Sharpness (blur score) ─────────────────────────
     print("10/14 By Sharpness")
-    rows = conn.execute(
-        "SELECT image_uuid, blur_score FROM image_hashes "
-        "WHERE blur_score IS NOT NULL ORDER BY blur_score ASC"
-    ).fetchall()
-    ordered = [r["image_uuid"] for r in rows if r["image_uuid"] in micro_paths]
-    build_mosaic(ordered, micro_paths, "by_sharpness", "By Sharpness")
+    ordered = _ordered_by(keys, "blur_score")
+    jobs.append((ordered, "by_sharpness"))
     mosaics.append({
         "file": "by_sharpness.jpg",
         "title": "By Sharpness",
@@ -300,24 +474,18 @@ def generate_all():
     print("11/14 By Time of Day")
     time_order = {"dawn": 0, "sunrise": 1, "morning": 2, "midday": 3, "afternoon": 4,
                   "golden hour": 5, "sunset": 6, "twilight": 7, "evening": 8, "night": 9}
-    rows = conn.execute(
-        "SELECT image_uuid, time_of_day FROM gemini_analysis "
-        "WHERE time_of_day IS NOT NULL"
-    ).fetchall()
     time_list = []
-    for r in rows:
-        if r["image_uuid"] not in micro_paths:
+    for r in keys:
+        if r["time_of_day"] is None:
             continue
-        tod = (r["time_of_day"] or "").strip().lower()
+        tod = r["time_of_day"].strip().lower()
         order = time_order.get(tod, 5)
-        time_list.append((r["image_uuid"], order, tod))
+        time_list.append((r["uuid"], order, tod))
     time_list.sort(key=lambda x: x[1])
     ordered = [t[0] for t in time_list]
-    time_counts = {}
-    for t in time_list:
-        time_counts[t[2]] = time_counts.get(t[2], 0) + 1
+    time_counts = Counter(t[2] for t in time_list)
     td = ", ".join(f"{k}: {v}" for k, v in sorted(time_counts.items(), key=lambda x: time_order.get(x[0], 99)))
-    build_mosaic(ordered, micro_paths, "by_time_of_day", "By Time of Day")
+    jobs.append((ordered, "by_time_of_day"))
     mosaics.append({
         "file": "by_time_of_day.jpg",
         "title": "By Time of Day",
@@ -327,22 +495,16 @@ def generate_all():
 
     # ── 12. By Grading Style (Gemini) ─────────────────────────
     print("12/14 By Grading Style")
-    rows = conn.execute(
-        "SELECT image_uuid, grading_style FROM gemini_analysis "
-        "WHERE grading_style IS NOT NULL"
-    ).fetchall()
     grade_list = []
-    for r in rows:
-        if r["image_uuid"] not in micro_paths:
+    for r in keys:
+        if r["grading_style"] is None:
             continue
-        grade_list.append((r["image_uuid"], (r["grading_style"] or "").strip().lower()))
+        grade_list.append((r["uuid"], r["grading_style"].strip().lower()))
     grade_list.sort(key=lambda x: x[1])
     ordered = [g[0] for g in grade_list]
-    grade_counts = {}
-    for g in grade_list:
-        grade_counts[g[1]] = grade_counts.get(g[1], 0) + 1
-    gd = ", ".join(f"{k}: {v}" for k, v in sorted(grade_counts.items(), key=lambda x: -x[1])[:8])
-    build_mosaic(ordered, micro_paths, "by_grading", "By Grading Style")
+    grade_counts = Counter(g[1] for g in grade_list)
+    gd = ", ".join(f"{k}: {v}" for k, v in grade_counts.most_common(8))
+    jobs.append((ordered, "by_grading"))
     mosaics.append({
         "file": "by_grading.jpg",
         "title": "By Grading Style",
@@ -352,35 +514,31 @@ def generate_all():
 
     # ── 13. Faces First ───────────────────────────────────────
     print("13/14 Faces First")
+    # Most faces first, then faceless images; uuid breaks ties deterministically
     rows = conn.execute(
-        "SELECT image_uuid, COUNT(*) as fc FROM face_detections "
-        "GROUP BY image_uuid ORDER BY fc DESC"
+        "SELECT m.uuid, COALESCE(f.fc, 0) AS fc FROM micro m "
+        "LEFT JOIN (SELECT image_uuid, COUNT(*) AS fc FROM face_detections "
+        "GROUP BY image_uuid) f ON f.image_uuid = m.uuid "
+        "ORDER BY fc DESC, m.uuid"
     ).fetchall()
-    face_uuids = [r["image_uuid"] for r in rows if r["image_uuid"] in micro_paths]
-    # Add remaining images (no faces) sorted randomly
-    no_face = [u for u in all_uuids if u not in set(face_uuids)]
-    random.seed(42)
-    random.shuffle(no_face)
-    ordered = face_uuids + no_face
-    build_mosaic(ordered, micro_paths, "by_faces", "Faces First")
+    ordered = [r["uuid"] for r in rows]
+    n_faces = sum(1 for r in rows if r["fc"])
+    jobs.append((ordered, "by_faces"))
     mosaics.append({
         "file": "by_faces.jpg",
         "title": "Faces First",
-        "desc": f"{len(face_uuids)} images with faces (sorted by face count, most first), then {len(no_face)} without",
+        "desc": f"{n_faces} images with faces (sorted by face count, most first), then {len(ordered) - n_faces} without",
         "count": len(ordered)
     })
 
     # ── 14. By GPS Latitude ───────────────────────────────────
     print("14/14 By GPS Latitude")
-    rows = conn.execute(
-        "SELECT image_uuid, gps_lat FROM exif_metadata "
-        "WHERE gps_lat IS NOT NULL ORDER BY gps_lat ASC"
-    ).fetchall()
-    ordered = [r["image_uuid"] for r in rows if r["image_uuid"] in micro_paths]
+    with_gps = sorted((r for r in keys if r["gps_lat"] is not None), key=lambda r: r["gps_lat"])
+    ordered = [r["uuid"] for r in with_gps]
     if len(ordered) > 100:
-        lat_min = conn.execute("SELECT MIN(gps_lat) FROM exif_metadata WHERE gps_lat IS NOT NULL").fetchone()[0]
-        lat_max = conn.execute("SELECT MAX(gps_lat) FROM exif_metadata WHERE gps_lat IS NOT NULL").fetchone()[0]
-        build_mosaic(ordered, micro_paths, "by_latitude", "By GPS Latitude")
+        lat_min = with_gps[0]["gps_lat"]
+        lat_max = with_gps[-1]["gps_lat"]
+        jobs.append((ordered, "by_latitude"))
         mosaics.append({
             "file": "by_latitude.jpg",
             "title": "By GPS Latitude",
@@ -392,6 +550,9 @@ def generate_all():
 
     conn.close()
 
+    print(f"\nRendering {len(jobs)} mosaics...")
+    render_all(jobs, micro_paths)
+
     # Save metadata
     meta_path = MOSAIC_DIR / "mosaics.json"
     with open(str(meta_path), "w") as f:
@@ -103,6 +103,15 @@ def run_script(script: str, args: list, description: str) -> bool:
     return result.returncode == 0
 
 
+def refresh_dashboard_stats(conn) -> None:
+    """Re-materialize the dashboard stats after a phase; never fail the run over it."""
+    try:
+        from dashboard import persist_stats
+        persist_stats(conn, db.DB_PATH)
+    except Exception as e:
+        print(f"  WARNING: dashboard stats not refreshed: {e!r}", file=sys.stderr)
+
+
 def check_gcloud_auth() -> bool:
     """Check if gcloud is authenticated."""
     result = subprocess.run(["gcloud", "auth", "print-access-token"],
@@ -319,7 +328,7 @@ def phase_upload_variants() -> bool:
 def phase_finalize(conn) -> bool:
     """Phase 7: Export database, upload metadata, generate report."""
     # Export comprehensive JSON
-    export_path = PROJECT_ROOT / "mad_photos_export.json"
+    export_path = PROJECT_ROOT / "mad_photos_export.json.gz"
     print("Exporting database to JSON...")
     db.export_json(conn, export_path)
     print(f"  Exported to {export_path}")
@@ -393,6 +402,7 @@ def main() -> None:
                 print("\nRender phase failed. Fix errors and re-run.")
                 if phase:
                     sys.exit(1)
+            refresh_dashboard_stats(conn)
             if phase:
                 conn.close()
                 return
@@ -402,6 +412,7 @@ def main() -> None:
                 print("\nUpload phase failed. Check gcloud auth and re-run.")
                 if phase:
                     sys.exit(1)
+            refresh_dashboard_stats(conn)
             if phase:
                 conn.close()
                 return
@@ -410,6 +421,7 @@ def main() -> None:
             if not phase_gemini(args.test, args.concurrent, args.max_retries):
                 print("\nGemini phase had failures. Re-run to retry.")
                 # Don't abort — continue to next phase
+            refresh_dashboard_stats(conn)
             if phase:
                 conn.close()
                 return
@@ -417,6 +429,7 @@ def main() -> None:
         if phase is None or phase == "imagen":
             if not phase_imagen(args.test, args.batch_size, args.concurrent):
                 print("\nImagen phase had failures. Re-run to retry.")
+            refresh_dashboard_stats(conn)
             if phase:
                 conn.close()
                 return
@@ -424,6 +437,7 @@ def main() -> None:
         if phase is None or phase == "render-variants":
             if not phase_render_variants(args.test, args.workers):
                 print("\nVariant rendering had failures.")
+            refresh_dashboard_stats(conn)
             if phase:
                 conn.close()
                 return
@@ -431,12 +445,14 @@ def main() -> None:
         if phase is None or phase == "upload-variants":
             if not phase_upload_variants():
                 print("\nVariant upload failed. Check gcloud auth and re-run.")
+            refresh_dashboard_stats(conn)
             if phase:
                 conn.close()
                 return
 
         if phase is None or phase == "finalize":
             phase_finalize(conn)
+            refresh_dashboard_stats(conn)
 
         elapsed = datetime.now() - start
         print(f"\nPipeline complete in {elapsed}.")
@@ -2,7 +2,8 @@
 """
 gcs_sync.py — Upload rendered assets to Google Cloud Storage.
 
-Uses gsutil for efficient parallel transfers. Mirrors the local flat layout
+Uses the google-cloud-storage transfer manager for parallel in-process
+transfers (falling back to gsutil when it is not installed). Mirrors the local flat layout
 into a versioned GCS structure.
 
 Local layout:
@@ -16,6 +17,7 @@ GCS layout:
     v/enhanced_v2/{tier}/{format}/{uuid}.ext
     v/{variant_type}/{tier}/{format}/{id}.ext
     meta/photos.json
+    meta/mad_photos_export.json                  (gzip Content-Encoding)
     meta/mad_photos.db
 
 Usage:
@@ -26,11 +28,15 @@ Usage:
     python gcs_sync.py --version metadata        # Upload DB + JSON export
     python gcs_sync.py --dry-run                 # Show what would be synced
     python gcs_sync.py --verify                  # Spot-check GCS uploads
+    python gcs_sync.py --verify-all              # Check every local file in GCS
     python gcs_sync.py --tiers display,thumb     # Only specific tiers
 """
 from __future__ import annotations
 
 import argparse
+import base64
+import hashlib
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -53,6 +59,10 @@ PUBLIC_BASE = "https://storage.googleapis.com/myproject-public-assets/art/MADpho
 SERVING_TIERS = ["display", "mobile", "thumb", "micro"]
 FORMATS = ["jpeg", "webp"]
 
+# Files above this size go through parallel chunked uploads (e.g. the DB)
+LARGE_FILE_THRESHOLD = 100 * 1024 * 1024
+LARGE_FILE_CHUNK = 32 * 1024 * 1024
+
 # Versions and their local base directories (relative to RENDERED_DIR)
 # Each version contains {tier}/{format}/{uuid}.ext
 VERSION_MAP = {
@@ -77,15 +87,152 @@ def gsutil_rsync(local_dir: str, gcs_dir: str, dry_run: bool = False) -> bool:
     return result.returncode == 0
 
 
-def gsutil_cp(local_path: str, gcs_path: str) -> bool:
-    """Copy a single file to GCS."""
-    cmd = ["gsutil", "cp", local_path, gcs_path]
+def split_gcs_url(gcs_url: str) -> tuple:
+    """Split gs://bucket/some/prefix into ("bucket", "some/prefix")."""
+    bucket, _, prefix = gcs_url[len("gs://"):].partition("/")
+    return bucket, prefix.rstrip("/")
+
+
+def scan_dir(local_dir: str) -> tuple:
+    """Walk a directory once with os.scandir. Returns (relative_files, total_bytes).
+
+    DirEntry caches the stat result from the directory read, so counting,
+    sizing and listing files for upload cost a single pass.
+    """
+    files = []
+    total = 0
+    stack = [(local_dir, "")]
+    while stack:
+        path, rel = stack.pop()
+        with os.scandir(path) as it:
+            for e in it:
+                name = f"{rel}{e.name}"
+                if e.is_dir(follow_symlinks=False):
+                    stack.append((e.path, f"{name}/"))
+                elif e.is_file(follow_symlinks=False):
+                    files.append(name)
+                    total += e.stat(follow_symlinks=False).st_size
+    files.sort()
+    return files, total
+
+
+def local_md5(path: str) -> str:
+    """Base64 MD5 of a local file, in the form GCS reports as Blob.md5_hash."""
+    h = hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return base64.b64encode(h.digest()).decode()
+
+
+def changed_files(bucket, prefix: str, local_dir: str, filenames: list) -> list:
+    """Return the filenames whose object is missing or differs in size or MD5.
+
+    One listing of the prefix yields every remote size and hash; a local
+    file is only hashed when its size already matches the object's.
+    """
+    remote = {b.name[len(prefix) + 1:]: (b.size, b.md5_hash)
+              for b in bucket.list_blobs(prefix=f"{prefix}/")}
+    dirty = []
+    for name in filenames:
+        path = os.path.join(local_dir, name)
+        have = remote.get(name)
+        if (have is None or have[0] != os.path.getsize(path)
+                or have[1] != local_md5(path)):
+            dirty.append(name)
+    return dirty
+
+
+def upload_dir(local_dir: str, gcs_dir: str, dry_run: bool = False,
+               max_workers: int = 16, filenames: Optional[list] = None) -> bool:
+    """Upload a directory tree in-process via the GCS transfer manager.
+
+    Avoids forking gsutil and its per-worker interpreters. Only files whose
+    object is missing or differs in size or MD5 are sent, so re-rendered
+    files replace their stale objects as with rsync. Falls back to
+    gsutil_rsync, which does its own comparison, when google-cloud-storage
+    is not installed.
+    """
+    if filenames is None:
+        filenames, _ = scan_dir(local_dir)
+
+    try:
+        from google.cloud.storage import Client, transfer_manager
+    except ImportError:
+        return gsutil_rsync(local_dir, gcs_dir, dry_run=dry_run)
+    bucket_name, prefix = split_gcs_url(gcs_dir)
+    bucket = Client().bucket(bucket_name)
+    filenames = changed_files(bucket, prefix, local_dir, filenames)
+    if dry_run:
+        for name in filenames:
+            print(f"    DRY RUN: {name} → gs://{bucket_name}/{prefix}/{name}")
+        return True
+    if not filenames:
+        print(f"    up to date: {gcs_dir}")
+        return True
+
+    print(f"    transfer_manager: {len(filenames)} changed files → {gcs_dir}")
+    results = transfer_manager.upload_many_from_filenames(
+        bucket, filenames,
+        source_directory=local_dir,
+        blob_name_prefix=f"{prefix}/",
+        worker_type=transfer_manager.PROCESS,
+        max_workers=max_workers,
+    )
+    failed = [name for name, r in zip(filenames, results) if isinstance(r, Exception)]
+    for name in failed[:10]:
+        print(f"    ERROR: {name}", file=sys.stderr)
+    if failed:
+        print(f"    {len(failed)}/{len(filenames)} uploads failed", file=sys.stderr)
+    return not failed
+
+
+def gsutil_cp(local_path: str, gcs_path: str, headers: Optional[list] = None) -> bool:
+    """Copy a single file to GCS, optionally setting object metadata headers."""
+    cmd = ["gsutil"]
+    for h in headers or []:
+        cmd.extend(["-h", h])
+    cmd.extend(["cp", local_path, gcs_path])
     result = subprocess.run(cmd, capture_output=True, text=True)
     if result.returncode != 0:
         print(f"    ERROR: {result.stderr.strip()}", file=sys.stderr)
     return result.returncode == 0
 
 
+def upload_large_file(local_path: str, gcs_path: str, attempts: int = 3) -> bool:
+    """Upload one big file as concurrent XML multipart chunks.
+
+    The transfer manager uploads byte ranges in parallel and GCS stitches
+    them server-side, instead of pushing one single-stream upload. Retries
+    the whole transfer with jittered backoff; falls back to gsutil_cp when
+    google-cloud-storage is not installed.
+    """
+    try:
+        from google.cloud.storage import Client, transfer_manager
+    except ImportError:
+        return gsutil_cp(local_path, gcs_path)
+
+    import random
+    import time
+
+    bucket_name, blob_name = split_gcs_url(gcs_path)
+    blob = Client().bucket(bucket_name).blob(blob_name)
+    for attempt in range(1, attempts + 1):
+        try:
+            transfer_manager.upload_chunks_concurrently(
+                local_path, blob,
+                chunk_size=LARGE_FILE_CHUNK,
+                worker_type=transfer_manager.PROCESS,
+                max_workers=8,
+            )
+            return True
+        except Exception as e:
+            print(f"    ERROR (attempt {attempt}/{attempts}): {e}", file=sys.stderr)
+            if attempt < attempts:
+                time.sleep(2 ** attempt + random.uniform(0, 1))
+    return False
+
+
 def set_cache_headers(gcs_dir: str) -> None:
     """Set immutable Cache-Control headers for web serving."""
     cmd = [
@@ -114,14 +261,16 @@ def sync_version(version: str, local_base: Path, dry_run: bool = False,
             if not local_dir.exists():
                 continue
 
-            file_count = len(list(local_dir.iterdir()))
-            if file_count == 0:
+            filenames, total_bytes = scan_dir(str(local_dir))
+            if not filenames:
                 continue
 
             gcs_dir = f"{GCS_BUCKET}/v/{version}/{tier}/{fmt}"
-            print(f"  {tier}/{fmt} ({file_count} files) → v/{version}/{tier}/{fmt}")
+            print(f"  {tier}/{fmt} ({len(filenames)} files, {total_bytes / (1024 * 1024):.1f} MB)"
+                  f" → v/{version}/{tier}/{fmt}")
 
-            success = gsutil_rsync(str(local_dir), gcs_dir, dry_run=dry_run)
+            success = upload_dir(str(local_dir), gcs_dir, dry_run=dry_run,
+                                 filenames=filenames)
             if success and not dry_run:
                 set_cache_headers(gcs_dir)
                 synced += 1
@@ -138,32 +287,109 @@ def sync_metadata(dry_run: bool = False) -> None:
 
     # Database
     if db.DB_PATH.exists():
-        files_to_upload.append((str(db.DB_PATH), f"{gcs_meta}/mad_photos.db"))
+        files_to_upload.append((str(db.DB_PATH), f"{gcs_meta}/mad_photos.db", None))
+
+    # Full JSON export (streamed + gzipped by pipeline finalize); served with
+    # Content-Encoding so clients transparently decompress it
+    export_gz = PROJECT_ROOT / "mad_photos_export.json.gz"
+    if export_gz.exists():
+        files_to_upload.append((str(export_gz), f"{gcs_meta}/mad_photos_export.json",
+                                ["Content-Encoding:gzip", "Content-Type:application/json"]))
 
     # Gallery JSON
     gallery_json = PROJECT_ROOT / "frontend" / "show" / "data" / "photos.json"
     if gallery_json.exists():
-        files_to_upload.append((str(gallery_json), f"{gcs_meta}/photos.json"))
+        files_to_upload.append((str(gallery_json), f"{gcs_meta}/photos.json", None))
 
     # Manifest
     manifest = RENDERED_DIR / "manifest.json"
     if manifest.exists():
-        files_to_upload.append((str(manifest), f"{gcs_meta}/manifest.json"))
+        files_to_upload.append((str(manifest), f"{gcs_meta}/manifest.json", None))
 
-    for local, gcs in files_to_upload:
+    for local, gcs, headers in files_to_upload:
         if dry_run:
             print(f"    DRY RUN: {Path(local).name} → {gcs}")
         else:
             print(f"    {Path(local).name} → {gcs}")
-            gsutil_cp(local, gcs)
+            if headers is None and Path(local).stat().st_size >= LARGE_FILE_THRESHOLD:
+                upload_large_file(local, gcs)
+            else:
+                gsutil_cp(local, gcs, headers=headers)
 
 
 # ---------------------------------------------------------------------------
 # Verify
 # ---------------------------------------------------------------------------
 
-def verify(sample_size: int = 50) -> None:
-    """Spot-check that GCS files exist for each version."""
+def gcs_exists_many(gcs_urls: list, workers: int = 64) -> list:
+    """Check which GCS objects exist. Returns a list of bools in input order.
+
+    Uses one authenticated storage client with a thread pool so the HEAD
+    requests share pooled connections. Without google-cloud-storage, a
+    single `gsutil stat` call covers the whole batch.
+    """
+    try:
+        from google.cloud.storage import Client
+    except ImportError:
+        result = subprocess.run(
+            ["gsutil", "stat"] + list(gcs_urls),
+            capture_output=True, text=True
+        )
+        found = {line[:-1] for line in result.stdout.splitlines() if line.startswith("gs://")}
+        return [u in found for u in gcs_urls]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    client = Client()
+
+    def exists(url: str) -> bool:
+        bucket_name, blob_name = split_gcs_url(url)
+        return client.bucket(bucket_name).blob(blob_name).exists()
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(exists, gcs_urls))
+
+
+def public_exists_many(public_urls: list, limit: int = 256,
+                       timeout: float = 30.0) -> Optional[list]:
+    """HEAD public object URLs concurrently on one event loop.
+
+    The bucket is publicly readable, so plain unauthenticated HEADs work.
+    Thousands of probes share one connection pool without a thread per
+    request, which makes checking every file practical. uvloop runs the loop
+    when available. A probe that errors or times out counts as missing.
+    Returns None if aiohttp is not installed.
+    """
+    try:
+        import aiohttp
+    except ImportError:
+        return None
+    import asyncio
+
+    try:
+        from uvloop import run as run_loop
+    except ImportError:
+        run_loop = asyncio.run
+
+    async def check(session, url: str) -> bool:
+        try:
+            async with session.head(url) as r:
+                return r.status == 200
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return False
+
+    async def run() -> list:
+        connector = aiohttp.TCPConnector(limit=limit)
+        # Per-socket limits: time spent queued for a pooled connection does not count
+        client_timeout = aiohttp.ClientTimeout(total=None, sock_connect=timeout, sock_read=timeout)
+        async with aiohttp.ClientSession(connector=connector, timeout=client_timeout) as session:
+            return await asyncio.gather(*(check(session, u) for u in public_urls))
+
+    return run_loop(run())
+
+
+def verify(sample_size: Optional[int] = 50) -> None:
+    """Spot-check that GCS files exist for each version (all files if sample_size is None)."""
     import random
 
     print("\nVerifying GCS uploads...")
@@ -175,16 +401,15 @@ def verify(sample_size: int = 50) -> None:
                 files = list(local_dir.glob("*.jpg"))
                 if not files:
                     continue
-                sample = random.sample(files, min(sample_size, len(files)))
-                ok = 0
-                for f in sample:
-                    gcs_url = f"{GCS_BUCKET}/v/{version}/{tier}/jpeg/{f.name}"
-                    result = subprocess.run(
-                        ["gsutil", "ls", gcs_url],
-                        capture_output=True, text=True
-                    )
-                    if result.returncode == 0:
-                        ok += 1
+                if sample_size is None:
+                    sample = files
+                else:
+                    sample = random.sample(files, min(sample_size, len(files)))
+                rel = [f"v/{version}/{tier}/jpeg/{f.name}" for f in sample]
+                found = public_exists_many([f"{PUBLIC_BASE}/{r}" for r in rel])
+                if found is None:
+                    found = gcs_exists_many([f"{GCS_BUCKET}/{r}" for r in rel])
+                ok = sum(found)
                 print(f"  {version}/{tier}/jpeg: {ok}/{len(sample)} OK")
                 break
 
@@ -203,10 +428,12 @@ def main() -> None:
                         help="Show what would be uploaded")
     parser.add_argument("--verify", action="store_true",
                         help="Spot-check GCS uploads exist")
+    parser.add_argument("--verify-all", action="store_true",
+                        help="Check every local file exists in GCS, not a sample")
     args = parser.parse_args()
 
-    if args.verify:
-        verify()
+    if args.verify or args.verify_all:
+        verify(sample_size=None if args.verify_all else 50)
         return
 
     tiers = args.tiers.split(",") if args.tiers else None